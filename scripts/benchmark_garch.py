@@ -0,0 +1,41 @@
+from spy_volatility.models.garch_models import GARCHModel, garch_walk_forward
+from spy_volatility.utils.config import load_config
+from spy_volatility.data.loaders import load_or_update_spy_prices
+from spy_volatility.data.features import compute_returns
+from arch import arch_model
+import numpy as np
+import time
+
+def time_call(func, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) / repeats
+
+def main() -> None:
+    # Load SPY returns
+    cfg = load_config()
+    prices = load_or_update_spy_prices(cfg, allow_data_update=False)
+    returns = compute_returns(prices, price_col=["SPY_Adj_Close"]).dropna()["SPY_Log_Return"]
+
+    # Warm up numba compilation before timing
+    native = GARCHModel().fit(returns)
+    arch_res = arch_model(100 * returns, mean="Constant", vol="GARCH", p=1, o=0, q=1, dist="t").fit(disp="off")
+
+    print("Parameters (arch vs native):")
+    for name, a, n in zip(GARCHModel.param_names, arch_res.params, native.params_):
+        print(f"  {name:<6} {a: .6f} {n: .6f}")
+    print(f"  loglik {arch_res.loglikelihood: .4f} {native.loglik_: .4f}")
+
+    # Single full-sample fit
+    t_arch = time_call(lambda: arch_model(100 * returns, mean="Constant", vol="GARCH", p=1, o=0, q=1, dist="t").fit(disp="off"), 10)
+    t_native = time_call(lambda: GARCHModel().fit(returns), 10)
+    print(f"Full-sample fit: arch {1e3 * t_arch:.1f} ms, native {1e3 * t_native:.1f} ms ({t_arch / t_native:.1f}x)")
+
+    # Weekly walk-forward refits
+    t_arch = time_call(lambda: garch_walk_forward(returns, refit_every="W", engine="arch"), 1)
+    t_native = time_call(lambda: garch_walk_forward(returns, refit_every="W", engine="native"), 1)
+    print(f"Weekly walk-forward: arch {t_arch:.2f} s, native {t_native:.2f} s ({t_arch / t_native:.1f}x)")
+
+if __name__ == "__main__":
+    main()
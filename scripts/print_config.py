@@ -1,14 +1,7 @@
-from spy_volatility.utils.config import load_config, get_project_root
+import sys
 
-def main() -> None:
-
-    config_name = "default.yaml"
-    cfg = load_config(config_name)
-
-    print("[print_config] Loaded configuration")
-    print(f"Config file: {config_name}")
-    print(f"Start date:  {cfg['data']['start_date']}")
-    print(f"End date:    {cfg['data']['end_date']}")
+from spy_volatility.cli import main
 
+# Same as `spy-vol config`
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(["config", *sys.argv[1:]])
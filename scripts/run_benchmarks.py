@@ -0,0 +1,7 @@
+import sys
+
+from spy_volatility.cli import main
+
+# Same as `spy-vol bench`
+if __name__ == "__main__":
+    main(["bench", *sys.argv[1:]])
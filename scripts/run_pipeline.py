@@ -0,0 +1,7 @@
+import sys
+
+from spy_volatility.cli import main
+
+# Same as `spy-vol report`
+if __name__ == "__main__":
+    main(["report", *sys.argv[1:]])
@@ -13,7 +13,14 @@ setup(
         "matplotlib",
         "seaborn",
         "scipy",
+        "pyarrow",
     ],
+    entry_points={
+        "console_scripts": ["spy-vol=spy_volatility.cli:main"],
+    },
+    extras_require={
+        "fast": ["numba"],  # Compiled GARCHModel likelihood
+    },
     python_requires=">=3.8",
 )
 
@@ -0,0 +1,242 @@
+# src/spy_volatility/benchmarks/harness.py
+
+import datetime as dt
+import json
+import os
+import platform
+import subprocess
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from spy_volatility.data.features import compute_returns
+from spy_volatility.data.sources import SyntheticGARCHSource, synthetic_tickers
+from spy_volatility.utils.config import get_project_root
+from spy_volatility.utils.log import fields, get_logger
+
+log = get_logger(__name__)
+
+@dataclass
+class BenchmarkCase:
+    """
+    One timed hot path.
+
+    setup(years, n_assets) builds the inputs outside the timed region and
+    returns the positional arguments for fn; it runs again before every
+    repeat when fresh_inputs is set (for functions that mutate their input).
+    assets_independent cases only depend on years and run once per years.
+    """
+    name: str
+    fn: Callable[..., Any]
+    setup: Callable[[int, int], Tuple]
+    fresh_inputs: bool = False
+    assets_independent: bool = False
+
+CASES: Dict[str, BenchmarkCase] = {}
+
+def register(
+    name: str,
+    setup: Callable[[int, int], Tuple],
+    fresh_inputs: bool = False,
+    assets_independent: bool = False,
+) -> Callable:
+    """
+    Decorator adding fn to the suite under name.
+    """
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        if name in CASES:
+            raise ValueError(f"Benchmark '{name}' is already registered")
+        CASES[name] = BenchmarkCase(name, fn, setup, fresh_inputs, assets_independent)
+        return fn
+    return decorator
+
+# Synthetic data, memoized per size so cases sharing a size share one simulation
+
+BENCH_ORIGIN = "2000-01-03"
+
+@lru_cache(maxsize=8)
+def synthetic_prices(years: int, n_assets: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Wide OHLCV frame for n_assets synthetic GARCH tickers over `years` of business days.
+    Same (years, n_assets, seed) -> same data in every process.
+    """
+    source = SyntheticGARCHSource(seed=seed, origin=BENCH_ORIGIN)
+    end = pd.Timestamp(BENCH_ORIGIN) + pd.DateOffset(years=years)
+    return source.fetch(synthetic_tickers(n_assets), BENCH_ORIGIN, end)
+
+def synthetic_adj_close(years: int, n_assets: int, seed: int = 0) -> pd.DataFrame:
+    prices = synthetic_prices(years, n_assets, seed)
+    return prices[[c for c in prices.columns if c.endswith("_Adj_Close")]].copy()
+
+@lru_cache(maxsize=8)
+def synthetic_returns(years: int, n_assets: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Log and squared returns (NaN first row dropped) of synthetic_adj_close.
+    """
+    prices = synthetic_adj_close(years, n_assets, seed)
+    return compute_returns(prices, price_col=list(prices.columns)).dropna()
+
+# Timing
+
+def time_case(case: BenchmarkCase, years: int, n_assets: int, repeat: int = 5, min_time: float = 0.2) -> Dict[str, Any]:
+    """
+    Best-of-repeat timing. Each repeat calls fn enough times to run for at
+    least min_time (calibrated on a first call), so microsecond cases are
+    not dominated by timer noise.
+
+    returns:
+      record with keys: case, years, n_assets, repeat, number, min, median, mean (seconds per call)
+    """
+    args = case.setup(years, n_assets)
+    start = time.perf_counter()
+    case.fn(*args)  # Warm-up (numba compilation, caches) and calibration
+    first = time.perf_counter() - start
+    number = 1 if case.fresh_inputs else max(1, int(min_time / max(first, 1e-9)))
+
+    samples = []
+    for _ in range(repeat):
+        if case.fresh_inputs:
+            args = case.setup(years, n_assets)
+        start = time.perf_counter()
+        for _ in range(number):
+            case.fn(*args)
+        samples.append((time.perf_counter() - start) / number)
+
+    samples = np.array(samples)
+    return {
+        "case": case.name,
+        "years": years,
+        "n_assets": 0 if case.assets_independent else n_assets,
+        "repeat": repeat,
+        "number": number,
+        "min": float(samples.min()),
+        "median": float(np.median(samples)),
+        "mean": float(samples.mean()),
+    }
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=get_project_root(), capture_output=True, text=True, timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+def machine_info() -> Dict[str, Any]:
+    """
+    Where a result was measured; timings are only compared within one machine.
+    """
+    return {
+        "machine": f"{platform.node()}-{platform.machine()}-{os.cpu_count()}cpu",
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+    }
+
+def run_suite(
+    years: Iterable[int] = (5, 20),
+    n_assets: Iterable[int] = (10, 50),
+    cases: Optional[Iterable[str]] = None,
+    repeat: int = 5,
+    min_time: float = 0.2,
+) -> List[Dict[str, Any]]:
+    """
+    Time every selected case (default: all registered) on the years x n_assets grid.
+
+    returns:
+      list of records (see time_case) tagged with machine_info, git commit and timestamp
+    """
+    selected = list(CASES) if cases is None else list(cases)
+    unknown = [name for name in selected if name not in CASES]
+    if unknown:
+        raise KeyError(f"Unknown benchmark(s) {unknown}. Available: {sorted(CASES)}")
+
+    run_info = {**machine_info(), "commit": _git_commit(), "timestamp": dt.datetime.now().isoformat(timespec="seconds")}
+    records = []
+    for name in selected:
+        case = CASES[name]
+        for t in years:
+            sizes = [min(n_assets)] if case.assets_independent else list(n_assets)
+            for n in sizes:
+                record = {**time_case(case, t, n, repeat=repeat, min_time=min_time), **run_info}
+                log.info(
+                    "Timed %s", name,
+                    extra=fields(years=t, n_assets=record["n_assets"], min_ms=round(1e3 * record["min"], 3)),
+                )
+                records.append(record)
+    return records
+
+# History and regression checks
+
+def default_history_path() -> Path:
+    return get_project_root() / "data" / "benchmarks" / "history.jsonl"
+
+def append_history(records: Sequence[Dict[str, Any]], path: Optional[Path] = None) -> Path:
+    """
+    Append records to a JSON-lines history file (one record per line).
+    """
+    path = Path(path) if path is not None else default_history_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        for record in records:
+            f.write(json.dumps(record, sort_keys=True) + "\n")
+    return path
+
+def load_history(path: Optional[Path] = None) -> pd.DataFrame:
+    """
+    History as a DataFrame (one row per record); empty if there is none yet.
+    """
+    path = Path(path) if path is not None else default_history_path()
+    if not path.exists():
+        return pd.DataFrame()
+    with open(path, "r") as f:
+        return pd.DataFrame([json.loads(line) for line in f if line.strip()])
+
+def find_regressions(
+    records: Sequence[Dict[str, Any]],
+    history: pd.DataFrame,
+    tolerance: float = 0.25,
+    baseline_runs: int = 5,
+) -> List[Dict[str, Any]]:
+    """
+    Compare new records against the history of the same case, size and machine.
+
+    The baseline is the median of the best-of-repeat times of the last
+    baseline_runs matching history entries; a record regresses when it is
+    more than tolerance (fraction) slower.
+
+    returns:
+      list of dicts with keys: case, years, n_assets, baseline, current, ratio
+    """
+    if history.empty:
+        return []
+
+    keys = ["case", "years", "n_assets", "machine"]
+    regressions = []
+    for record in records:
+        match = np.ones(len(history), dtype=bool)
+        for key in keys:
+            match &= (history[key] == record[key]).to_numpy()
+        past = history.loc[match, "min"].tail(baseline_runs)
+        if past.empty:
+            continue
+
+        baseline = float(past.median())
+        ratio = record["min"] / baseline
+        if ratio > 1.0 + tolerance:
+            regressions.append({
+                "case": record["case"],
+                "years": record["years"],
+                "n_assets": record["n_assets"],
+                "baseline": baseline,
+                "current": record["min"],
+                "ratio": ratio,
+            })
+    return regressions
@@ -0,0 +1,160 @@
+# src/spy_volatility/benchmarks/suite.py
+
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from spy_volatility.benchmarks.harness import register, synthetic_adj_close, synthetic_returns
+from spy_volatility.data.features import (
+    compute_realized_volatility,
+    compute_realized_volatility_panel,
+    compute_returns,
+)
+from spy_volatility.models.dcc import fit_dcc_garch
+from spy_volatility.models.garch_models import GARCHModel, fit_garch_11, garch_walk_forward
+from spy_volatility.models.var import backtest_var, fit_var, fit_var_1, rolling_var_rls, select_var_order
+from spy_volatility.risk.cov_metrics import (
+    covariance_diagnostics,
+    covariance_diagnostics_stack,
+    ewma_covariance,
+    rolling_covariance_stack,
+    rolling_sample_covariance,
+    rolling_shrinkage_covariance,
+)
+from spy_volatility.risk.spd import (
+    add_jitter,
+    add_jitter_stack,
+    clip_eigenvalues,
+    clip_eigenvalues_stack,
+    regularize_stack,
+)
+
+# Hot paths of the nightly report, each timed on synthetic data of
+# `years` x `n_assets` (see harness.run_suite). Inputs mirror how the
+# report calls them: 63-day windows, lam = eps = 1e-6, monthly GARCH refits.
+
+WINDOW = 63
+
+@lru_cache(maxsize=4)
+def _rolling_stack(years: int, n_assets: int) -> np.ndarray:
+    return rolling_covariance_stack(synthetic_returns(years, n_assets), WINDOW)[0]
+
+def _sample_cov(years: int, n_assets: int) -> pd.DataFrame:
+    returns = synthetic_returns(years, n_assets)
+    return returns[[c for c in returns.columns if c.endswith("_Log_Return")]].cov()
+
+def _spy_like(years: int, n_assets: int) -> pd.DataFrame:
+    # Single-asset cases: log and squared return of one ticker
+    return synthetic_returns(years, 1)
+
+def _log_return(years: int, n_assets: int):
+    returns = _spy_like(years, n_assets)
+    return (returns[[c for c in returns.columns if c.endswith("_Log_Return")][0]],)
+
+def _returns(years: int, n_assets: int):
+    return (synthetic_returns(years, n_assets),)
+
+def _stack(years: int, n_assets: int):
+    return (_rolling_stack(years, n_assets),)
+
+def _cov(years: int, n_assets: int):
+    return (_sample_cov(years, n_assets),)
+
+# Data / features
+
+@register("compute_returns", setup=lambda t, n: (synthetic_adj_close(t, n),), fresh_inputs=True)
+def bench_compute_returns(prices):
+    return compute_returns(prices, price_col=list(prices.columns))
+
+@register("compute_realized_volatility", setup=lambda t, n: (_spy_like(t, n),), assets_independent=True)
+def bench_realized_volatility(returns):
+    return compute_realized_volatility(returns, window=21)
+
+@register("realized_volatility_panel", setup=_returns)
+def bench_realized_volatility_panel(returns):
+    return compute_realized_volatility_panel(returns, windows=[5, 21, 63, 252])
+
+# Covariance
+
+@register("rolling_sample_covariance", setup=_returns)
+def bench_rolling_sample_covariance(returns):
+    return rolling_sample_covariance(returns, window=WINDOW)
+
+@register("rolling_ledoit_wolf", setup=_returns)
+def bench_rolling_ledoit_wolf(returns):
+    return rolling_shrinkage_covariance(returns, window=WINDOW, method="ledoit_wolf")
+
+@register("ewma_covariance", setup=_returns)
+def bench_ewma_covariance(returns):
+    # Three half-lives in one pass
+    return ewma_covariance(returns, halflives=[10, 21, 63])
+
+@register("covariance_diagnostics", setup=_cov)
+def bench_covariance_diagnostics(cov):
+    return covariance_diagnostics(cov)
+
+@register("covariance_diagnostics_stack", setup=_stack)
+def bench_covariance_diagnostics_stack(stack):
+    return covariance_diagnostics_stack(stack)
+
+@register("add_jitter", setup=_cov)
+def bench_add_jitter(cov):
+    return add_jitter(cov, lam=1e-6)
+
+@register("clip_eigenvalues", setup=_cov)
+def bench_clip_eigenvalues(cov):
+    return clip_eigenvalues(cov, eps=1e-6)
+
+@register("add_jitter_stack", setup=_stack)
+def bench_add_jitter_stack(stack):
+    return add_jitter_stack(stack, lam=1e-6)
+
+@register("clip_eigenvalues_stack", setup=_stack)
+def bench_clip_eigenvalues_stack(stack):
+    return clip_eigenvalues_stack(stack, eps=1e-6)
+
+@register("regularize_stack", setup=_stack)
+def bench_regularize_stack(stack):
+    return regularize_stack(stack, lam=1e-6, eps=1e-6)
+
+# Models
+
+@register("fit_garch_11", setup=_log_return, assets_independent=True)
+def bench_fit_garch_11(log_returns):
+    return fit_garch_11(log_returns)
+
+@register("garch_native_fit", setup=_log_return, assets_independent=True)
+def bench_garch_native_fit(log_returns):
+    return GARCHModel().fit(log_returns)
+
+@register("fit_dcc_garch", setup=_returns)
+def bench_fit_dcc_garch(returns):
+    # Serial GARCH fits so the timing does not depend on the core count
+    return fit_dcc_garch(returns, n_jobs=1)
+
+@register("fit_var_1", setup=_returns)
+def bench_fit_var_1(returns):
+    # statsmodels reference for fit_var
+    return fit_var_1(returns)
+
+@register("fit_var", setup=_returns)
+def bench_fit_var(returns):
+    return fit_var(returns, p=1)
+
+@register("select_var_order", setup=_returns)
+def bench_select_var_order(returns):
+    # Up to 5 lags, fewer when the widest design would not leave 2 rows per regressor
+    n_assets = sum(c.endswith("_Log_Return") for c in returns.columns)
+    return select_var_order(returns, maxlags=max(1, min(5, len(returns) // (2 * n_assets))))
+
+@register("rolling_var_rls", setup=_returns)
+def bench_rolling_var_rls(returns):
+    # Daily VAR(1) re-estimates over a 63-day window
+    return rolling_var_rls(returns, window=WINDOW)
+
+@register("walkforward_var_backtest", setup=_log_return, assets_independent=True)
+def bench_walkforward_var_backtest(log_returns):
+    # Monthly native GARCH refits, then the VaR backtest on their forecasts
+    forecast = garch_walk_forward(log_returns, refit_every="M", annualization=1, engine="native")["forecast"]
+    return backtest_var(log_returns, sigma_panel=forecast.to_frame("garch"), dists={"gauss": None, "t": 8})
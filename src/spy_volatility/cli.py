@@ -0,0 +1,181 @@
+# src/spy_volatility/cli.py
+
+import argparse
+import sys
+from typing import Any, Dict, List, Optional
+
+# Only the standard library is imported at module level: every subcommand
+# imports what it needs when it runs, so `spy-vol config` or `spy-vol --help`
+# never pay for pandas, matplotlib, arch or statsmodels.
+
+# Figure subcommands: name -> (report pipeline figure stage, help)
+FIGURE_COMMANDS = {
+    "returns": ("fig_returns_and_rv", "SPY log returns and 21-day realized volatility"),
+    "garch": ("fig_garch_vs_rv", "full-sample GARCH(1,1) vs RV(21)"),
+    "covariance": ("fig_covariance_fragility", "rolling 63-day covariance diagnostics"),
+    "var": ("fig_rolling_vs_var", "VAR(1) innovation vs rolling sample covariance"),
+    "regularize": ("fig_regularized", "jittered / clipped rolling covariance conditioning"),
+    "regimes": ("fig_vol_regimes", "high-vol regimes vs RC21 conditioning"),
+    "backtest": ("fig_var_backtest", "walk-forward GARCH VaR backtest"),
+}
+
+def _print_config(args: argparse.Namespace) -> None:
+    from spy_volatility.utils.config import load_config
+
+    cfg = load_config(args.config)
+
+    print("[print_config] Loaded configuration")
+    print(f"Config file: {args.config}")
+    print(f"Start date:  {cfg['data']['start_date']}")
+    print(f"End date:    {cfg['data']['end_date']}")
+
+def _show_prices(args: argparse.Namespace) -> None:
+    from spy_volatility.data.loaders import load_or_update_spy_prices
+    from spy_volatility.utils.config import load_config
+
+    spy = load_or_update_spy_prices(load_config(args.config), allow_data_update=args.update)
+    print(spy.tail(args.rows))
+
+def _print_var_diagnostics(artifacts: Dict[str, Any]) -> None:
+    import pandas as pd
+
+    from spy_volatility.risk.spd import try_cholesky
+
+    innov_diagnostic = artifacts["var_innovation_diagnostics"]
+    cov = pd.DataFrame(artifacts["var_fit"]["innovation_cov"])
+    print(
+        f"VAR Innovative Covariance Diagnostics: \n"
+        f"Min Eigenvalue: {innov_diagnostic['min_eigenvalue']} \n"
+        f"Max Eigenvalue: {innov_diagnostic['max_eigenvalue']} \n"
+        f"Condition Number: {innov_diagnostic['condition_number']}"
+        )
+    print(f"Can apply Chelosky?: {try_cholesky(cov)}")
+
+def _run_report(args: argparse.Namespace, figure_stages: Optional[List[str]] = None) -> Dict[str, Any]:
+    from spy_volatility.pipeline.report import build_report_pipeline
+    from spy_volatility.utils.config import load_config
+    from spy_volatility.utils.profiling import configure_profiling, write_profile
+
+    pipe = build_report_pipeline(
+        allow_data_update=args.update,
+        figure_stages=figure_stages,
+        render_processes=args.render_processes,
+        force_render=args.force_render,
+    )
+    targets = getattr(args, "targets", None) or ["report"]
+
+    if getattr(args, "list", False):
+        for name in pipe.order(targets):
+            deps = ", ".join(pipe.stages[name].deps)
+            print(f"{name:<28} <- {deps}" if deps else name)
+        return {}
+
+    cfg = load_config()
+    configure_profiling(cfg)  # profiling section of configs/default.yaml
+    artifacts = pipe.run(targets=targets, max_workers=args.workers)
+    write_profile(cfg)
+    for path in artifacts.get("report", []):
+        print(f"[spy-vol] Saved figure: {path}")
+
+    if figure_stages is None:
+        slowest = sorted(pipe.timings.items(), key=lambda kv: kv[1], reverse=True)[:5]
+        print("[spy-vol] Slowest stages: " + ", ".join(f"{n} {t:.2f}s" for n, t in slowest))
+    return artifacts
+
+def _run_figure(args: argparse.Namespace) -> None:
+    artifacts = _run_report(args, figure_stages=[FIGURE_COMMANDS[args.command][0]])
+    if args.command == "var":
+        _print_var_diagnostics(artifacts)
+
+def _run_benchmarks(args: argparse.Namespace) -> None:
+    import spy_volatility.benchmarks.suite  # noqa: F401  (registers the cases)
+    from spy_volatility.benchmarks.harness import (
+        CASES,
+        append_history,
+        default_history_path,
+        find_regressions,
+        load_history,
+        run_suite,
+    )
+
+    if args.list:
+        print("\n".join(CASES))
+        return
+
+    cases = [name for name in CASES if any(f in name for f in args.filter)] if args.filter else None
+    history_path = args.history or default_history_path()
+    history = load_history(history_path)
+
+    records = run_suite(years=args.years, n_assets=args.assets, cases=cases, repeat=args.repeat)
+    regressions = find_regressions(records, history, tolerance=args.tolerance)
+    if not args.no_save:
+        print(f"[spy-vol] Appended {len(records)} results to {append_history(records, history_path)}")
+
+    for r in regressions:
+        print(
+            f"[spy-vol] REGRESSION {r['case']} T={r['years']}y N={r['n_assets']}: "
+            f"{1e3 * r['current']:.3f} ms vs {1e3 * r['baseline']:.3f} ms baseline ({r['ratio']:.2f}x)"
+        )
+    if regressions and args.check:
+        sys.exit(1)
+
+def _add_pipeline_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--workers", type=int, default=4, help="threads for independent stages")
+    parser.add_argument("--update", action="store_true", help="download new prices before running")
+    parser.add_argument("--render-processes", type=int, default=None, help="processes for figure rendering (0: in-process)")
+    parser.add_argument("--force-render", action="store_true", help="redraw figures even if their data is unchanged")
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="spy-vol", description="SPY volatility and covariance risk pipeline.")
+    parser.add_argument("-q", "--quiet", action="store_true", default=None, help="only log warnings and errors")
+    parser.add_argument("--log-level", default=None, help="DEBUG, INFO, WARNING, ... (default: logging.level in the config)")
+    parser.add_argument("--log-format", choices=["text", "json"], default=None, help="log line format (default: logging.format in the config)")
+    commands = parser.add_subparsers(dest="command", metavar="command", required=True)
+
+    config = commands.add_parser("config", help="print the loaded configuration")
+    config.add_argument("--config", default="default.yaml", help="config file under configs/")
+    config.set_defaults(handler=_print_config)
+
+    prices = commands.add_parser("prices", help="load (and optionally update) SPY prices and show the last rows")
+    prices.add_argument("--config", default="default.yaml", help="config file under configs/")
+    prices.add_argument("--update", action="store_true", help="download new prices first")
+    prices.add_argument("--rows", type=int, default=5, help="rows to show")
+    prices.set_defaults(handler=_show_prices)
+
+    report = commands.add_parser("report", help="run the nightly report pipeline (all figures by default)")
+    report.add_argument("targets", nargs="*", help="stages to build (default: the full report)")
+    report.add_argument("--list", action="store_true", help="print the stages in execution order and exit")
+    _add_pipeline_options(report)
+    report.set_defaults(handler=_run_report)
+
+    bench = commands.add_parser("bench", help="time the library's hot paths on synthetic data")
+    bench.add_argument("filter", nargs="*", help="only cases whose name contains one of these")
+    bench.add_argument("--years", type=int, nargs="+", default=[5, 20], help="sample lengths T in years")
+    bench.add_argument("--assets", type=int, nargs="+", default=[10, 50], help="universe sizes N")
+    bench.add_argument("--repeat", type=int, default=5, help="timed repeats (best one is kept)")
+    bench.add_argument("--history", default=None, help="JSON-lines history (default: data/benchmarks/history.jsonl)")
+    bench.add_argument("--tolerance", type=float, default=0.25, help="slowdown vs history that counts as a regression")
+    bench.add_argument("--check", action="store_true", help="exit with status 1 on any regression")
+    bench.add_argument("--no-save", action="store_true", help="do not append results to the history")
+    bench.add_argument("--list", action="store_true", help="list the cases and exit")
+    bench.set_defaults(handler=_run_benchmarks)
+
+    for name, (_, help_text) in FIGURE_COMMANDS.items():
+        figure = commands.add_parser(name, help=help_text)
+        _add_pipeline_options(figure)
+        figure.set_defaults(handler=_run_figure)
+
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = build_parser().parse_args(sys.argv[1:] if argv is None else argv)
+
+    from spy_volatility.utils.config import load_config
+    from spy_volatility.utils.log import configure_logging_from_config
+
+    # Log records go to stderr; command output (tables, saved paths) stays on stdout
+    configure_logging_from_config(load_config(), level=args.log_level, quiet=args.quiet, fmt=args.log_format)
+    args.handler(args)
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,11 @@
+from abc import ABC, abstractmethod
+
 import pandas as pd
 import numpy as np
 
+from spy_volatility.utils.profiling import profiled
+
+@profiled()
 def compute_returns(
     prices: pd.DataFrame,
     price_col: list = ["SPY_Adj_Close"],
@@ -8,23 +13,21 @@ def compute_returns(
 
     if isinstance(price_col, str):
         price_col = [price_col]
+    price_col = list(price_col)
     # Find stock name
-    for c in price_col:
-        ticker = c.split("_")[0]
+    tickers = [c.split("_")[0] for c in price_col]
 
-        # Compute log return and squared return
-        log_adj_close = np.log(prices[c])
-        prices[ticker + "_Log_Return"] = log_adj_close.diff()
-        prices[ticker + "_Squared_Return"] = log_adj_close.diff() ** 2
+    # Compute log return and squared return for all columns at once
+    log_prices = np.log(prices[price_col].to_numpy(dtype=float))
+    log_return = np.full_like(log_prices, np.nan)
+    log_return[1:] = log_prices[1:] - log_prices[:-1]
+
+    prices[[t + "_Log_Return" for t in tickers]] = log_return
+    prices[[t + "_Squared_Return" for t in tickers]] = log_return ** 2
     prices = prices.sort_index(axis=1)
     return prices
 
-def compute_realized_volatility(
-    returns: pd.DataFrame,
-    window: int = 21,
-    annualization: int = 252,
-) -> pd.Series:
-
+def _squared_return_column(returns: pd.DataFrame) -> str:
     # Find stock name
     ticker = returns.columns[-1].split("_")[0]
 
@@ -39,7 +42,314 @@ def compute_realized_volatility(
             f"Required column '{ticker + "_Squared_Return"}' not found. "
             f"Available columns: {list(returns.columns)}"
         )
+    return ticker + "_Squared_Return"
+
+def _cumulative_sums(x: np.ndarray):
+    """
+    Cumulative sums of x (NaN counted as 0) and cumulative NaN counts, along axis 0.
+    """
+    missing = np.isnan(x)
+    return np.cumsum(np.where(missing, 0.0, x), axis=0), np.cumsum(missing, axis=0)
+
+def _window_sums(csum: np.ndarray, nan_count: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing window sums from the output of _cumulative_sums.
+
+    NaN where the window is not full yet or contains a NaN, like
+    rolling(window).sum(). OnlineRealizedVolatility repeats exactly these
+    float operations, so both give identical bits.
+    """
+    out = csum.copy()
+    out[window:] = csum[window:] - csum[:-window]
+    bad = nan_count.copy()
+    bad[window:] = nan_count[window:] - nan_count[:-window]
+    out[bad > 0] = np.nan
+    out[:window - 1] = np.nan
+    return out
+
+def _rolling_window_sum(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing window sums of a (T,) or (T, N) array from one cumulative sum.
+    """
+    return _window_sums(*_cumulative_sums(x), window)
+
+@profiled()
+def compute_realized_volatility(
+    returns: pd.DataFrame,
+    window: int = 21,
+    annualization: int = 252,
+) -> pd.Series:
+
+    column = _squared_return_column(returns)
+    squared = returns[column]
+
+    # Rolling mean as a cumulative-sum difference: O(T) for any window
+    window_sum = _rolling_window_sum(squared.to_numpy(dtype=float), window)
+    vol = np.sqrt(annualization * (window_sum / window))
+
+    return pd.Series(vol, index=squared.index, name=column)
+
+@profiled()
+def compute_ewma_volatility(
+    returns: pd.DataFrame,
+    lam: float = 0.94,
+    annualization: int = 252,
+) -> pd.Series:
+    """
+    RiskMetrics EWMA volatility, sigma2_t = lam * sigma2_{t-1} + (1 - lam) * r_t**2.
+
+    Started at the first squared return; missing returns leave the variance
+    unchanged. Same values as OnlineEWMAVariance fed one row at a time.
+    """
+    column = _squared_return_column(returns)
+    squared = returns[column].to_numpy(dtype=float)
+
+    estimator = OnlineEWMAVariance(lam=lam, annualization=annualization)
+    vol = estimator.update_many(squared[:, None])[:, 0]
+    return pd.Series(vol, index=returns.index, name=column)
+
+
+_RANGE_ESTIMATORS = ("parkinson", "garman_klass")
+RV_ESTIMATORS = ("close", "ewma") + _RANGE_ESTIMATORS
+
+def _tickers_with(data: pd.DataFrame, suffixes: list) -> list:
+    """
+    Tickers (column prefixes) that have a column for every suffix, in column order.
+    """
+    tickers = []
+    for c in data.columns:
+        ticker = c.split("_")[0]
+        if ticker not in tickers and all(ticker + s in data.columns for s in suffixes):
+            tickers.append(ticker)
+    return tickers
+
+def _daily_variance(data: pd.DataFrame, tickers: list, estimator: str) -> np.ndarray:
+    """
+    (T, assets) per-day variance proxies for one estimator.
+
+    close / ewma: squared close-to-close log return
+    parkinson: (ln H/L)**2 / (4 ln 2)
+    garman_klass: 0.5 (ln H/L)**2 - (2 ln 2 - 1) (ln C/O)**2
+    """
+    if estimator in ("close", "ewma"):
+        squared = [t + "_Squared_Return" for t in tickers]
+        if all(c in data.columns for c in squared):
+            return data[squared].to_numpy(dtype=float)
+        return data[[t + "_Log_Return" for t in tickers]].to_numpy(dtype=float) ** 2
+
+    def field(name):
+        return data[[f"{t}_{name}" for t in tickers]].to_numpy(dtype=float)
+
+    high_low = np.log(field("High") / field("Low")) ** 2
+    if estimator == "parkinson":
+        return high_low / (4.0 * np.log(2.0))
+    close_open = np.log(field("Close") / field("Open")) ** 2
+    return 0.5 * high_low - (2.0 * np.log(2.0) - 1.0) * close_open
+
+@profiled()
+def compute_realized_volatility_panel(
+    data: pd.DataFrame,
+    windows: list = [5, 21, 63, 252],
+    annualization: int = 252,
+    estimator: str = "close",
+    tickers: list = None,
+) -> pd.DataFrame:
+    """
+    Realized volatility for every asset and every window in one pass.
+
+    Parameters:
+      data: frame from compute_returns (uses {T}_Log_Return / {T}_Squared_Return)
+            or, for the range estimators, prices with {T}_Open/High/Low/Close
+            columns as downloaded by the loaders (compute_returns keeps them,
+            so one frame serves all estimators)
+      windows: trailing windows in days
+      estimator: "close" (close-to-close, same values as compute_realized_volatility),
+            "ewma" (EWMA variance of squared returns, lam = 1 - 2 / (window + 1)),
+            "parkinson" or "garman_klass"
+      tickers: restrict to these tickers (default: every ticker with the needed columns)
+
+    For the windowed estimators a single cumulative sum over all assets is
+    taken and each window is a shifted difference of it; annualization and
+    the square root are applied once to the whole (T, assets, windows) block.
+
+    returns: DataFrame with (ticker, window) MultiIndex columns, ticker-major,
+    so .to_numpy().reshape(T, n_assets, n_windows) is the panel.
+    """
+    if estimator not in RV_ESTIMATORS:
+        raise ValueError(f"Unknown estimator '{estimator}', expected one of {list(RV_ESTIMATORS)}")
+
+    needed = {
+        "close": ["_Log_Return"],
+        "ewma": ["_Log_Return"],
+        "parkinson": ["_High", "_Low"],
+        "garman_klass": ["_Open", "_High", "_Low", "_Close"],
+    }[estimator]
+    available = _tickers_with(data, needed)
+    if tickers is None:
+        tickers = available
+    missing = [t for t in tickers if t not in available]
+    if missing or not tickers:
+        raise KeyError(
+            f"Columns {needed} not found for {missing or 'any ticker'}. "
+            f"Available columns: {list(data.columns)}"
+        )
+
+    windows = list(windows)
+    x = _daily_variance(data, tickers, estimator)
+    variance = np.empty(x.shape + (len(windows),))
+
+    if estimator == "ewma":
+        # One recursion over all (asset, window) pairs at once
+        lam = np.array([1.0 - 2.0 / (w + 1.0) for w in windows])
+        rows = np.repeat(x, len(windows), axis=1)
+        ewma = OnlineEWMAVariance(lam=np.tile(lam, len(tickers)), annualization=1, n_assets=rows.shape[1])
+        for t, row in enumerate(rows):
+            ewma.update(row)
+            variance[t] = np.where(np.isnan(row), np.nan, ewma.sigma2).reshape(variance.shape[1:])
+    else:
+        csum, nan_count = _cumulative_sums(x)
+        for k, window in enumerate(windows):
+            variance[:, :, k] = _window_sums(csum, nan_count, window) / window
+
+    vol = np.sqrt(annualization * variance)
+    columns = pd.MultiIndex.from_product([tickers, windows], names=["ticker", "window"])
+    return pd.DataFrame(vol.reshape(len(x), -1), index=data.index, columns=columns)
+
+
+class OnlineEstimator(ABC):
+    """
+    Base class for streaming estimators that take one row (one value per asset) per update.
+
+    Subclasses list the attributes making up their state in _state_fields;
+    state_dict() / from_state() checkpoint and restore them, e.g. with
+    np.savez(path, **est.state_dict()) and Cls.from_state(np.load(path)).
+    """
+    _state_fields: tuple = ()
+
+    @abstractmethod
+    def update(self, x) -> np.ndarray:
+        """
+        Feed one row (one value per asset). Returns the output for that row.
+        """
+
+    def update_many(self, rows) -> np.ndarray:
+        """
+        Feed a (T, N) block row by row. Returns the (T, N) outputs.
+        """
+        rows = np.asarray(rows, dtype=float)
+        return np.array([self.update(row) for row in rows]).reshape(rows.shape)
+
+    def state_dict(self) -> dict:
+        return {f: np.array(getattr(self, f), copy=True) for f in self._state_fields}
+
+    @classmethod
+    def from_state(cls, state) -> "OnlineEstimator":
+        obj = cls.__new__(cls)
+        for f in cls._state_fields:
+            value = np.array(state[f], copy=True)
+            setattr(obj, f, value if value.ndim else value.item())
+        return obj
+
+class OnlineLogReturn(OnlineEstimator):
+    """
+    Log returns from a stream of prices, matching compute_returns.
+
+    The first update returns NaN (no previous price), as diff() does.
+    """
+    _state_fields = ("last_log_price",)
+
+    def __init__(self, n_assets: int = 1):
+        self.last_log_price = np.full(n_assets, np.nan)
+
+    def update(self, prices) -> np.ndarray:
+        log_price = np.log(np.asarray(prices, dtype=float).reshape(self.last_log_price.shape))
+        log_return = log_price - self.last_log_price
+        self.last_log_price = log_price
+        return log_return
+
+class OnlineRealizedVolatility(OnlineEstimator):
+    """
+    Rolling realized volatility sqrt(annualization * mean(r**2 over window)), O(1) per update.
+
+    Takes squared returns. Keeps the running cumulative sum and a ring buffer
+    of its last `window` values, matching compute_realized_volatility bit for bit.
+    """
+    _state_fields = ("window", "annualization", "csum", "nan_count", "ring_csum", "ring_nan", "pos", "n_obs")
+
+    def __init__(self, window: int = 21, annualization: int = 252, n_assets: int = 1):
+        self.window = window
+        self.annualization = annualization
+        self.csum = np.zeros(n_assets)
+        self.nan_count = np.zeros(n_assets, dtype=np.int64)
+        self.ring_csum = np.zeros((window, n_assets))
+        self.ring_nan = np.zeros((window, n_assets), dtype=np.int64)
+        self.pos = 0
+        self.n_obs = 0
+
+    def update(self, squared_return) -> np.ndarray:
+        x = np.asarray(squared_return, dtype=float).reshape(self.csum.shape)
+        missing = np.isnan(x)
+        self.csum = self.csum + np.where(missing, 0.0, x)
+        self.nan_count = self.nan_count + missing
+
+        # ring[pos] holds the cumulative sums from `window` updates ago
+        window_sum = self.csum - self.ring_csum[self.pos]
+        window_nan = self.nan_count - self.ring_nan[self.pos]
+        self.ring_csum[self.pos] = self.csum
+        self.ring_nan[self.pos] = self.nan_count
+        self.pos = (self.pos + 1) % self.window
+        self.n_obs += 1
+
+        window_sum[window_nan > 0] = np.nan
+        if self.n_obs < self.window:
+            window_sum[:] = np.nan
+        return np.sqrt(self.annualization * (window_sum / self.window))
+
+class OnlineEWMAVariance(OnlineEstimator):
+    """
+    RiskMetrics EWMA volatility, same recursion as compute_ewma_volatility.
+
+    Takes squared returns and returns sqrt(annualization * sigma2).
+    """
+    _state_fields = ("lam", "annualization", "sigma2")
+
+    def __init__(self, lam: float = 0.94, annualization: int = 252, n_assets: int = 1):
+        self.lam = lam
+        self.annualization = annualization
+        self.sigma2 = np.full(n_assets, np.nan)
+
+    def update(self, squared_return) -> np.ndarray:
+        x = np.asarray(squared_return, dtype=float).reshape(self.sigma2.shape)
+        missing = np.isnan(x)
+        updated = self.lam * self.sigma2 + (1.0 - self.lam) * x
+        # Start at the first observation, hold the variance through missing returns
+        updated = np.where(np.isnan(self.sigma2), x, updated)
+        self.sigma2 = np.where(missing, self.sigma2, updated)
+
+        out = np.sqrt(self.annualization * self.sigma2)
+        out[missing] = np.nan
+        return out
+
+class OnlineGARCHFilter(OnlineEstimator):
+    """
+    GARCH(1,1) variance filter with fixed parameters, one step per update.
+
+    sigma2 is the variance forecast for the next return. Each update applies
+        sigma2 = omega + alpha * (r - mu)**2 + beta * sigma2
+    and returns the new forecast, the same values as
+    garch_models._garch11_recursion. Parameters and returns must be in the
+    same units (e.g. percent returns for arch fits with scale=100).
+    """
+    _state_fields = ("omega", "alpha", "beta", "mu", "sigma2")
 
-    vol = np.sqrt(annualization * returns[ticker + "_Squared_Return"].rolling(window).mean())
+    def __init__(self, omega, alpha, beta, sigma2, mu=0.0):
+        self.omega = np.asarray(omega, dtype=float)
+        self.alpha = np.asarray(alpha, dtype=float)
+        self.beta = np.asarray(beta, dtype=float)
+        self.mu = np.asarray(mu, dtype=float)
+        self.sigma2 = np.array(sigma2, dtype=float, ndmin=1)
 
-    return vol
+    def update(self, returns) -> np.ndarray:
+        resid = np.asarray(returns, dtype=float).reshape(self.sigma2.shape) - self.mu
+        self.sigma2 = self.omega + self.alpha * resid ** 2 + self.beta * self.sigma2
+        return self.sigma2.copy()
@@ -1,22 +1,21 @@
 # src/spy_volatility/data/loaders.py
 
 import datetime as dt
+import logging
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
-import yfinance as yf
-
+from spy_volatility.data.sources import PriceSource, Tickers, _as_list, resolve_source
 from spy_volatility.utils.config import get_project_root
+from spy_volatility.utils.log import fields, get_logger, log_timing
+from spy_volatility.utils.profiling import profiled
 
-def _flatten_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Flatten yfinance multi-index columns.
-    """
-    df.columns = ['_'.join(c.replace(" ", "_") for c in col) 
-        if isinstance(col, tuple) else col.replace(" ", "_") 
-        for col in df.columns] # Flatten multi-index: join levels with underscore
-    return df
+log = get_logger(__name__)
 
 def _filter_columns_by_suffix(df: pd.DataFrame, suffix: str) -> pd.DataFrame:
     """
@@ -28,39 +27,225 @@ def _filter_columns_by_suffix(df: pd.DataFrame, suffix: str) -> pd.DataFrame:
     df = df.loc[:, mask]
     return df
 
-def _resolve_spy_prices_path(cfg: Dict[str, Any]) -> Path:
+class PriceStore(ABC):
     """
-    Use the config to compute the full path to the SPY prices CSV.
+    On-disk storage backend for a wide price frame indexed by date.
 
-    If cfg["data"]["spy_prices_file"] == "data/spy/spy_prices.csv"
-    and project_root is spy-volatility-clustering-and-garch,
-    the full path is spy-volatility-clustering-and-garch/data/spy/spy_prices.csv
+    Subclasses implement columns, read, write and append.
+    """
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    @abstractmethod
+    def columns(self) -> List[str]:
+        """
+        Stored column names, without loading any rows.
+        """
+
+    @abstractmethod
+    def read(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Load the stored prices sorted by date, optionally only the given columns.
+        """
+
+    @abstractmethod
+    def write(self, df: pd.DataFrame) -> None:
+        """
+        Replace everything in the store with df.
+        """
+
+    @abstractmethod
+    def append(self, df: pd.DataFrame) -> None:
+        """
+        Add new rows. Rows for dates already stored replace the old values.
+        """
+
+    def read_suffix(self, suffix: str) -> pd.DataFrame:
+        """
+        Load only the columns ending with suffix (e.g. "_Adj_Close").
+        """
+        columns = [c for c in self.columns() if c.endswith(suffix)]
+        assert columns, "No suffix columns found — check auto_adjust or data source"
+        return self.read(columns=columns)
+
+class CSVStore(PriceStore):
     """
-    project_root = get_project_root()
-    rel_path = cfg["data"]["spy_prices_file"]
-    full_path = project_root / rel_path
-    full_path.parent.mkdir(parents=True, exist_ok=True)
-    return full_path
+    Single CSV file. Appending rewrites the whole file.
+    """
+    def columns(self) -> List[str]:
+        return list(pd.read_csv(self.path, index_col=0, nrows=0).columns)
+
+    @profiled()
+    def read(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        usecols = None if columns is None else [0] + [self.columns().index(c) + 1 for c in columns]
+        df = pd.read_csv(self.path, parse_dates=[0], index_col=0, usecols=usecols)
+        return df.sort_index()
+
+    @profiled()
+    def write(self, df: pd.DataFrame) -> None:
+        df.to_csv(self.path)
 
-def _resolve_prices_path(cfg: Dict[str, Any]) -> Path:
+    @profiled()
+    def append(self, df: pd.DataFrame) -> None:
+        old = self.read() if self.exists() else None
+        self.write(_merge_prices(old, df))
+
+class ParquetStore(PriceStore):
     """
-    Use the config to compute the full path to the SPY prices CSV.
+    Directory of zstd-compressed Parquet partitions (part-00000.parquet, ...).
 
-    If cfg["data"]["spy_prices_file"] == "data/spy/spy_prices.csv"
-    and project_root is spy-volatility-clustering-and-garch,
-    the full path is spy-volatility-clustering-and-garch/data/spy/spy_prices.csv
+    Each append writes one new partition instead of rewriting history, and
+    reads project columns so only the requested ones are decoded. Partitions
+    are read in order and later rows win for duplicate dates. Once an append
+    leaves more than max_parts partitions they are compacted into one, so
+    reads never merge more than max_parts files.
+    """
+    def __init__(self, path: Path, max_parts: int = 8):
+        super().__init__(path)
+        self.max_parts = max_parts
+
+    def _parts(self) -> List[Path]:
+        return sorted(self.path.glob("part-*.parquet"))
+
+    def exists(self) -> bool:
+        return self.path.is_dir() and len(self._parts()) > 0
+
+    def columns(self) -> List[str]:
+        import pyarrow.parquet as pq
+
+        columns = []
+        for part in self._parts():
+            for name in pq.read_schema(part).names:
+                if name not in columns and not name.startswith("__index_level"):
+                    columns.append(name)
+        index_name = self._index_name()
+        return [c for c in columns if c != index_name]
+
+    def _index_name(self) -> str:
+        import pyarrow.parquet as pq
+
+        meta = pq.read_schema(self._parts()[0]).pandas_metadata or {}
+        index_columns = meta.get("index_columns", [])
+        return index_columns[0] if index_columns and isinstance(index_columns[0], str) else "Date"
+
+    @profiled()
+    def read(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        import pyarrow.parquet as pq
+
+        frames = []
+        for part in self._parts():
+            if columns is None:
+                frames.append(pd.read_parquet(part))
+                continue
+            # Only project columns present in this partition (tickers can be added later)
+            present = set(pq.read_schema(part).names)
+            frames.append(pd.read_parquet(part, columns=[c for c in columns if c in present]))
+
+        df = _merge_prices(None, frames[0])
+        for frame in frames[1:]:
+            df = _merge_prices(df, frame)
+        if columns is not None:
+            df = df.reindex(columns=columns)
+        return df
+
+    @profiled()
+    def write(self, df: pd.DataFrame) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        for part in self._parts():
+            part.unlink()
+        self._write_part(df, 0)
+
+    @profiled()
+    def append(self, df: pd.DataFrame) -> None:
+        if df.empty:
+            return
+        parts = self._parts()
+        next_id = int(parts[-1].stem.split("-")[1]) + 1 if parts else 0
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._write_part(df, next_id)
+        if len(parts) + 1 > self.max_parts:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Merge all partitions into one.
+
+        The merged partition is written after the existing ones before they are
+        removed, so an interrupted compaction still reads back the same prices.
+        """
+        parts = self._parts()
+        if len(parts) <= 1:
+            return
+        with log_timing(log, "Compacted price partitions", path=self.path, parts=len(parts)) as extra:
+            merged = self.read()
+            self._write_part(merged, int(parts[-1].stem.split("-")[1]) + 1)
+            for part in parts:
+                part.unlink()
+            extra["rows"] = len(merged)
+
+    def _write_part(self, df: pd.DataFrame, part_id: int) -> None:
+        df.sort_index().to_parquet(self.path / f"part-{part_id:05d}.parquet", compression="zstd")
+
+_STORES = {
+    "csv": CSVStore,
+    "parquet": ParquetStore,
+}
+
+def _merge_prices(old: Optional[pd.DataFrame], new: pd.DataFrame) -> pd.DataFrame:
     """
-    project_root = get_project_root()
-    rel_path = cfg["data"]["prices_file"]
-    full_path = project_root / rel_path
-    full_path.parent.mkdir(parents=True, exist_ok=True)
-    return full_path
+    Combine stored and new prices cell by cell: non-missing values in new win,
+    everything else (other tickers, older dates) is kept from old.
+
+    new may cover only some tickers (per-ticker backfills), so whole rows
+    must not be replaced on duplicate dates.
+    """
+    new = new[~new.index.duplicated(keep="last")]
+    if old is None:
+        return new.sort_index()
+    columns = list(old.columns) + [c for c in new.columns if c not in old.columns]
+    return new.combine_first(old).reindex(columns=columns).sort_index()
+
+def _resolve_store(cfg: Dict[str, Any], file_key: str) -> PriceStore:
+    """
+    Build the price store configured by cfg["data"]["storage"] (default "parquet")
+    and cfg["data"]["max_partitions"] (Parquet appends kept before compacting, default 8).
+
+    The Parquet store lives next to the configured CSV path with a .parquet
+    suffix (data/spy/spy_prices.csv -> data/spy/spy_prices.parquet/). If only
+    the CSV exists it is migrated into the Parquet store once.
+    """
+    storage = cfg["data"].get("storage", "parquet")
+    if storage not in _STORES:
+        raise ValueError(f"Unknown storage '{storage}', expected one of {list(_STORES)}")
+
+    csv_path = get_project_root() / cfg["data"][file_key]
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
+    if storage == "csv":
+        return CSVStore(csv_path)
+
+    store = ParquetStore(csv_path.with_suffix(".parquet"), max_parts=cfg["data"].get("max_partitions", 8))
+    if not store.exists() and csv_path.exists():
+        migrate_csv_to_store(csv_path, store)
+    return store
+
+def migrate_csv_to_store(csv_path: Path, store: PriceStore) -> PriceStore:
+    """
+    One-time copy of an existing prices CSV into another store. The CSV is left in place.
+    """
+    log.info("Migrating prices CSV", extra=fields(source=csv_path, target=store.path))
+    store.write(CSVStore(csv_path).read())
+    return store
 
 def _download_spy_prices(cfg: Dict[str, Any]) -> pd.DataFrame:
     """
-    Download SPY data from Yahoo Finance based on start_date and end_date in config.
+    Download SPY data from the configured price source (Yahoo Finance by default)
+    based on start_date and end_date in config.
 
     Config entries used:
+      cfg["data"]["source"]  (see sources.resolve_source)
       cfg["data"]["spy_ticker"]
       cfg["data"]["start_date"]
       cfg["data"]["end_date"]  (if null, we use today's date)
@@ -73,51 +258,47 @@ def _download_spy_prices(cfg: Dict[str, Any]) -> pd.DataFrame:
     if end_date is None:
         end_date = dt.date.today().isoformat()
 
-    print(f"[loaders] Downloading {ticker} from {start_date} to {end_date} ...")
+    log.info("Downloading %s", ticker, extra=fields(start=start_date, end=end_date))
 
-    spy = yf.download(ticker, start=start_date, end=end_date, group_by=None, auto_adjust=False)
+    spy = _fetch_with_retry(resolve_source(cfg), ticker, start_date, end_date, cfg)
 
     if spy.empty:
-        raise RuntimeError("[loaders] No data returned from yfinance.")
-    spy = _flatten_columns(spy)
-    spy = spy.sort_index()
+        raise RuntimeError("[loaders] No data returned from price source.")
     return spy
 
+@profiled()
 def load_or_update_spy_prices(cfg: Dict[str, Any], allow_data_update: bool) -> pd.DataFrame:
     """
     Main entry point for SPY prices.
 
     Behavior:
-      - Compute CSV path from config
-      - If file does not exist:
+      - Resolve the price store from config (Parquet by default, see _resolve_store)
+      - If the store is empty:
           * download full history (start_date -> end_date)
-          * save to CSV
+          * save to the store
           * return DataFrame
-      - If file exists and data update is allowed:
-          * load CSV
+      - If the store exists and data update is allowed:
+          * load stored prices
           * find last available date
           * download new data from last_date+1 to end_date when allowed (from config, or today)
-          * append new rows, remove duplicates
-          * save back to CSV
+          * append the new rows to the store (new partition for Parquet)
           * return updated DataFrame
     """
-    spy_csv_path = _resolve_spy_prices_path(cfg)
+    store = _resolve_store(cfg, "spy_prices_file")
 
-    if not spy_csv_path.exists():
+    if not store.exists():
         # No file yet: full download
-        print(f"[load_or_update_spy] {spy_csv_path} not found. Downloading full history.")
+        log.info("No stored SPY prices, downloading full history", extra=fields(path=store.path))
         spy = _download_spy_prices(cfg)
-        spy.to_csv(spy_csv_path)
-        print(f"[load_or_update_spy] Saved to {spy_csv_path}")
+        with log_timing(log, "Saved SPY prices", path=store.path, rows=len(spy)):
+            store.write(spy)
         return spy
 
     # File exists: load and update
-    print(f"[load_or_update_spy] Loading existing SPY data from {spy_csv_path}")
-    spy_old = pd.read_csv(spy_csv_path, parse_dates=[0], index_col=0)
-    spy_old = spy_old.sort_index()
-
-    last_date = spy_old.index.max()
-    print(f"[load_or_update_spy] Last date in file: {last_date.date()}")
+    with log_timing(log, "Loaded stored SPY prices", path=store.path) as extra:
+        spy_old = store.read()
+        last_date = spy_old.index.max()
+        extra.update(rows=len(spy_old), last_date=last_date.date())
 
     if not allow_data_update:
         return spy_old
@@ -129,7 +310,7 @@ def load_or_update_spy_prices(cfg: Dict[str, Any], allow_data_update: bool) -> p
 
     # Compute next start date = last_date + 1 day
     next_start = (last_date + pd.Timedelta(days=1)).date().isoformat()
-    print(f"[load_or_update_spy] Downloading updates from {next_start} to {end_date} ...")
+    log.info("Downloading SPY updates", extra=fields(start=next_start, end=end_date))
 
     # Temporary config for update range
     cfg_update = cfg.copy()
@@ -140,122 +321,199 @@ def load_or_update_spy_prices(cfg: Dict[str, Any], allow_data_update: bool) -> p
     spy_new = _download_spy_prices(cfg_update)
 
     if spy_new.empty:
-        print("[load_or_update_spy] No new rows. Returning existing data.")
+        log.info("No new SPY rows, returning stored data")
         return spy_old
 
     # Append and drop duplicates
-    spy = pd.concat([spy_old, spy_new])
-    spy = spy[~spy.index.duplicated(keep="last")]
-    spy = spy.sort_index()
-
-    spy.to_csv(spy_csv_path)
-    print(f"[load_or_update_spy] Updated data saved to {spy_csv_path}")
+    with log_timing(log, "Appended SPY updates", path=store.path, rows=len(spy_new)):
+        store.append(spy_new)
+    spy = _merge_prices(spy_old, spy_new)
     return spy
 
 
-def _download_multivariate_prices(cfg: Dict[str, Any], download_adj_close_only=False) -> pd.DataFrame:
+@profiled()
+def _fetch_with_retry(
+    source: PriceSource,
+    tickers: Tickers,
+    start: str,
+    end: str,
+    cfg: Dict[str, Any],
+) -> pd.DataFrame:
+    """
+    source.fetch with exponential backoff.
+
+    Config entries used (optional):
+      cfg["data"]["download_retries"]  (default 3)
+      cfg["data"]["download_backoff"]  seconds before the first retry, doubled each time (default 1.0)
+    """
+    retries = cfg["data"].get("download_retries", 3)
+    backoff = cfg["data"].get("download_backoff", 1.0)
+    names = _as_list(tickers)
+    label = names[0] if len(names) == 1 else f"{names[0]}..{names[-1]} ({len(names)} tickers)"
+
+    for attempt in range(retries + 1):
+        try:
+            with log_timing(log, "Fetched prices", logging.DEBUG, tickers=label, start=start, attempt=attempt + 1) as extra:
+                prices = source.fetch(tickers, start, end)
+                extra["rows"] = len(prices)
+            return prices
+        except Exception as exc:
+            if attempt == retries:
+                raise RuntimeError(f"[loaders] Download of {label} failed after {retries + 1} attempts") from exc
+            wait = backoff * 2 ** attempt
+            log.warning("Download of %s failed (%s), retrying", label, exc, extra=fields(attempt=attempt + 1, wait=wait))
+            time.sleep(wait)
+
+def _ticker_watermarks(store: PriceStore, tickers: List[str]) -> Dict[str, Optional[pd.Timestamp]]:
+    """
+    Last date with a non-missing adjusted close for each ticker, None if the
+    ticker has no stored history. Only the _Adj_Close columns are read.
+    """
+    marks: Dict[str, Optional[pd.Timestamp]] = {t: None for t in tickers}
+    if not store.exists():
+        return marks
+
+    stored = {c[:-len("_Adj_Close")]: c for c in store.columns() if c.endswith("_Adj_Close")}
+    present = [t for t in tickers if t in stored]
+    if not present:
+        return marks
+
+    adj = store.read(columns=[stored[t] for t in present])
+    valid = adj.notna().to_numpy()
+    last = len(adj) - 1 - np.argmax(valid[::-1], axis=0)
+    for j, ticker in enumerate(present):
+        if valid[:, j].any():
+            marks[ticker] = adj.index[last[j]]
+    return marks
+
+def _plan_downloads(
+    watermarks: Dict[str, Optional[pd.Timestamp]],
+    start_date: str,
+    end_date: str,
+    chunk_size: int,
+) -> List[Tuple[List[str], str]]:
+    """
+    Batches of (tickers, start) covering only the missing ranges.
+
+    Tickers are grouped by start date (last stored date + 1, or start_date for
+    new tickers) and each group is split into chunks of at most chunk_size.
+    """
+    groups: Dict[str, List[str]] = {}
+    for ticker, last in watermarks.items():
+        start = start_date if last is None else (last + pd.Timedelta(days=1)).date().isoformat()
+        if pd.Timestamp(start) >= pd.Timestamp(end_date):
+            continue
+        groups.setdefault(start, []).append(ticker)
+
+    return [
+        (names[i:i + chunk_size], start)
+        for start, names in sorted(groups.items())
+        for i in range(0, len(names), chunk_size)
+    ]
+
+def _download_missing_prices(
+    cfg: Dict[str, Any],
+    watermarks: Dict[str, Optional[pd.Timestamp]],
+) -> pd.DataFrame:
     """
-    Download SPY data from Yahoo Finance based on start_date and end_date in config.
+    Download the missing history of each ticker from the configured price source.
+
+    Batches from _plan_downloads are fetched concurrently on a bounded thread
+    pool, each with retry and backoff, then joined on dates. Sources that
+    cannot be called concurrently (source.concurrent_fetch is False, e.g.
+    yfinance, which threads inside one call) get one call per start date
+    instead, and the chunk size and worker count are not used.
 
     Config entries used:
-      cfg["data"]["ticker"]
+      cfg["data"]["source"]  (see sources.resolve_source)
       cfg["data"]["start_date"]
       cfg["data"]["end_date"]  (if null, we use today's date)
-    Returns a DataFrame indexed by date with flattened column names.
+      cfg["data"]["download_chunk_size"]  tickers per request (default 50)
+      cfg["data"]["download_workers"]  concurrent requests (default 4)
+    Returns a DataFrame indexed by date with flattened column names (empty if
+    nothing is missing).
     """
-    tickers = cfg["data"]["ticker"]
-    start_date = cfg["data"]["start_date"]
     end_date = cfg["data"]["end_date"]
-
     if end_date is None:
         end_date = dt.date.today().isoformat()
 
-    print(f"[loaders] Downloading {tickers} from {start_date} to {end_date} ...")
-
-    prices = yf.download(tickers, start=start_date, end=end_date, group_by=None, auto_adjust=False)
-    if download_adj_close_only:
-        prices = prices.loc[:, prices.columns.get_level_values(1) == "Adj Close"]
-
-    if prices.empty:
-        raise RuntimeError("[loaders] No data returned from yfinance.")
-    prices = _flatten_columns(prices)
-    prices = prices.sort_index()
-    return prices
-
-
+    source = resolve_source(cfg)
+    if source.concurrent_fetch:
+        chunk_size = cfg["data"].get("download_chunk_size", 50)
+        workers = cfg["data"].get("download_workers", 4)
+    else:
+        chunk_size, workers = max(1, len(watermarks)), 1
+
+    batches = _plan_downloads(watermarks, cfg["data"]["start_date"], end_date, chunk_size)
+    if not batches:
+        return pd.DataFrame()
+
+    for names, start in batches:
+        log.info("Downloading %d tickers", len(names), extra=fields(start=start, end=end_date))
+
+    workers = max(1, min(workers, len(batches)))
+    with log_timing(log, "Downloaded prices", batches=len(batches), workers=workers):
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_fetch_with_retry, source, names, start, end_date, cfg)
+                for names, start in batches
+            ]
+            frames = [f.result() for f in futures]
+
+    # Each ticker is in exactly one batch, so columns never overlap
+    frames = [f for f in frames if not f.empty]
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, axis=1).sort_index()
+
+
+@profiled()
 def load_or_update_prices(cfg: Dict[str, Any], allow_data_update: bool, show_only_adj_close=False) -> pd.DataFrame:
     """
     Main entry point for multiple prices.
 
     Behavior:
-      - Compute CSV path from config
-      - If file does not exist:
-          * download full history (start_date -> end_date)
-          * save to CSV
-          * return DataFrame
-      - If file exists and data update is allowed:
-          * load CSV
-          * find last available date
-          * If data update is allowed:
-          * append new rows, remove duplicates
-          * save back to CSV
-          * return updated DataFrame
+      - Resolve the price store from config (Parquet by default, see _resolve_store)
+      - If the store is empty, or data update is allowed:
+          * compute a per-ticker watermark: the last stored date with a price
+          * download only the missing range of each ticker (full history for
+            tickers new to cfg["data"]["ticker"], last date + 1 -> end_date for
+            the rest), concurrently in chunks (see _download_missing_prices)
+          * merge the new rows into the store (new partition for Parquet)
+      - Return the stored prices; with show_only_adj_close only the
+        _Adj_Close columns are read from disk
     """
-    csv_path = _resolve_prices_path(cfg)
-
-    if not csv_path.exists():
-        # No file yet: full download
-        print(f"[load_or_update_prices] {csv_path} not found. Downloading full history.")
-        prices = _download_multivariate_prices(cfg, show_only_adj_close)
-        prices.to_csv(csv_path)
-        print(f"[load_or_update_prices] Saved to {csv_path}")
-        return prices
-
-    # File exists: load and update
-    print(f"[load_or_update_prices] Loading existing prices data from {csv_path}")
-    prices_old = pd.read_csv(csv_path, parse_dates=[0], index_col=0)
-    prices_old = prices_old.sort_index()
-
-    last_date = prices_old.index.max()
-    print(f"[load_or_update_prices] Last date in file: {last_date.date()}")
-
-    if not allow_data_update:
-        if show_only_adj_close:
-            prices_old = _filter_columns_by_suffix(prices_old, suffix="_Adj_Close")
-            print(f"[load_or_update_prices] Only displaying adjusted close")
-        return prices_old
-
-    # Determine end date
-    end_date = cfg["data"]["end_date"]
-    if end_date is None:
-        end_date = dt.date.today().isoformat()
-
-    # Compute next start date = last_date + 1 day
-    next_start = (last_date + pd.Timedelta(days=1)).date().isoformat()
-    print(f"[load_or_update_spy] Downloading updates from {next_start} to {end_date} ...")
-
-    # Temporary config for update range
-    cfg_update = cfg.copy()
-    cfg_update["data"] = cfg["data"].copy()
-    cfg_update["data"]["start_date"] = next_start
-    cfg_update["data"]["end_date"] = end_date
-
-    prices_new = _download_multivariate_prices(cfg_update, show_only_adj_close)
-
-    if prices_new.empty:
-        print("[load_or_update_spy] No new rows. Returning existing data.")
-        return prices_old
-
-    # Append and drop duplicates
-    prices = pd.concat([prices_old, prices_new])
-    prices = prices[~prices.index.duplicated(keep="last")]
-    prices = prices.sort_index()
-
-
-    prices.to_csv(csv_path)
-    print(f"[load_or_update_prices] Updated data saved to {csv_path}")
-
-    if show_only_adj_close:
-        prices = _filter_columns_by_suffix(prices, suffix="_Adj_Close")
-        print(f"[load_or_update_prices] Only displaying adjusted close")
-    return prices
\ No newline at end of file
+    store = _resolve_store(cfg, "prices_file")
+    tickers = _as_list(cfg["data"]["ticker"])
+
+    if allow_data_update or not store.exists():
+        if store.exists():
+            watermarks = _ticker_watermarks(store, tickers)
+            stored = [m for m in watermarks.values() if m is not None]
+            if stored:
+                log.info("Loaded stored price watermarks", extra=fields(path=store.path, last_date=max(stored).date()))
+            missing = [t for t, m in watermarks.items() if m is None]
+            if missing:
+                log.info("No stored history for %s", missing)
+        else:
+            # No file yet: full download
+            log.info("No stored prices, downloading full history", extra=fields(path=store.path))
+            watermarks = {t: None for t in tickers}
+
+        prices_new = _download_missing_prices(cfg, watermarks)
+
+        if prices_new.empty:
+            if not store.exists():
+                raise RuntimeError("[loaders] No data returned from price source.")
+            log.info("No new rows, returning stored data")
+        elif store.exists():
+            with log_timing(log, "Appended price updates", path=store.path, rows=len(prices_new)):
+                store.append(prices_new)
+        else:
+            with log_timing(log, "Saved prices", path=store.path, rows=len(prices_new)):
+                store.write(prices_new)
+
+    with log_timing(log, "Loaded stored prices", path=store.path, adj_close_only=show_only_adj_close) as extra:
+        prices = store.read_suffix("_Adj_Close") if show_only_adj_close else store.read()
+        extra["rows"] = len(prices)
+    return prices
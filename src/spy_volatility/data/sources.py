@@ -0,0 +1,346 @@
+# src/spy_volatility/data/sources.py
+
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from spy_volatility.utils.config import get_project_root
+from spy_volatility.utils.log import get_logger
+
+log = get_logger(__name__)
+
+# Per-ticker fields in the order yfinance returns them (after flattening)
+PRICE_FIELDS = ["Open", "High", "Low", "Close", "Adj_Close", "Volume"]
+
+Tickers = Union[str, Sequence[str]]
+
+def _flatten_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Flatten yfinance multi-index columns.
+    """
+    df.columns = ['_'.join(c.replace(" ", "_") for c in col) 
+        if isinstance(col, tuple) else col.replace(" ", "_") 
+        for col in df.columns] # Flatten multi-index: join levels with underscore
+    return df
+
+def _as_list(tickers: Tickers) -> List[str]:
+    return [tickers] if isinstance(tickers, str) else list(tickers)
+
+def _date_slice(df: pd.DataFrame, start, end) -> pd.DataFrame:
+    """
+    Rows with start <= date < end (end is exclusive, like yf.download).
+    """
+    index = df.index
+    mask = np.ones(len(index), dtype=bool)
+    if start is not None:
+        mask &= index >= pd.Timestamp(start)
+    if end is not None:
+        mask &= index < pd.Timestamp(end)
+    return df.loc[mask]
+
+class PriceSource(ABC):
+    """
+    Where raw daily prices come from.
+
+    fetch() returns a DataFrame indexed by date ("Date") with flattened
+    "{TICKER}_{Field}" columns (SPY_Open, ..., SPY_Adj_Close, SPY_Volume),
+    the same layout the loaders store on disk. The end date is exclusive.
+
+    concurrent_fetch tells the loaders whether fetch() may be called from
+    several threads at once. Sources that cannot (yfinance) get all tickers
+    sharing a start date in one call instead.
+    """
+    concurrent_fetch = True
+
+    @abstractmethod
+    def fetch(self, tickers: Tickers, start, end) -> pd.DataFrame:
+        ...
+
+class YFinanceSource(PriceSource):
+    """
+    Yahoo Finance through yf.download (needs network access).
+
+    yf.download collects results in module-level state, so concurrent calls
+    are serialized. It downloads the tickers of one call on its own threads,
+    so the loaders send one call per start date rather than parallel chunks
+    (concurrent_fetch = False).
+    """
+    concurrent_fetch = False
+    _lock = threading.Lock()
+
+    def fetch(self, tickers: Tickers, start, end) -> pd.DataFrame:
+        import yfinance as yf
+
+        with self._lock:
+            prices = yf.download(tickers, start=start, end=end, group_by=None, auto_adjust=False)
+        if prices.empty:
+            return prices
+        return _flatten_columns(prices).sort_index()
+
+class LocalCSVSource(PriceSource):
+    """
+    Prices read from local files, for air-gapped machines and fixtures.
+
+    path can be:
+      - a directory with one file per ticker ({TICKER}.csv or {TICKER}.parquet)
+        holding Date, Open, High, Low, Close, Adj Close, Volume columns
+      - a single wide CSV/Parquet file with "{TICKER}_{Field}" columns,
+        e.g. one written by the loaders (data/multivariate/multi_prices.csv)
+    Relative paths are resolved from the project root.
+    """
+    def __init__(self, path: Union[str, Path]):
+        path = Path(path)
+        self.path = path if path.is_absolute() else get_project_root() / path
+        if not self.path.exists():
+            raise FileNotFoundError(f"Local price source not found: {self.path}")
+        self._wide: Optional[pd.DataFrame] = None
+
+    def fetch(self, tickers: Tickers, start, end) -> pd.DataFrame:
+        tickers = _as_list(tickers)
+        if self.path.is_dir():
+            frames = [self._read_ticker(t) for t in tickers]
+            frames = [f for f in frames if f is not None]
+            if not frames:
+                return pd.DataFrame()
+            prices = pd.concat(frames, axis=1).sort_index()
+        else:
+            wide = self._read_wide()
+            # Exact "{TICKER}_{Field}" names: tickers may contain "_" and stray columns are ignored
+            wanted = {f"{t}_{field}" for t in tickers for field in PRICE_FIELDS}
+            columns = [c for c in wide.columns if c in wanted]
+            prices = wide.loc[:, columns]
+        return _date_slice(prices, start, end)
+
+    def _read_ticker(self, ticker: str) -> Optional[pd.DataFrame]:
+        for suffix in (".parquet", ".csv"):
+            file = self.path / f"{ticker}{suffix}"
+            if file.exists():
+                break
+        else:
+            log.warning("No local file for %s in %s", ticker, self.path)
+            return None
+
+        df = _read_frame(file)
+        df.columns = [f"{ticker}_{str(c).replace(' ', '_')}" for c in df.columns]
+        return df
+
+    def _read_wide(self) -> pd.DataFrame:
+        if self._wide is None:
+            self._wide = _read_frame(self.path).sort_index()
+        return self._wide
+
+def _read_frame(file: Path) -> pd.DataFrame:
+    if file.suffix == ".parquet":
+        df = pd.read_parquet(file)
+    else:
+        df = pd.read_csv(file, parse_dates=[0], index_col=0)
+    df.index = pd.DatetimeIndex(df.index, name="Date")
+    return df
+
+class SyntheticGARCHSource(PriceSource):
+    """
+    Deterministic GARCH(1,1)-t simulated prices for any ticker list and date range.
+
+    Each ticker gets its own parameters (alpha, persistence, annual vol) and
+    innovations from a generator seeded by (seed, ticker, year), so a date's
+    prices never depend on the requested range: incremental updates line up
+    with a full download, and two runs with the same seed are identical.
+    Simulation starts at origin on business days.
+
+    The first fetch of a ticker simulates it from origin, whatever the start
+    (about 36 years of days from the default 1990 origin). The instance then
+    keeps each ticker's recursion state (variance and price level) at the
+    last simulated date, so a later fetch starting after that date only
+    simulates the new days, with the same values as a full simulation. Each
+    loader run builds a new source, so a nightly update of a large synthetic
+    universe still pays for one full simulation; a later origin makes it cheaper.
+    """
+    def __init__(
+        self,
+        seed: int = 0,
+        origin: str = "1990-01-01",
+        nu: float = 6.0,
+        mu: float = 0.0003,
+        alpha_range: tuple = (0.03, 0.12),
+        persistence_range: tuple = (0.95, 0.995),
+        annual_vol_range: tuple = (0.12, 0.45),
+        start_price: float = 100.0,
+    ):
+        self.seed = seed
+        self.origin = pd.Timestamp(origin)
+        self.nu = nu
+        self.mu = mu
+        self.alpha_range = alpha_range
+        self.persistence_range = persistence_range
+        self.annual_vol_range = annual_vol_range
+        self.start_price = start_price
+        # ticker -> (last simulated date, next variance, cumulative log return)
+        self._state: Dict[str, tuple] = {}
+
+    def ticker_params(self, ticker: str) -> Dict[str, float]:
+        """
+        GARCH(1,1) parameters used for ticker (daily variance units).
+        """
+        rng = np.random.default_rng([self.seed, zlib.crc32(ticker.encode())])
+        alpha = rng.uniform(*self.alpha_range)
+        persistence = rng.uniform(*self.persistence_range)
+        annual_vol = rng.uniform(*self.annual_vol_range)
+        daily_var = annual_vol ** 2 / 252
+        return {
+            "omega": daily_var * (1.0 - persistence),
+            "alpha": alpha,
+            "beta": persistence - alpha,
+            "unconditional_variance": daily_var,
+            "log_volume": rng.uniform(13.0, 18.0),
+        }
+
+    def fetch(self, tickers: Tickers, start, end) -> pd.DataFrame:
+        tickers = _as_list(tickers)
+        end = pd.Timestamp.today().normalize() if end is None else pd.Timestamp(end)
+        dates = pd.bdate_range(self.origin, end - pd.Timedelta(days=1), name="Date")
+        if len(dates) == 0 or not tickers:
+            return pd.DataFrame(index=pd.DatetimeIndex([], name="Date"))
+
+        # Tickers with a state before start resume from it, the rest start at origin
+        groups: Dict[Optional[pd.Timestamp], List[str]] = {}
+        for ticker in tickers:
+            state = self._state.get(ticker)
+            resume = start is not None and state is not None and state[0] < pd.Timestamp(start)
+            groups.setdefault(state[0] if resume else None, []).append(ticker)
+
+        frames = []
+        for resume_from, names in groups.items():
+            sim_dates = dates if resume_from is None else dates[dates > resume_from]
+            if len(sim_dates) == 0:
+                continue
+            init = None if resume_from is None else tuple(np.array([self._state[t][k] for t in names]) for k in (1, 2))
+            fields, (var_t, log_level) = self._simulate(names, sim_dates, init)  # (T, N, 6)
+            for j, ticker in enumerate(names):
+                self._state[ticker] = (sim_dates[-1], var_t[j], log_level[j])
+
+            n_obs, n_tickers, n_fields = fields.shape
+            columns = [f"{t}_{f}" for t in names for f in PRICE_FIELDS]
+            frame = pd.DataFrame(fields.reshape(n_obs, n_tickers * n_fields), index=sim_dates, columns=columns)
+            frames.append(_date_slice(frame, start, end))
+
+        if not frames:
+            return pd.DataFrame(index=pd.DatetimeIndex([], name="Date"))
+        if len(frames) == 1:
+            return frames[0]
+        columns = [f"{t}_{f}" for t in tickers for f in PRICE_FIELDS]
+        prices = pd.concat(frames, axis=1).sort_index()
+        return prices.reindex(columns=[c for c in columns if c in prices.columns])
+
+    def _innovations(self, tickers: List[str], dates: pd.DatetimeIndex) -> np.ndarray:
+        """
+        (4, T, N) shocks: standardized t return shocks plus 3 normals for open/high/low.
+        Drawn per calendar year so a prefix of dates always gets the same draws.
+        """
+        # Filled ticker-major so each ticker's draws are contiguous writes
+        shocks = np.empty((4, len(tickers), len(dates)))
+        t_scale = np.sqrt((self.nu - 2.0) / self.nu)
+        years = dates.year.to_numpy()
+        for year in np.unique(years):
+            rows = np.flatnonzero(years == year)
+            block = slice(rows[0], rows[-1] + 1)
+            # Always draw the full year so the stream does not depend on origin or end
+            year_days = pd.bdate_range(f"{year}-01-01", f"{year}-12-31")
+            pos = year_days.get_indexer(dates[rows])
+            for j, ticker in enumerate(tickers):
+                rng = np.random.default_rng([self.seed, zlib.crc32(ticker.encode()), int(year)])
+                z = rng.standard_t(self.nu, size=len(year_days)) * t_scale
+                aux = rng.standard_normal(size=(3, len(year_days)))
+                shocks[0, j, block] = z[pos]
+                shocks[1:, j, block] = aux[:, pos]
+        return np.ascontiguousarray(shocks.transpose(0, 2, 1))
+
+    def _simulate(
+        self,
+        tickers: List[str],
+        dates: pd.DatetimeIndex,
+        init: Optional[tuple] = None,
+    ) -> tuple[np.ndarray, tuple]:
+        """
+        (T, N, 6) prices over dates, starting from init = (variance, cumulative
+        log return) of the previous day, or from origin when init is None.
+        Also returns that state after the last date.
+        """
+        params = [self.ticker_params(t) for t in tickers]
+        omega = np.array([p["omega"] for p in params])
+        alpha = np.array([p["alpha"] for p in params])
+        beta = np.array([p["beta"] for p in params])
+        log_volume = np.array([p["log_volume"] for p in params])
+
+        z, z_open, z_high, z_low = self._innovations(tickers, dates)
+        n_obs = len(dates)
+
+        # GARCH(1,1) recursion, vectorized over tickers
+        sigma = np.empty((n_obs, len(tickers)))
+        returns = np.empty((n_obs, len(tickers)))
+        if init is None:
+            var_t = np.array([p["unconditional_variance"] for p in params])
+            log_level = np.zeros(len(tickers))
+        else:
+            var_t, log_level = init
+        for t in range(n_obs):
+            np.sqrt(var_t, out=sigma[t])
+            eps = sigma[t] * z[t]
+            returns[t] = eps
+            var_t = omega + alpha * eps * eps + beta * var_t
+        returns += self.mu
+
+        # Cumulated from the previous level so a resumed path adds up in the same order
+        cum = np.cumsum(np.vstack([log_level, returns]), axis=0)
+        close = self.start_price * np.exp(cum[1:])
+        prev_close = self.start_price * np.exp(cum[:-1])
+
+        out = np.empty((n_obs, len(tickers), len(PRICE_FIELDS)))
+        field = {name: i for i, name in enumerate(PRICE_FIELDS)}
+        open_ = prev_close * np.exp(0.25 * sigma * z_open)
+        out[:, :, field["Open"]] = open_
+        out[:, :, field["High"]] = np.maximum(open_, close) * np.exp(0.5 * sigma * np.abs(z_high))
+        out[:, :, field["Low"]] = np.minimum(open_, close) * np.exp(-0.5 * sigma * np.abs(z_low))
+        out[:, :, field["Close"]] = close
+        out[:, :, field["Adj_Close"]] = close
+        out[:, :, field["Volume"]] = np.round(np.exp(log_volume + 20.0 * sigma * np.abs(z)))
+        return out, (var_t, cum[-1])
+
+def synthetic_tickers(n: int, prefix: str = "SYN") -> List[str]:
+    """
+    n ticker names for synthetic universes: SYN0000, SYN0001, ...
+    """
+    width = max(4, len(str(n - 1)))
+    return [f"{prefix}{i:0{width}d}" for i in range(n)]
+
+_SOURCES = {
+    "yfinance": YFinanceSource,
+    "local": LocalCSVSource,
+    "synthetic": SyntheticGARCHSource,
+}
+
+def resolve_source(cfg: Dict[str, Any]) -> PriceSource:
+    """
+    Build the price source configured under cfg["data"]["source"].
+
+    Accepts a name ("yfinance", "local", "synthetic") or a mapping
+    {"name": ..., **kwargs}, e.g.
+        source:
+          name: "synthetic"
+          seed: 7
+    Defaults to yfinance when no source is configured.
+    """
+    spec = cfg["data"].get("source") or "yfinance"
+    if isinstance(spec, str):
+        name, kwargs = spec, {}
+    else:
+        kwargs = dict(spec)
+        name = kwargs.pop("name", "yfinance")
+
+    if name not in _SOURCES:
+        raise ValueError(f"Unknown price source '{name}', expected one of {list(_SOURCES)}")
+    return _SOURCES[name](**kwargs)
@@ -0,0 +1,210 @@
+# src/spy_volatility/models/dcc.py
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from spy_volatility.models.garch_models import _maybe_njit, fit_garch_universe
+from spy_volatility.risk.cov_cube import CovarianceCube
+from spy_volatility.risk.cov_metrics import _log_return_matrix
+from spy_volatility.utils.profiling import profiled
+
+# DCC(1,1) of Engle (2002) on top of univariate GARCH(1,1)-t fits:
+#
+#   Q_t = (1 - a - b) S + a z_{t-1} z_{t-1}' + b Q_{t-1},   Q_0 = S
+#   R_t = diag(Q_t)^-1/2 Q_t diag(Q_t)^-1/2,   H_t = D_t R_t D_t
+#
+# with z the GARCH-standardized residuals, S their sample second moment
+# (correlation targeting) and D_t the GARCH volatilities. a and b are fitted
+# by composite likelihood (Engle, Shephard & Sheppard, 2008): the sum of the
+# bivariate DCC likelihoods of a set of asset pairs. Each pair's 2x2
+# recursion is O(1) per day, so an evaluation is O(T * pairs) instead of the
+# O(T N^3) of the full likelihood (an N x N inverse and determinant per day).
+
+def _dcc_pairs(
+    n_assets: int,
+    pairs: str = "contiguous",
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Asset pairs of the composite likelihood: (i, i + 1) for "contiguous"
+    (N - 1 pairs) or every i < j for "all" (N(N - 1)/2 pairs).
+    """
+    if pairs == "contiguous":
+        first = np.arange(n_assets - 1)
+        return first, first + 1
+    if pairs == "all":
+        return np.triu_indices(n_assets, k=1)
+    raise ValueError(f"Unknown pairs '{pairs}', expected 'contiguous' or 'all'")
+
+@_maybe_njit
+def _dcc_composite_loglik(
+    z: np.ndarray,
+    s_ii: np.ndarray,
+    s_jj: np.ndarray,
+    s_ij: np.ndarray,
+    pair_i: np.ndarray,
+    pair_j: np.ndarray,
+    a: float,
+    b: float,
+) -> float:
+    """
+    Sum over days and pairs of the bivariate DCC correlation log-likelihood
+    -0.5 * (log|R_t| + z_t' R_t^-1 z_t - z_t' z_t), with the 2x2 Q recursion
+    of every pair run side by side.
+    """
+    c = 1.0 - a - b
+    q_ii, q_jj, q_ij = s_ii.copy(), s_jj.copy(), s_ij.copy()
+    loglik = 0.0
+    for t in range(z.shape[0]):
+        if t > 0:
+            z_i, z_j = z[t - 1][pair_i], z[t - 1][pair_j]
+            q_ii = c * s_ii + a * z_i * z_i + b * q_ii
+            q_jj = c * s_jj + a * z_j * z_j + b * q_jj
+            q_ij = c * s_ij + a * z_i * z_j + b * q_ij
+        rho = q_ij / np.sqrt(q_ii * q_jj)
+        one_minus_rho2 = 1.0 - rho * rho
+        x, y = z[t][pair_i], z[t][pair_j]
+        loglik += np.sum(
+            np.log(one_minus_rho2) + (x * x + y * y - 2.0 * rho * x * y) / one_minus_rho2 - x * x - y * y
+        )
+    return -0.5 * loglik
+
+@_maybe_njit
+def _dcc_covariance_into(
+    z: np.ndarray,
+    sigma: np.ndarray,
+    S: np.ndarray,
+    a: float,
+    b: float,
+    out: np.ndarray,
+    flat: np.ndarray,
+    forecast: np.ndarray,
+) -> np.ndarray:
+    """
+    Fills out[t] with the entries flat (positions in the raveled N x N matrix)
+    of H_t = D_t R_t D_t from the full N x N Q recursion: every entry for a
+    dense (T, N * N) view, the upper triangle for a packed cube. forecast gets
+    the full matrix for the day after the sample (sigma has one more row than
+    z for it). Only Q and one H are held in memory.
+    """
+    c = 1.0 - a - b
+    Q = S.copy()
+    for t in range(out.shape[0] + 1):
+        if t > 0:
+            Q *= b
+            Q += c * S
+            Q += a * np.outer(z[t - 1], z[t - 1])
+        scale = sigma[t] / np.sqrt(np.diag(Q))
+        H = Q * np.outer(scale, scale)
+        if t < out.shape[0]:
+            out[t] = H.ravel()[flat]
+        else:
+            forecast[:] = H
+    return out
+
+@profiled()
+def fit_dcc_garch(
+    returns: pd.DataFrame,
+    pairs: str = "contiguous",
+    n_jobs: int | None = None,
+    engine: str = "native",
+    packed: bool = False,
+    out_dir: str | Path | None = None,
+) -> dict[str, Any]:
+    """
+    DCC(1,1)-GARCH(1,1) conditional covariance of every *_Log_Return column.
+
+    The univariate GARCH(1,1)-t fits run in parallel through fit_garch_universe;
+    the DCC parameters a, b are then fitted by composite likelihood over the
+    asset pairs (see _dcc_pairs), so the cost grows with N (contiguous pairs)
+    rather than N^3.
+
+    The covariance keyed at date t is conditional on returns up to t - 1, the
+    same convention as rolling_sample_covariance, in daily (not annualized)
+    return units.
+
+    Parameters:
+        returns (pd.DataFrame): log returns; NaN rows must be dropped first.
+        pairs (str): "contiguous" (N - 1 pairs) or "all" (every pair) for the composite likelihood.
+        n_jobs (int | None): worker processes for the GARCH fits (see fit_garch_universe).
+        engine (str): GARCH engine, "native" or "arch".
+        packed (bool): store only upper triangles in the returned cube.
+        out_dir (str | Path | None): if given, the cube is written straight into a
+            memory-mapped cube at out_dir / "dcc_cov" (see CovarianceCube.open_memmap).
+
+    The recursion writes each day into the output as it goes (upper triangles
+    only when packed), so no dense (T, N, N) stack is allocated on the way.
+
+    Returns a dictionary:
+        - "cov" -> CovarianceCube of H_t, one matrix per date of returns
+        - "forecast" -> (N, N) covariance for the day after the last date
+        - "params" -> {"a", "b"} DCC parameters
+        - "garch_params" -> univariate GARCH parameters, one row per asset
+        - "std_resid" -> standardized residuals z (DataFrame)
+        - "composite_loglik", "converged"
+    """
+    x, index, assets = _log_return_matrix(returns)
+    if x.shape[1] < 2:
+        raise ValueError("DCC needs at least two assets")
+
+    garch = fit_garch_universe(
+        pd.DataFrame(x, index=index, columns=assets), n_jobs=n_jobs, annualization=1, engine=engine,
+    )
+    if garch["errors"]:
+        raise RuntimeError(f"GARCH fits failed for {sorted(garch['errors'])}: {garch['errors']}")
+
+    # fit_garch_universe works on returns scaled by 100
+    garch_params = garch["params"]
+    mu = garch_params["mu"].to_numpy(dtype=float) / 100
+    omega = garch_params["omega"].to_numpy(dtype=float) / 100 ** 2
+    alpha = garch_params["alpha[1]"].to_numpy(dtype=float)
+    beta = garch_params["beta[1]"].to_numpy(dtype=float)
+
+    sigma = np.empty((len(x) + 1, len(assets)))
+    sigma[:-1] = garch["cond_vol"].to_numpy()
+    resid = x - mu
+    sigma[-1] = np.sqrt(omega + alpha * resid[-1] ** 2 + beta * sigma[-2] ** 2)
+    z = np.ascontiguousarray(resid / sigma[:-1])
+
+    S = z.T @ z / len(z)
+    pair_i, pair_j = _dcc_pairs(len(assets), pairs)
+    s_ii, s_jj, s_ij = S[pair_i, pair_i], S[pair_j, pair_j], S[pair_i, pair_j]
+    scale = len(z) * len(pair_i)
+
+    from scipy.optimize import minimize
+
+    def objective(params):
+        return -_dcc_composite_loglik(z, s_ii, s_jj, s_ij, pair_i, pair_j, params[0], params[1]) / scale
+
+    opt = minimize(
+        objective,
+        np.array([0.02, 0.95]),
+        method="SLSQP",
+        bounds=[(0.0, 1.0), (0.0, 1.0)],
+        constraints=[{"type": "ineq", "fun": lambda p: 0.999 - p[0] - p[1]}],
+        options={"ftol": 1e-10, "maxiter": 200},
+    )
+    a, b = (float(v) for v in opt.x)
+
+    n_assets = len(assets)
+    if out_dir is None:
+        shape = (len(x),) + ((n_assets * (n_assets + 1) // 2,) if packed else (n_assets, n_assets))
+        cube = CovarianceCube(np.empty(shape), index, assets, packed=packed)
+    else:
+        cube = CovarianceCube.open_memmap(Path(out_dir) / "dcc_cov", index, assets, packed=packed)
+    rows, cols = np.triu_indices(n_assets) if packed else np.divmod(np.arange(n_assets * n_assets), n_assets)
+    forecast = np.empty((n_assets, n_assets))
+    _dcc_covariance_into(z, sigma, S, a, b, cube.values.reshape(len(x), -1), rows * n_assets + cols, forecast)
+    cube.flush()
+
+    return {
+        "cov": cube,
+        "forecast": forecast,
+        "params": {"a": a, "b": b},
+        "garch_params": garch_params,
+        "std_resid": pd.DataFrame(z, index=index, columns=assets),
+        "composite_loglik": -opt.fun * scale,
+        "converged": bool(opt.success),
+    }
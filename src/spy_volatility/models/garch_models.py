@@ -1,10 +1,275 @@
-from arch import arch_model
+import functools
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any
+
 import pandas as pd
 import numpy as np
 
+from spy_volatility.utils.profiling import profiled
+
+# arch, scipy and numba are imported inside the functions that use them:
+# together they take seconds to import, which every caller of this module would pay.
+
+DEFAULT_GARCH_SPEC = {
+    "mean": "Constant",
+    "vol": "GARCH",
+    "p": 1,
+    "o": 0,
+    "q": 1,
+    "dist": "t",
+}
+
+def _maybe_njit(func):
+    """
+    Compile with numba on first call when it is installed, otherwise keep the Python function.
+    The original function stays available as .py_func, as on a numba dispatcher.
+    """
+    compiled = None
+
+    @functools.wraps(func)
+    def dispatch(*args):
+        nonlocal compiled
+        if compiled is None:
+            try:
+                from numba import njit
+            except ImportError:  # Optional: pure Python loops are used without numba
+                compiled = func
+            else:
+                compiled = njit(cache=True)(func)
+        return compiled(*args)
+
+    dispatch.py_func = func
+    return dispatch
+
+@_maybe_njit
+def _garch11_t_kernel(
+    params: np.ndarray,
+    y: np.ndarray,
+    backcast: float,
+    sigma2: np.ndarray,
+    grad: np.ndarray,
+) -> float:
+    """
+    Data-dependent part of the GARCH(1,1)-t log-likelihood and its gradient.
+
+    sigma2 is filled in place and grad receives the gradient, with the variance
+    derivatives carried forward through the same recursion as the variance.
+    """
+    mu, omega, alpha, beta, nu = params[0], params[1], params[2], params[3], params[4]
+    half_nu1 = 0.5 * (nu + 1.0)
+    nu2 = nu - 2.0
+
+    # Derivatives of sigma2[t] with respect to mu, omega, alpha, beta
+    ds_mu, ds_omega, ds_alpha, ds_beta = 0.0, 1.0, backcast, backcast
+    s = omega + (alpha + beta) * backcast
+    e_prev = 0.0
+
+    # log(sigma2) and log(1 + k) are summed as logs of running products,
+    # flushed every 16 steps, to avoid two log calls per observation
+    log_s, log_1k = 0.0, 0.0
+    prod_s, prod_1k = 1.0, 1.0
+    g_mu, g_omega, g_alpha, g_beta, g_nu = 0.0, 0.0, 0.0, 0.0, 0.0
+    for t in range(y.shape[0]):
+        if t > 0:
+            ds_mu = -2.0 * alpha * e_prev + beta * ds_mu
+            ds_omega = 1.0 + beta * ds_omega
+            ds_alpha = e_prev * e_prev + beta * ds_alpha
+            ds_beta = s + beta * ds_beta
+            s = omega + alpha * e_prev * e_prev + beta * s
+        sigma2[t] = s
+
+        e = y[t] - mu
+        k = e * e / (s * nu2)
+        w = 1.0 / (1.0 + k)
+        prod_s *= s
+        prod_1k *= 1.0 + k
+        if t % 16 == 15:
+            log_s += np.log(prod_s)
+            log_1k += np.log(prod_1k)
+            prod_s, prod_1k = 1.0, 1.0
+
+        dl_ds = (-0.5 + half_nu1 * k * w) / s
+        dl_de = -half_nu1 * 2.0 * e * w / (s * nu2)
+        g_mu += -dl_de + dl_ds * ds_mu
+        g_omega += dl_ds * ds_omega
+        g_alpha += dl_ds * ds_alpha
+        g_beta += dl_ds * ds_beta
+        g_nu += half_nu1 * k * w / nu2
+        e_prev = e
+
+    log_s += np.log(prod_s)
+    log_1k += np.log(prod_1k)
+
+    grad[0], grad[1], grad[2], grad[3], grad[4] = g_mu, g_omega, g_alpha, g_beta, g_nu - 0.5 * log_1k
+    return -0.5 * log_s - half_nu1 * log_1k
+
+def _garch11_t_loglik(
+    params: np.ndarray,
+    y: np.ndarray,
+    backcast: float,
+    sigma2: np.ndarray,
+    grad: np.ndarray,
+) -> float:
+    """
+    Log-likelihood of GARCH(1,1) with standardized Student-t errors and constant mean.
+
+    params = [mu, omega, alpha, beta, nu]. The variance recursion starts from
+    backcast like arch (sigma2[0] = omega + (alpha + beta) * backcast).
+    """
+    from scipy.special import gammaln, digamma
+
+    nu = params[4]
+    n = y.shape[0]
+    loglik = _garch11_t_kernel(params, y, backcast, sigma2, grad)
+    loglik += n * (gammaln(0.5 * (nu + 1)) - gammaln(0.5 * nu) - 0.5 * np.log(np.pi * (nu - 2)))
+    grad[4] += n * (0.5 * digamma(0.5 * (nu + 1)) - 0.5 * digamma(0.5 * nu) - 0.5 / (nu - 2))
+    return loglik
+
 class GARCHModel:
-    pass
+    """
+    Lean GARCH(1,1) with constant mean and standardized Student-t errors.
+
+    Fast path next to arch for walk-forward refits and universe scans: it only
+    returns parameters and the variance path. The likelihood and its analytic
+    gradient run in one (numba-compiled when available) loop and are optimized
+    with scipy SLSQP under the same bounds and stationarity constraint as arch,
+    starting the recursion from the same backcast.
 
+    Returns are scaled by 100 internally, like fit_garch_11.
+    """
+    param_names = ["mu", "omega", "alpha", "beta", "nu"]
+
+    def __init__(
+        self,
+        annualization: int = 252,
+        scale: float = 100.0,
+    ):
+        self.annualization = annualization
+        self.scale = scale
+        self.params_ = None
+        self.loglik_ = None
+        self.converged_ = None
+        self.index_ = None
+        self.sigma2_ = None  # In-sample variance path in scaled units
+        self._y = None
+
+    @staticmethod
+    def backcast(resid: np.ndarray) -> float:
+        """
+        Exponentially weighted mean of the first 75 squared residuals (as in arch).
+        """
+        tau = min(75, resid.shape[0])
+        w = 0.94 ** np.arange(tau)
+        return float(np.sum(resid[:tau] ** 2 * (w / w.sum())))
+
+    def loglikelihood(
+        self,
+        params: np.ndarray,
+        y: np.ndarray,
+        backcast: float | None = None,
+    ) -> tuple[float, np.ndarray, np.ndarray]:
+        """
+        Log-likelihood, gradient and variance path for scaled returns y.
+        """
+        y = np.ascontiguousarray(y, dtype=np.float64)
+        if backcast is None:
+            backcast = self.backcast(y - y.mean())
+        sigma2 = np.empty_like(y)
+        grad = np.empty(5)
+        loglik = _garch11_t_loglik(np.asarray(params, dtype=np.float64), y, backcast, sigma2, grad)
+        return loglik, grad, sigma2
+
+    def _starting_values(
+        self,
+        y: np.ndarray,
+    ) -> np.ndarray:
+        var = y.var()
+        return np.array([y.mean(), 0.05 * var, 0.08, 0.87, 8.0])
+
+    def _bounds(
+        self,
+        y: np.ndarray,
+    ) -> list[tuple[float, float]]:
+        mean_abs, var = abs(y.mean()), y.var()
+        return [
+            (-10 * mean_abs, 10 * mean_abs) if mean_abs > 0 else (-np.inf, np.inf),
+            (1e-6 * var, 10 * var),
+            (0.0, 1.0),
+            (0.0, 1.0),
+            (2.05, 500.0),
+        ]
+
+    @profiled()
+    def fit(
+        self,
+        returns: pd.Series | np.ndarray,
+        starting_values: np.ndarray | None = None,
+    ) -> "GARCHModel":
+        """
+        Maximum likelihood fit. starting_values (e.g. the previous fit) warm-starts the optimizer.
+        """
+        self.index_ = returns.index if isinstance(returns, pd.Series) else None
+        y = self.scale * np.asarray(returns, dtype=np.float64)
+        if np.isnan(y).any():
+            raise ValueError("returns contain NaN values; drop them before fitting.")
+
+        backcast = self.backcast(y - y.mean())
+        bounds = self._bounds(y)
+        x0 = self._starting_values(y) if starting_values is None else np.asarray(starting_values, dtype=float)
+        x0 = np.clip(_feasible_start(x0), [b[0] for b in bounds], [b[1] for b in bounds])
+
+        n = y.shape[0]
+        sigma2 = np.empty_like(y)
+        grad = np.empty(5)
+
+        from scipy.optimize import minimize
+
+        def objective(x):
+            loglik = _garch11_t_loglik(x, y, backcast, sigma2, grad)
+            return -loglik / n, -grad / n
+
+        opt = minimize(
+            objective,
+            x0,
+            jac=True,
+            method="SLSQP",
+            bounds=bounds,
+            constraints=[{
+                "type": "ineq",
+                "fun": lambda x: 1.0 - x[2] - x[3],
+                "jac": lambda x: np.array([0.0, 0.0, -1.0, -1.0, 0.0]),
+            }],
+            options={"ftol": 1e-10, "maxiter": 200},
+        )
+
+        self.params_ = opt.x
+        self.converged_ = bool(opt.success)
+        self.loglik_, _, self.sigma2_ = self.loglikelihood(opt.x, y, backcast)
+        self._y = y
+        return self
+
+    @property
+    def conditional_volatility(self) -> pd.Series | np.ndarray:
+        """
+        Annualized in-sample conditional volatility in return units.
+        """
+        vol = np.sqrt(self.annualization * self.sigma2_) / self.scale
+        if self.index_ is None:
+            return vol
+        return pd.Series(vol, self.index_, name="garch_11_vol")
+
+    def forecast_variance(self) -> float:
+        """
+        One-step-ahead variance (scaled units) after the last fitted observation.
+        """
+        mu, omega, alpha, beta = self.params_[:4]
+        e = self._y[-1] - mu
+        return omega + alpha * e * e + beta * self.sigma2_[-1]
+
+@profiled()
 def fit_garch_11(
     returns: pd.Series,
     annualization: int = 252,
@@ -15,8 +280,10 @@ def fit_garch_11(
     -----
     Model parameters are estimated on the full sample. The resulting conditional
     volatility series is for diagnostic comparison against realized volatility,
-    not a walk-forward forecast.
+    not a walk-forward forecast. Use garch_walk_forward for out-of-sample forecasts.
     """
+    from arch import arch_model
+
     garch = arch_model(
         100 * returns,  # Scaled by 100 for stable modeling (will be removed later)
         mean = "Constant",
@@ -31,3 +298,309 @@ def fit_garch_11(
     cond_vol.name = "garch_11_vol"
 
     return cond_vol
+
+@_maybe_njit
+def _garch11_recursion(
+    resid: np.ndarray,
+    omega: float,
+    alpha: float,
+    beta: float,
+    sigma2_init: float,
+) -> np.ndarray:
+    """
+    GARCH(1,1) variance recursion with fixed parameters.
+
+    Returns an array of length len(resid) + 1 with
+        sigma2[0] = sigma2_init
+        sigma2[t + 1] = omega + alpha * resid[t]**2 + beta * sigma2[t]
+    so sigma2[t] is the variance of period t and sigma2[-1] is the one-step forecast.
+    """
+    sigma2 = np.empty(len(resid) + 1)
+    sigma2[0] = sigma2_init
+    for i in range(len(resid)):
+        sigma2[i + 1] = omega + alpha * resid[i] ** 2 + beta * sigma2[i]
+    return sigma2
+
+def _feasible_start(
+    params: np.ndarray,
+    max_persistence: float = 0.998,
+) -> np.ndarray:
+    """
+    Pull a warm-start vector [mu, omega, alpha, beta, nu] strictly inside the
+    stationarity constraint so the optimizer does not discard it.
+    """
+    params = np.array(params, dtype=float)
+    persistence = params[2] + params[3]
+    if persistence >= max_persistence:
+        params[2:4] *= max_persistence / persistence
+    params[1] = max(params[1], 1e-8)
+    params[4] = max(params[4], 2.1)
+    return params
+
+def _fit_garch11_arch(
+    y: np.ndarray,
+    starting_values: np.ndarray | None = None,
+) -> tuple[np.ndarray, float]:
+    """
+    Fit GARCH(1,1)-t with arch on already scaled returns.
+
+    Returns (params [mu, omega, alpha, beta, nu], variance of the last observation).
+    """
+    if starting_values is not None:
+        starting_values = _feasible_start(starting_values)
+
+    from arch import arch_model
+
+    garch = arch_model(y, mean="Constant", vol="GARCH", p=1, o=0, q=1, dist="t", rescale=False)
+    results = garch.fit(disp="off", starting_values=starting_values, show_warning=False)
+    return results.params.to_numpy(), results.conditional_volatility[-1] ** 2
+
+def _fit_garch11_native(
+    y: np.ndarray,
+    starting_values: np.ndarray | None = None,
+) -> tuple[np.ndarray, float]:
+    """
+    Same contract as _fit_garch11_arch using the lean GARCHModel engine.
+    """
+    model = GARCHModel(scale=1.0).fit(y, starting_values=starting_values)
+    return model.params_, model.sigma2_[-1]
+
+_GARCH11_ENGINES = {
+    "arch": _fit_garch11_arch,
+    "native": _fit_garch11_native,
+}
+
+def _refit_positions(
+    dates: pd.Index,
+    first: int,
+    refit_every: str | int,
+) -> np.ndarray:
+    """
+    Positions (>= first) at which the model is re-estimated.
+
+    refit_every is either a number of observations or a pandas period alias
+    ("D", "W", "M", ...), in which case the first date of each new period refits.
+    """
+    positions = np.arange(first, len(dates))
+    if isinstance(refit_every, (int, np.integer)):
+        if refit_every < 1:
+            raise ValueError(f"refit_every must be positive, got {refit_every}")
+        return positions[(positions - first) % refit_every == 0]
+
+    periods = pd.DatetimeIndex(dates[first:]).to_period(refit_every).asi8
+    new_period = np.r_[True, periods[1:] != periods[:-1]]
+    return positions[new_period]
+
+@profiled()
+def garch_walk_forward(
+    returns: pd.Series,
+    refit_every: str | int = "M",
+    window: int | None = None,
+    min_obs: int = 500,
+    annualization: int = 252,
+    engine: str = "arch",
+) -> dict[str, pd.DataFrame | pd.Series]:
+    """
+    Out-of-sample one-step-ahead GARCH(1,1)-t volatility forecasts.
+
+    At each refit date the model is re-estimated on an expanding window
+    (window=None) or the last `window` observations, warm-started from the
+    previous parameter vector. Between refits the parameters stay fixed and the
+    variance recursion is rolled forward one observation at a time, so only
+    information up to date t is used for the forecast made at t.
+
+    Parameters:
+        returns (pd.Series): Log returns without NaNs.
+        refit_every (str | int): Pandas period alias ("D", "W", "M") or number of observations.
+        window (int | None): Rolling estimation window, None for expanding.
+        min_obs (int): Observations required before the first forecast.
+        annualization (int): Annualization factor, 1 for daily volatility.
+        engine (str): "arch" or "native" (GARCHModel fast path).
+
+    Returns a dictionary:
+        - "forecast" -> volatility forecast for the next day, indexed by the
+          date it is made (row t forecasts t+1, ready for backtest_var)
+        - "forecast_by_target" -> the same forecasts indexed by the date they
+          apply to, for plotting against returns (the forecast past the last
+          date is dropped)
+        - "params" -> fitted parameters indexed by refit date
+    """
+    if returns.isna().any():
+        raise ValueError("returns contain NaN values; drop them before walk-forward fitting.")
+    if len(returns) < min_obs:
+        raise ValueError(f"Need at least {min_obs} observations, got {len(returns)}")
+
+    if engine not in _GARCH11_ENGINES:
+        raise ValueError(f"Unknown engine '{engine}', expected one of {list(_GARCH11_ENGINES)}")
+    fit = _GARCH11_ENGINES[engine]
+
+    y = 100 * returns.to_numpy(dtype=float)  # Scaled by 100 for stable modeling (will be removed later)
+    refits = _refit_positions(returns.index, min_obs - 1, refit_every)
+    bounds = np.r_[refits, len(y)]
+
+    sigma2_forecast = np.full(len(y), np.nan)
+    params_history = []
+    params = None
+    for origin, stop in zip(bounds[:-1], bounds[1:]):
+        start = 0 if window is None else max(origin + 1 - window, 0)
+        params, sigma2_origin = fit(y[start:origin + 1], starting_values=params)
+        params_history.append(params)
+
+        # Roll forward with fixed parameters until the next refit
+        mu, omega, alpha, beta = params[:4]
+        sigma2 = _garch11_recursion(y[origin:stop] - mu, omega, alpha, beta, sigma2_origin)
+        sigma2_forecast[origin:stop] = sigma2[1:]
+
+    forecast = pd.Series(np.sqrt(annualization * sigma2_forecast) / 100, returns.index)
+    forecast.name = "garch_11_forecast_vol"
+
+    params = pd.DataFrame(
+        params_history,
+        index=returns.index[refits],
+        columns=["mu", "omega", "alpha", "beta", "nu"],
+    )
+    return {
+        "forecast": forecast.iloc[min_obs - 1:],
+        "forecast_by_target": pd.Series(
+            forecast.to_numpy()[min_obs - 1:-1], returns.index[min_obs:], name=forecast.name,
+        ),
+        "params": params,
+    }
+
+def _fit_garch_column(
+    y: np.ndarray,
+    spec: dict[str, Any],
+    engine: str = "arch",
+) -> tuple[pd.Series, np.ndarray]:
+    """
+    Fit one model on scaled returns (NaNs dropped) and return
+    (params, conditional volatility aligned to y with NaN where y is NaN).
+    """
+    valid = ~np.isnan(y)
+    cond_vol = np.full(len(y), np.nan)
+
+    if engine == "native":
+        model = GARCHModel(scale=1.0).fit(y[valid])
+        cond_vol[valid] = np.sqrt(model.sigma2_)
+        return pd.Series(model.params_, index=["mu", "omega", "alpha[1]", "beta[1]", "nu"]), cond_vol
+
+    from arch import arch_model
+
+    garch = arch_model(y[valid], rescale=False, **spec)
+    results = garch.fit(disp="off", show_warning=False)
+    cond_vol[valid] = results.conditional_volatility
+    return results.params, cond_vol
+
+def _fit_garch_columns(
+    y: np.ndarray,
+    columns: list[int],
+    spec: dict[str, Any],
+    engine: str = "arch",
+) -> list[tuple[int, pd.Series | None, np.ndarray | None, str | None]]:
+    """
+    Fit the given columns of y one by one; failures are returned as messages instead of raised.
+    """
+    out = []
+    for j in columns:
+        try:
+            params, cond_vol = _fit_garch_column(y[:, j].copy(), spec, engine)
+            out.append((j, params, cond_vol, None))
+        except Exception as exc:
+            out.append((j, None, None, f"{type(exc).__name__}: {exc}"))
+    return out
+
+def _fit_garch_chunk(
+    shm_name: str,
+    shape: tuple[int, int],
+    columns: list[int],
+    spec: dict[str, Any],
+    engine: str = "arch",
+) -> list[tuple[int, pd.Series | None, np.ndarray | None, str | None]]:
+    """
+    Worker task: attach to the shared returns matrix and fit a chunk of columns.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        y = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        return _fit_garch_columns(y, columns, spec, engine)
+    finally:
+        shm.close()
+
+@profiled()
+def fit_garch_universe(
+    returns: pd.DataFrame,
+    spec: dict[str, Any] | None = None,
+    n_jobs: int | None = None,
+    annualization: int = 252,
+    chunks_per_worker: int = 4,
+    engine: str = "arch",
+) -> dict[str, Any]:
+    """
+    Fit a univariate GARCH to every column of a returns frame in parallel.
+
+    The returns matrix is placed in shared memory once; workers attach to it
+    and receive only column indices, in chunks of several assets per task.
+    A failing asset is recorded in "errors" and does not stop the run.
+
+    Parameters:
+        returns (pd.DataFrame): One column per asset. If any column ends with
+            "_Log_Return" only those are used and the suffix is dropped.
+        spec (dict): arch_model keyword arguments, defaults to GARCH(1,1)-t with constant mean.
+        n_jobs (int | None): Worker processes, None for all cores, 1 to run serially.
+        annualization (int): Annualization factor for the volatility, 1 for daily.
+        chunks_per_worker (int): Tasks per worker, trades load balance against dispatch overhead.
+        engine (str): "arch", or "native" for the GARCHModel fast path (default spec only).
+
+    Returns a dictionary:
+        - "params" -> fitted parameters, one row per asset
+        - "cond_vol" -> conditional volatility, one column per asset
+        - "errors" -> asset -> error message for fits that failed
+    """
+    spec = {**DEFAULT_GARCH_SPEC, **(spec or {})}
+    if engine == "native" and spec != DEFAULT_GARCH_SPEC:
+        raise ValueError("The native engine only supports the default GARCH(1,1)-t spec")
+    if engine not in _GARCH11_ENGINES:
+        raise ValueError(f"Unknown engine '{engine}', expected one of {list(_GARCH11_ENGINES)}")
+    if returns.columns.str.endswith("_Log_Return").any():
+        returns = returns.loc[:, returns.columns.str.endswith("_Log_Return")]
+        returns = returns.rename(columns=lambda c: c.replace("_Log_Return", ""))
+
+    assets = returns.columns
+    y = 100 * returns.to_numpy(dtype=np.float64)  # Scaled by 100 for stable modeling (will be removed later)
+    n_jobs = os.cpu_count() if n_jobs is None or n_jobs < 1 else n_jobs
+    n_jobs = min(n_jobs, len(assets))
+
+    if n_jobs <= 1:
+        results = _fit_garch_columns(y, list(range(len(assets))), spec, engine)
+    else:
+        chunk_size = max(1, -(-len(assets) // (n_jobs * chunks_per_worker)))
+        chunks = [list(range(i, min(i + chunk_size, len(assets)))) for i in range(0, len(assets), chunk_size)]
+
+        results = []
+        shm = shared_memory.SharedMemory(create=True, size=y.nbytes)
+        try:
+            np.ndarray(y.shape, dtype=np.float64, buffer=shm.buf)[:] = y
+            # forkserver/spawn avoid forking a process that already runs BLAS threads
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            with ProcessPoolExecutor(max_workers=n_jobs, mp_context=multiprocessing.get_context(method)) as pool:
+                futures = [pool.submit(_fit_garch_chunk, shm.name, y.shape, chunk, spec, engine) for chunk in chunks]
+                for future in futures:
+                    results.extend(future.result())
+        finally:
+            shm.close()
+            shm.unlink()
+
+    params, errors = {}, {}
+    cond_vol = np.full(y.shape, np.nan)
+    for j, fitted, vol, error in results:
+        if error is not None:
+            errors[assets[j]] = error
+            continue
+        params[assets[j]] = fitted
+        cond_vol[:, j] = np.sqrt(annualization) * vol / 100
+
+    return {
+        "params": pd.DataFrame(params).T.reindex(assets),
+        "cond_vol": pd.DataFrame(cond_vol, index=returns.index, columns=assets),
+        "errors": errors,
+    }
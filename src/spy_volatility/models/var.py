@@ -1,13 +1,23 @@
-from statsmodels.tsa.api import VAR
-from scipy.stats import norm, t
+from typing import Any, Sequence
+
 import numpy as np
-from scipy.stats import chi2
+import pandas as pd
+
+# statsmodels and scipy.stats are imported where they are used (seconds of import time)
 
+from spy_volatility.data.loaders import _filter_columns_by_suffix
+from spy_volatility.models.garch_models import _maybe_njit
+from spy_volatility.risk.cov_cube import CovarianceCube
+from spy_volatility.utils.profiling import profiled
 
+
+@profiled()
 def fit_var_1(
     returns: pd.DataFrame,
 ) -> dict[str, Any]:
     """
+    Full statsmodels VAR(1) fit (see fit_var for the lean numpy path).
+
     Input:
         - returns
     Return a dictionary:
@@ -18,6 +28,8 @@ def fit_var_1(
     filtered_returns = _filter_columns_by_suffix(returns, "_Log_Return")
     filtered_returns.columns = filtered_returns.columns.str.replace("_Log_Return", "")
 
+    from statsmodels.tsa.api import VAR
+
     model =  VAR(filtered_returns)
     results = model.fit(1) # 1-lag
     res = results.resid
@@ -30,6 +42,365 @@ def fit_var_1(
     }
 
 
+def _var_design(
+    y: np.ndarray,
+    p: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    VAR(p) regression rows: X[t] = [1, y[t+p-1], ..., y[t]] and target Y[t] = y[t+p].
+    """
+    n_obs, n_assets = y.shape
+    X = np.ones((n_obs - p, 1 + p * n_assets))
+    for lag in range(1, p + 1):
+        X[:, 1 + (lag - 1) * n_assets:1 + lag * n_assets] = y[p - lag:n_obs - lag]
+    return X, np.ascontiguousarray(y[p:])
+
+
+def _var_return_matrix(returns: pd.DataFrame) -> tuple[np.ndarray, pd.DatetimeIndex, pd.Index]:
+    """
+    *_Log_Return columns as a float array for VAR fitting, with their dates and asset names.
+
+    Leading rows with NaN (the first row of compute_returns) are dropped. NaN
+    after the first complete row raises a ValueError: dropping those rows
+    would make the lagged regressors span the gap.
+    """
+    filtered_returns = _filter_columns_by_suffix(returns, "_Log_Return")
+    values = filtered_returns.to_numpy(dtype=float)
+    complete = ~np.isnan(values).any(axis=1)  # Cheaper than DataFrame.dropna on wide frames
+    start = int(np.argmax(complete)) if complete.any() else len(values)
+    if not complete[start:].all():
+        gap = filtered_returns.index[start + np.argmin(complete[start:])]
+        raise ValueError(f"Log returns contain NaN at {gap} after the first complete row; fill or trim gaps before fitting a VAR.")
+    assets = filtered_returns.columns.str.replace("_Log_Return", "")
+    return values[start:], filtered_returns.index[start:], assets
+
+
+def _triangular_solve(
+    X: np.ndarray,
+    Y: np.ndarray,
+    method: str = "normal",
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Least squares of Y on X through an upper-triangular R with R'R = X'X.
+
+    method="normal" takes R from a Cholesky factorization of X'X (about 2-3x
+    faster for wide designs) and falls back to QR when X'X is not numerically
+    positive definite; method="qr" uses R of a reduced QR of X.
+    Returns (B, R, Z) with Z = R^-T X'Y (= Q'Y), so B = R^-1 Z.
+    """
+    from scipy.linalg import solve_triangular
+
+    if method not in ("normal", "qr"):
+        raise ValueError(f"Unknown method '{method}'. Available: ['normal', 'qr']")
+    if method == "normal":
+        try:
+            R = np.linalg.cholesky(X.T @ X).T
+        except np.linalg.LinAlgError:
+            method = "qr"
+        else:
+            Z = solve_triangular(R, X.T @ Y, trans="T")
+    if method == "qr":
+        Q, R = np.linalg.qr(X)
+        Z = Q.T @ Y
+    return solve_triangular(R, Z), R, Z
+
+
+def _var_info_criteria(
+    sigma_mle: np.ndarray,
+    nobs: int,
+    p: int,
+) -> dict[str, float]:
+    """
+    Log-likelihood and information criteria of a VAR(p) with intercept, as
+    statsmodels computes them from the ML residual covariance (SSR / nobs).
+    """
+    n_assets = sigma_mle.shape[0]
+    _, logdet = np.linalg.slogdet(sigma_mle)
+    free_params = p * n_assets ** 2 + n_assets
+    df_model = p * n_assets + 1
+    return {
+        "llf": -0.5 * nobs * (n_assets * np.log(2 * np.pi) + logdet + n_assets),
+        "aic": logdet + 2.0 / nobs * free_params,
+        "bic": logdet + np.log(nobs) / nobs * free_params,
+        "hqic": logdet + 2.0 * np.log(np.log(nobs)) / nobs * free_params,
+        "fpe": ((nobs + df_model) / (nobs - df_model)) ** n_assets * np.exp(logdet),
+    }
+
+
+@profiled()
+def fit_var(
+    returns: pd.DataFrame,
+    p: int = 1,
+    full_stats: bool = False,
+    method: str = "normal",
+) -> dict[str, Any]:
+    """
+    VAR(p) with intercept by least squares on one triangular factorization, in numpy form.
+
+    Gives the same estimates as statsmodels VAR(returns).fit(p) without
+    building a results object (standard errors, information criteria and
+    residual DataFrames are skipped unless full_stats=True).
+
+    Parameters:
+        returns (pd.DataFrame): *_Log_Return columns are used; leading NaN rows are dropped, later NaN raises.
+        p (int): Number of lags.
+        full_stats (bool): Also return stderr / tvalues of every coefficient,
+            log-likelihood and aic / bic / hqic / fpe.
+        method (str): "normal" (Cholesky of X'X, QR fallback) or "qr" (see _triangular_solve).
+
+    Returns a dictionary:
+        - "intercept" -> (N,) array
+        - "coefs" -> (p, N, N) array, y_t = intercept + sum_i coefs[i] @ y_{t-1-i} + u_t
+        - "residuals" -> (T - p, N) array
+        - "innovation_cov" -> (N, N) residual covariance, SSR / (T - p - k) like statsmodels sigma_u
+        - "assets", "dates" -> asset names and the dates of the residual rows
+        - with full_stats: "stderr", "tvalues" ((1 + pN, N), intercept row first),
+          "llf", "aic", "bic", "hqic", "fpe"
+    """
+    y, index, assets = _var_return_matrix(returns)
+    X, Y = _var_design(y, p)
+    nobs, n_regressors = X.shape
+    n_assets = Y.shape[1]
+    if nobs <= n_regressors:
+        raise ValueError(f"{nobs} observations for {n_regressors} regressors per equation")
+
+    B, R, _ = _triangular_solve(X, Y, method)
+    resid = Y - X @ B
+    ssr = resid.T @ resid
+    out = {
+        "intercept": B[0].copy(),
+        "coefs": np.ascontiguousarray(B[1:].reshape(p, n_assets, n_assets).transpose(0, 2, 1)),
+        "residuals": resid,
+        "innovation_cov": ssr / (nobs - n_regressors),
+        "assets": assets,
+        "dates": index[p:],
+    }
+
+    if full_stats:
+        from scipy.linalg import solve_triangular
+
+        R_inv = solve_triangular(R, np.eye(n_regressors))
+        xtx_inv_diag = np.einsum("ij,ij->i", R_inv, R_inv)  # diag of (X'X)^-1 = R^-1 R^-T
+        stderr = np.sqrt(np.outer(xtx_inv_diag, np.diag(out["innovation_cov"])))
+        out["stderr"] = stderr
+        out["tvalues"] = B / stderr
+        out.update(_var_info_criteria(ssr / nobs, nobs, p))
+    return out
+
+
+@profiled()
+def select_var_order(
+    returns: pd.DataFrame,
+    maxlags: int = 5,
+    ic: str = "aic",
+    method: str = "normal",
+) -> dict[str, Any]:
+    """
+    Information criteria of VAR(1) .. VAR(maxlags) on a common sample.
+
+    One lagged design matrix with maxlags lags is built and factorized once:
+    the VAR(p) design is its first 1 + pN columns, and the leading block of
+    the triangular factor R (R'R = X'X) is the factor of that design. So the
+    residual cross-product of every p is Y'Y - Z_p'Z_p, where Z_p are the
+    first 1 + pN rows of Z = R^-T X'Y. Like statsmodels select_order, every p
+    is fitted on the last T - maxlags observations.
+
+    Parameters:
+        returns (pd.DataFrame): *_Log_Return columns are used; leading NaN rows are dropped, later NaN raises.
+        maxlags (int): Largest lag order tried.
+        ic (str): Criterion used to pick the order: aic, bic, hqic or fpe.
+        method (str): "normal" or "qr" (see _triangular_solve).
+
+    Returns a dictionary:
+        - "criteria" -> DataFrame indexed by p with aic, bic, hqic and fpe columns
+        - "selected" -> p minimizing ic
+    """
+    if ic not in ("aic", "bic", "hqic", "fpe"):
+        raise ValueError(f"Unknown information criterion '{ic}'")
+
+    y, _, _ = _var_return_matrix(returns)
+    X, Y = _var_design(y, maxlags)
+    nobs, n_assets = Y.shape
+    if nobs <= X.shape[1]:
+        raise ValueError(f"{nobs} observations for {X.shape[1]} regressors per equation at maxlags={maxlags}")
+
+    _, _, Z = _triangular_solve(X, Y, method)
+    yty = Y.T @ Y
+    rows = []
+    for p in range(1, maxlags + 1):
+        Z_p = Z[:1 + p * n_assets]
+        criteria = _var_info_criteria((yty - Z_p.T @ Z_p) / nobs, nobs, p)
+        rows.append({key: criteria[key] for key in ("aic", "bic", "hqic", "fpe")})
+
+    table = pd.DataFrame(rows, index=pd.RangeIndex(1, maxlags + 1, name="p"))
+    return {
+        "criteria": table,
+        "selected": int(table[ic].idxmin()),
+    }
+
+
+def _weighted_ls_state(
+    X: np.ndarray,
+    Y: np.ndarray,
+    forgetting: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Exact least-squares state of the rows X, Y with weights forgetting**age
+    (the last row has age 0): P = (X'WX)^-1, B and the residual cross-product S.
+    """
+    w = forgetting ** np.arange(len(X) - 1, -1, -1, dtype=float)
+    Xw = X * w[:, None]
+    P = np.linalg.inv(Xw.T @ X)
+    B = P @ (Xw.T @ Y)
+    resid = Y - X @ B
+    S = (resid * w[:, None]).T @ resid
+    return P, B, S
+
+
+@_maybe_njit
+def _rls_var_kernel(
+    X: np.ndarray,
+    Y: np.ndarray,
+    start: int,
+    stop: int,
+    forgetting: float,
+    window: int,
+    P: np.ndarray,
+    B: np.ndarray,
+    S: np.ndarray,
+    B_out: np.ndarray,
+    S_out: np.ndarray,
+    E_out: np.ndarray,
+) -> None:
+    """
+    Recursive least squares over rows start..stop-1, updating P, B and S in place.
+
+    Each row is added with a rank-one (Sherman-Morrison) update after the
+    older rows are discounted by forgetting. With window > 0 the row leaving
+    the window (weight forgetting**window by then) is removed with the
+    matching rank-one downdate. E_out[t] is the a-priori (one-step forecast)
+    error of row t; B_out[t] and S_out[t] hold the state after row t.
+    """
+    w_old = forgetting ** window
+    for t in range(start, stop):
+        x = X[t]
+        Px = np.dot(P, x)
+        denom = forgetting + np.dot(x, Px)
+        e = Y[t] - np.dot(x, B)
+        E_out[t] = e
+        g = Px / denom
+        B += np.outer(g, e)
+        P -= np.outer(g, Px)
+        P /= forgetting
+        S *= forgetting
+        S += np.outer(e, e) * (forgetting / denom)
+
+        if window > 0:
+            x = X[t - window]
+            Px = np.dot(P, x)
+            denom = 1.0 - w_old * np.dot(x, Px)
+            e = Y[t - window] - np.dot(x, B)
+            g = Px * (w_old / denom)
+            B -= np.outer(g, e)
+            P += np.outer(g, Px)
+            S -= np.outer(e, e) * (w_old / denom)
+
+        # Rounding makes P drift from symmetric, which forgetting < 1 amplifies
+        P[:] = 0.5 * (P + P.T)
+        B_out[t] = B
+        S_out[t] = S
+
+
+@profiled()
+def rolling_var_rls(
+    returns: pd.DataFrame,
+    p: int = 1,
+    window: int | None = None,
+    forgetting: float = 1.0,
+    min_periods: int | None = None,
+    refresh: int = 500,
+) -> dict[str, Any]:
+    """
+    Time-varying VAR(p) with intercept, re-estimated every day by recursive least squares.
+
+    Each new day updates the coefficients and the residual cross-product in
+    O(k^2 N) (k = 1 + pN regressors) instead of refitting: expanding by
+    default, over the last window days when window is given, and with older
+    days down-weighted by forgetting**age when forgetting < 1 (the two can be
+    combined). The estimate at date t only uses data up to t, so it matches a
+    statsmodels VAR(p) fitted on the same rows (sigma_u for the covariance).
+
+    Parameters:
+        returns (pd.DataFrame): *_Log_Return columns are used; leading NaN rows are dropped, later NaN raises.
+        p (int): Number of lags.
+        window (int): Regression rows per estimate (sliding window); None for expanding.
+        forgetting (float): Exponential forgetting factor in (0, 1].
+        min_periods (int): Rows before the first estimate (default: window, else 63).
+        refresh (int): With a window, re-solve the window exactly every refresh
+            days so rounding from the downdates cannot build up.
+
+    Returns a dictionary:
+        - "intercepts" -> (T, N) array
+        - "coefs" -> (T, p, N, N) array, y_t = c + sum_i coefs[:, i] @ y_{t-1-i} + u_t
+        - "innovation_cov" -> CovarianceCube of residual covariances
+          (weighted residual cross-product / (effective rows - k))
+        - "forecast_errors" -> DataFrame of a-priori one-step errors (NaN during warm-up)
+        - "dates" -> DatetimeIndex of the T estimates
+    """
+    y, index, assets = _var_return_matrix(returns)
+    n_assets = len(assets)
+    n_regressors = 1 + p * n_assets
+
+    if not 0 < forgetting <= 1:
+        raise ValueError(f"forgetting must be in (0, 1], got {forgetting}")
+    if min_periods is None:
+        min_periods = window if window is not None else 63
+    if window is not None and min_periods != window:
+        raise ValueError("min_periods must equal window for a sliding window")
+    if min_periods <= n_regressors:
+        raise ValueError(f"min_periods={min_periods} leaves no degrees of freedom for {n_regressors} regressors")
+
+    X, Y = _var_design(y, p)
+    n_rows = len(X)
+    if n_rows < min_periods:
+        raise ValueError(f"{n_rows} regression rows, need at least min_periods={min_periods}")
+
+    # Effective rows behind each estimate: sum of forgetting**age over the rows used
+    first = min_periods - 1
+    used = np.full(n_rows - first, window) if window is not None else np.arange(min_periods, n_rows + 1)
+    n_eff = used if forgetting == 1 else (1 - forgetting ** used) / (1 - forgetting)
+    if n_eff[0] <= n_regressors:
+        raise ValueError(f"forgetting={forgetting} keeps fewer effective rows than the {n_regressors} regressors")
+
+    B_out = np.empty((n_rows, n_regressors, n_assets))
+    S_out = np.empty((n_rows, n_assets, n_assets))
+    E_out = np.full((n_rows, n_assets), np.nan)
+
+    P, B, S = _weighted_ls_state(X[:min_periods], Y[:min_periods], forgetting)
+    B_out[first], S_out[first] = B, S
+
+    step = refresh if window is not None else n_rows
+    for start in range(min_periods, n_rows, step):
+        stop = min(start + step, n_rows)
+        _rls_var_kernel(X, Y, start, stop, forgetting, window or 0, P, B, S, B_out, S_out, E_out)
+        if window is not None and stop < n_rows:
+            P, B, S = _weighted_ls_state(X[stop - window:stop], Y[stop - window:stop], forgetting)
+            B_out[stop - 1], S_out[stop - 1] = B, S
+
+    B_out, S_out = B_out[first:], S_out[first:]
+    dates = index[p + first:]
+    cov = S_out / (n_eff - n_regressors)[:, None, None]
+    coefs = B_out[:, 1:, :].reshape(len(dates), p, n_assets, n_assets).transpose(0, 1, 3, 2)
+
+    return {
+        "intercepts": B_out[:, 0, :].copy(),
+        "coefs": np.ascontiguousarray(coefs),
+        "innovation_cov": CovarianceCube(cov, dates, assets),
+        "forecast_errors": pd.DataFrame(E_out, index=index[p:], columns=assets),
+        "dates": dates,
+    }
+
+
 def gaussian_var(
     mu: float,
     sigma: float,
@@ -47,6 +418,8 @@ def gaussian_var(
     Returns:
         float: The VaR at the given confidence level.
     """
+    from scipy.stats import norm
+
     return mu - sigma * norm.ppf(alpha)
 
 
@@ -69,6 +442,8 @@ def student_t_var(
     Returns:
         float: The VaR at the given confidence level.
     """
+    from scipy.stats import t
+
     return mu - sigma * t.ppf(alpha, nu)
 
 
@@ -89,6 +464,8 @@ def LRuc(
     Returns:
         float: The likelihood ratio statistic for unconditional coverage (LRuc) and p-value.
     """
+    from scipy.stats import chi2
+
     eps = 1e-12
     alpha = np.clip(alpha, eps, 1 - eps)
     p_hat = np.clip(x / T, eps, 1 - eps)
@@ -98,4 +475,102 @@ def LRuc(
 
     LR = -2 * (null - alt)
     p_value = 1 - chi2.cdf(LR, df=1)
-    return LR, p_value
\ No newline at end of file
+    return LR, p_value
+
+
+def _var_quantiles(
+    alphas: Sequence[float],
+    dists: dict[str, float | None],
+) -> np.ndarray:
+    """
+    Standardized quantiles used by gaussian_var / student_t_var, shape (D, K).
+
+    Row d holds ppf(1 - alpha_k) for distribution d (nu=None -> Gaussian),
+    so VaR = mu - sigma * q.
+    """
+    from scipy.stats import norm, t
+
+    levels = 1 - np.asarray(alphas, dtype=float)
+    return np.array([
+        norm.ppf(levels) if nu is None else t.ppf(levels, nu)
+        for nu in dists.values()
+    ])
+
+
+@profiled()
+def backtest_var(
+    returns: pd.Series,
+    sigma_panel: pd.DataFrame,
+    models: Sequence[str] | None = None,
+    alphas: Sequence[float] = (0.01, 0.05),
+    dists: dict[str, float | None] | None = None,
+    mu: float = 0.0,
+) -> dict[str, pd.DataFrame]:
+    """
+    Vectorized walk-forward VaR backtest.
+
+    The sigma forecast available at date t (row t of sigma_panel) is used for the
+    return at the next date in returns, i.e. sigma is shifted one day forward.
+    Quantiles are computed once per (distribution, alpha) and all exceedances
+    come from one broadcast comparison.
+
+    Parameters:
+        returns (pd.Series): Realized log returns.
+        sigma_panel (pd.DataFrame): One column of sigma forecasts per model (same units as returns).
+        models (list): Columns of sigma_panel to test. Defaults to all columns.
+        alphas (list): Expected violation probabilities (e.g., 0.01 for 99% VaR).
+        dists (dict): Distribution name -> Student-t degrees of freedom, None for Gaussian.
+            Defaults to {"gauss": None, "t": 8}.
+        mu (float): Mean of the returns.
+
+    Returns a dictionary:
+        - "exceedances" -> 1/0 per date with (model, distribution, alpha) columns,
+          NaN where no forecast was available
+        - "kupiec" -> one row per (model, distribution, alpha) with exceedance rate
+          and Kupiec unconditional coverage test
+    """
+    if dists is None:
+        dists = {"gauss": None, "t": 8}
+    if models is None:
+        models = list(sigma_panel.columns)
+
+    # sigma known at t applies to the return at t+1
+    sigma = sigma_panel[list(models)].reindex(returns.index).shift(1).to_numpy(dtype=float)
+    r = returns.to_numpy(dtype=float)
+    q = _var_quantiles(alphas, dists)
+
+    var = mu - sigma[:, :, None, None] * q[None, None, :, :]  # (T, M, D, K)
+    valid = ~np.isnan(var) & ~np.isnan(r)[:, None, None, None]
+    exceed = (r[:, None, None, None] < var) & valid
+
+    n_obs = valid.sum(axis=0)
+    x = exceed.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rate = x / n_obs
+        lruc, p_value = LRuc(
+            alpha=np.broadcast_to(np.asarray(alphas, dtype=float), x.shape),
+            x=x,
+            T=n_obs,
+        )
+
+    columns = pd.MultiIndex.from_product(
+        [list(models), list(dists), list(alphas)],
+        names=["model", "distribution", "alpha"],
+    )
+    exceedances = pd.DataFrame(
+        np.where(valid, exceed, np.nan).reshape(len(r), -1),
+        index=returns.index,
+        columns=columns,
+    )
+
+    kupiec = columns.to_frame(index=False)
+    kupiec["observations"] = n_obs.ravel()
+    kupiec["exceedances"] = x.ravel()
+    kupiec["exceedance_rate"] = rate.ravel()
+    kupiec["LRuc"] = lruc.ravel()
+    kupiec["LRuc p-value"] = p_value.ravel()
+
+    return {
+        "exceedances": exceedances,
+        "kupiec": kupiec,
+    }
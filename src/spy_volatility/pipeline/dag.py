@@ -0,0 +1,141 @@
+# src/spy_volatility/pipeline/dag.py
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from spy_volatility.utils.log import fields, get_logger
+from spy_volatility.utils.profiling import profile_block
+
+log = get_logger(__name__)
+
+@dataclass
+class Stage:
+    """
+    One node of a pipeline: fn is called with the artifacts of deps as keyword
+    arguments (named after the dependency stages) and returns this stage's artifact.
+    """
+    name: str
+    fn: Callable[..., Any]
+    deps: List[str] = field(default_factory=list)
+
+class Pipeline:
+    """
+    Declarative DAG of stages. Each artifact is computed at most once per run
+    and independent stages run concurrently on a thread pool.
+
+    Usage:
+        pipe = Pipeline()
+
+        @pipe.stage(deps=["prices"])
+        def returns(prices):
+            return compute_returns(prices)
+
+        artifacts = pipe.run(targets=["returns"])
+    """
+    def __init__(self, name: str = "pipeline"):
+        self.name = name
+        self.stages: Dict[str, Stage] = {}
+        self.timings: Dict[str, float] = {}
+
+    def add(self, name: str, fn: Callable[..., Any], deps: Sequence[str] = ()) -> Stage:
+        if name in self.stages:
+            raise ValueError(f"Stage '{name}' is already defined")
+        stage = Stage(name, fn, list(deps))
+        self.stages[name] = stage
+        return stage
+
+    def stage(self, name: Optional[str] = None, deps: Sequence[str] = ()) -> Callable:
+        """
+        Decorator form of add(); the stage name defaults to the function name.
+        """
+        def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+            self.add(name or fn.__name__, fn, deps)
+            return fn
+        return decorator
+
+    def order(self, targets: Optional[Iterable[str]] = None, available: Iterable[str] = ()) -> List[str]:
+        """
+        Stages needed for targets (default: all) in a valid execution order.
+        Stages in available are treated as already computed, so their own
+        dependencies are not pulled in. Raises on unknown stages and dependency cycles.
+        """
+        targets = list(self.stages) if targets is None else list(targets)
+        ordered: List[str] = []
+        state: Dict[str, str] = {name: "done" for name in available}
+
+        def visit(name: str, path: List[str]) -> None:
+            if name not in self.stages:
+                raise KeyError(f"Unknown stage '{name}'" + (f" (required by '{path[-1]}')" if path else ""))
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                raise ValueError(f"Dependency cycle: {' -> '.join(path + [name])}")
+            state[name] = "visiting"
+            for dep in self.stages[name].deps:
+                visit(dep, path + [name])
+            state[name] = "done"
+            ordered.append(name)
+
+        for target in targets:
+            visit(target, [])
+        return ordered
+
+    def run(
+        self,
+        targets: Optional[Iterable[str]] = None,
+        max_workers: int = 4,
+        artifacts: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Execute the stages needed for targets and return every computed artifact.
+
+        Parameters:
+          targets: stage names to produce (default: every stage)
+          max_workers: threads for independent stages (1 runs sequentially)
+          artifacts: precomputed artifacts; stages with an entry here are not run
+
+        A failing stage stops scheduling; stages already running finish, then
+        a RuntimeError naming the stage is raised from the original error.
+        """
+        done: Dict[str, Any] = dict(artifacts or {})
+        needed = self.order(targets, available=done)
+        pending = list(needed)
+        start_run = time.perf_counter()
+
+        def execute(stage: Stage) -> Any:
+            start = time.perf_counter()
+            with profile_block(f"{self.name}.{stage.name}"):
+                result = stage.fn(**{dep: done[dep] for dep in stage.deps})
+            self.timings[stage.name] = time.perf_counter() - start
+            log.info("Stage done", extra=fields(pipeline=self.name, stage=stage.name, elapsed=self.timings[stage.name]))
+            return result
+
+        running = {}
+        error = None
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            while pending or running:
+                if error is None:
+                    ready = [n for n in pending if all(d in done for d in self.stages[n].deps)]
+                    for name in ready:
+                        pending.remove(name)
+                        running[pool.submit(execute, self.stages[name])] = name
+
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        done[name] = future.result()
+                    except Exception as exc:
+                        if error is None:
+                            error = (name, exc)
+
+        if error is not None:
+            name, exc = error
+            raise RuntimeError(f"[{self.name}] Stage '{name}' failed: {exc}") from exc
+
+        log.info("Pipeline done", extra=fields(pipeline=self.name, stages=len(needed), elapsed=time.perf_counter() - start_run))
+        return done
@@ -0,0 +1,270 @@
+# src/spy_volatility/pipeline/figures.py
+
+from pathlib import Path
+from typing import Tuple
+
+import matplotlib.dates as mdates
+import numpy as np
+import pandas as pd
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+
+# Figures are built on matplotlib.figure.Figure directly (no pyplot state),
+# so independent figures can be drawn from different threads or processes.
+# Plot functions take precomputed data only; see pipeline/render.py.
+
+def _save(fig: Figure, path, **kwargs) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(path, **kwargs)
+    return path
+
+def regime_intervals(mask) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Run-length encode a 0/1 mask into [start, end] row positions of each run of 1s.
+    end is the first row after the run, or the last row if the run reaches the end.
+    """
+    flags = np.asarray(mask, dtype=bool).astype(np.int8)
+    edges = np.diff(np.concatenate(([0], flags, [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.minimum(np.flatnonzero(edges == -1), len(flags) - 1)
+    return starts, ends
+
+def shade_intervals(ax, x_start, x_end, **kwargs) -> PolyCollection:
+    """
+    Shade full-height vertical bands [x_start[i], x_end[i]] as one collection
+    (x in data units, y spanning the axes), instead of one axvspan per band.
+    """
+    x0 = np.asarray(x_start, dtype=float)
+    x1 = np.asarray(x_end, dtype=float)
+    verts = np.stack([
+        np.column_stack([x0, np.zeros_like(x0)]),
+        np.column_stack([x0, np.ones_like(x0)]),
+        np.column_stack([x1, np.ones_like(x1)]),
+        np.column_stack([x1, np.zeros_like(x1)]),
+    ], axis=1)
+    bands = PolyCollection(verts, transform=ax.get_xaxis_transform(), **kwargs)
+    ax.add_collection(bands, autolim=False)
+    return bands
+
+def plot_realized_volatility(rv: pd.Series, path) -> Path:
+    fig = Figure(figsize=(10, 5))
+    rv.plot(ax=fig.subplots(), title="Realized Volatility")
+    return _save(fig, path)
+
+def plot_log_returns(log_returns: pd.Series, path) -> Path:
+    fig = Figure(figsize=(10, 5))
+    log_returns.plot(ax=fig.subplots(), title="Log Returns")
+    return _save(fig, path)
+
+def plot_garch_vs_rv(rv21: pd.Series, garch_vol: pd.Series, path) -> Path:
+    # Concat rv21 and GARCH
+    rv_vs_garch = pd.concat([rv21, garch_vol], axis=1)
+    rv_vs_garch.columns = ["RV21", "GARCH11"]
+    rv_vs_garch = rv_vs_garch.dropna()
+
+    fig = Figure(figsize=(10, 5))
+    ax = rv_vs_garch.plot(ax=fig.subplots())
+    ax.set_title("Volatility Comparison")
+    ax.set_ylabel("Annualized Volatility")
+    ax.legend()
+    return _save(fig, path)
+
+def plot_covariance_fragility(rolling_diagnostic: pd.DataFrame, path) -> Path:
+    # Plot covariance diagnostic vs time
+    fig = Figure(figsize=(10, 8))
+    axes = fig.subplots(nrows=3, ncols=1, sharex=True)
+
+    rolling_diagnostic["min_eigenvalue"].plot(ax=axes[0], title="Min Eigenvalue")
+    rolling_diagnostic["max_eigenvalue"].plot(ax=axes[1], title="Max Eigenvalue")
+    rolling_diagnostic["condition_number"].plot(ax=axes[2], title="Condition Number")
+
+    fig.tight_layout()
+    return _save(fig, path)
+
+def plot_rolling_vs_var_diagnostics(rolling_diagnostic: pd.DataFrame, innov_diagnostic: dict, path) -> Path:
+    # Plot rolling vs VAR diagnostics
+    fig = Figure(figsize=(16, 8))  # wide enough so text never overlaps
+    axes = fig.subplots(3, 1, sharex=True)
+
+    metrics = [
+        ("min_eigenvalue", "Min Eigenvalue", "{:.2e}"),
+        ("max_eigenvalue", "Max Eigenvalue", "{:.2e}"),
+        ("condition_number", "Condition Number", "{:.1f}"),
+    ]
+
+    for ax, (key, title, fmt) in zip(axes, metrics):
+        # Rolling curve
+        rolling_diagnostic[key].plot(ax=ax, label="Rolling Sample")
+
+        # VAR innovation horizontal line
+        ax.axhline(
+            innov_diagnostic[key],
+            linestyle="--",
+            color="black",
+            linewidth=1.5,
+            label="VAR Innovation",
+        )
+
+        # Numeric label pushed OUTSIDE to the right
+        ax.text(
+            1.01,  # outside the axes
+            innov_diagnostic[key],
+            fmt.format(innov_diagnostic[key]),
+            transform=ax.get_yaxis_transform(),  # x in axes, y in data
+            ha="left",
+            va="center",
+            fontsize=9,
+            clip_on=False,
+        )
+
+        ax.set_title(title)
+        ax.legend(loc="upper left")
+
+    fig.tight_layout()
+    return _save(fig, path, bbox_inches="tight")
+
+def plot_regularized_condition_number(log: pd.DataFrame, path) -> Path:
+    """
+    log: regularize_stack diagnostics with a positional index (one row per date).
+    """
+    fig = Figure(figsize=(12, 5))
+    ax = fig.subplots(1, 1)
+
+    ax.plot(log.index, log["raw_cond"], label="Raw", alpha=0.8)
+    ax.plot(log.index, log["jit_cond"], label="Jittered", alpha=0.8)
+    ax.plot(log.index, log["clip_cond"], label="Clipped", alpha=0.8)
+
+    ax.set_title("Condition Number of Rolling Covariance (Regularized)")
+    ax.set_ylabel("Condition Number")
+    ax.set_xlabel("Date")
+
+    ax.legend()
+    ax.grid(True, linestyle="--", alpha=0.4)
+
+    fig.tight_layout()
+    return _save(fig, path, dpi=150)
+
+def plot_vol_regimes(df: pd.DataFrame, rv_threshold: float, path) -> Path:
+    """
+    df: indexed by date with rv21, high_vol (0/1) and condition_number columns.
+    """
+    fig = Figure(figsize=(12, 7))
+    axes = fig.subplots(2, 1, sharex=True, gridspec_kw={"height_ratios": [1, 1]})
+
+    # Top panel: RV(21) + threshold
+    axes[0].plot(df.index, df["rv21"], color="black", linewidth=1.2)
+    axes[0].axhline(rv_threshold, color="red", linestyle="--", linewidth=1.2)
+    axes[0].set_ylabel("RV(21)")
+    axes[0].set_title("SPY Realized Volatility with High-Vol Threshold (70th Percentile)")
+
+    # Bottom panel: Condition number
+    axes[1].plot(df.index, df["condition_number"], color="tab:blue", linewidth=1.2)
+    axes[1].set_ylabel("Condition Number")
+    axes[1].set_title("Covariance Conditioning (Rolling RC21)")
+
+    # Shade high-vol regimes: one collection per panel from the run-length encoded mask
+    starts, ends = regime_intervals(df["high_vol"].values)
+    x = mdates.date2num(df.index)
+    for ax in axes:
+        shade_intervals(ax, x[starts], x[ends], color="red", alpha=0.15)
+
+    fig.tight_layout()
+    return _save(fig, path, dpi=150)
+
+def plot_var_backtest(
+    ret: pd.Series,
+    var_gauss: pd.Series,
+    var_t: pd.Series,
+    exceed_gauss: pd.Series,
+    exceed_t: pd.Series,
+    path,
+) -> Path:
+    fig = Figure(figsize=(14, 6))
+    ax = fig.subplots()
+
+    ax.plot(ret.index, ret, color="black", lw=0.8, label="Returns")
+    ax.plot(var_gauss.index, var_gauss, color="blue", lw=1.5, label="VaR (Gaussian 99%)")
+    ax.plot(var_t.index, var_t, color="orange", lw=1.5, label="VaR (Student-t 99%)")
+
+    ax.scatter(
+        ret.index[exceed_gauss == 1],
+        ret[exceed_gauss == 1],
+        color="blue",
+        marker="x",
+        s=30,
+        label="Gaussian exceedance",
+        zorder=3,
+    )
+
+    ax.scatter(
+        ret.index[exceed_t == 1],
+        ret[exceed_t == 1],
+        facecolors="none",
+        edgecolors="red",
+        marker="o",
+        s=40,
+        label="Student-t exceedance",
+        zorder=3,
+    )
+
+    ax.set_title("SPY 1-Day VaR Backtest (GARCH, 99%)")
+    ax.set_ylabel("Log Return")
+    ax.legend(ncol=2)
+    ax.grid(True, alpha=0.3)
+
+    fig.tight_layout()
+    return _save(fig, path, dpi=200)
+
+def plot_lruc_table(results: pd.DataFrame, path) -> Path:
+    fig = Figure(figsize=(10, 2 + 0.4 * len(results)))
+    ax = fig.subplots()
+    ax.axis("off")
+
+    cellText = results.map(
+        lambda x: f"{x:.4g}" if isinstance(x, (int, float)) else x
+    ).values # Get 4 most significant digits
+
+    table = ax.table(
+        cellText=cellText,
+        colLabels=results.columns,
+        cellLoc="center",
+        loc="center",
+    )
+
+    table.auto_set_font_size(False)
+    table.set_fontsize(10)
+    table.scale(1, 1.4)
+
+    ax.set_title("Kupiec Unconditional Coverage Test (SPY)", pad=20)
+
+    fig.tight_layout()
+    return _save(fig, path, dpi=200)
+
+def plot_exceedance_clustering(rolling_mean_exceed: pd.Series, path, target: float = 0.05) -> Path:
+    fig = Figure(figsize=(12, 4))
+    ax = fig.subplots()
+
+    ax.plot(
+        rolling_mean_exceed.index,
+        rolling_mean_exceed,
+        label="Rolling exceedance rate (GARCH, 5%)",
+        linewidth=2,
+    )
+
+    ax.axhline(
+        target,
+        linestyle="--",
+        color="black",
+        linewidth=1.5,
+        label="Target α = 5%",
+    )
+
+    ax.set_title("Exceedance Clustering (63-Day Rolling Window)")
+    ax.set_ylabel("Exceedance Rate")
+    ax.set_xlabel("Date")
+    ax.legend()
+    ax.grid(alpha=0.3)
+
+    fig.tight_layout()
+    return _save(fig, path, dpi=200)
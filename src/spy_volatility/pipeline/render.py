@@ -0,0 +1,143 @@
+# src/spy_volatility/pipeline/render.py
+
+import inspect
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from spy_volatility.utils.cache import _source_hash, fingerprint
+from spy_volatility.utils.log import fields, get_logger
+
+log = get_logger(__name__)
+
+MANIFEST_NAME = ".render_manifest.json"
+
+@dataclass
+class FigureJob:
+    """
+    One figure to draw: plot(**data, path=path). plot must be a module-level
+    function (it is pickled to a worker process) and data holds precomputed
+    results only, so rendering never touches the numeric stages.
+    """
+    plot: Callable[..., Any]
+    path: Path
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    def digest(self) -> str:
+        """
+        Hash of the plotted data and of the plotting module's source.
+        """
+        module = inspect.getmodule(self.plot)
+        return fingerprint(self.plot, _source_hash(module or self.plot), self.data)
+
+def _init_worker() -> None:
+    # Headless rendering: pandas' .plot() imports pyplot, which must not pick a GUI backend
+    import matplotlib
+    matplotlib.use("Agg")
+
+def _render(job: FigureJob) -> Path:
+    return Path(job.plot(**job.data, path=job.path))
+
+def _file_state(path: Path) -> Optional[List[int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+def _read_manifest(path: Path) -> Dict[str, Any]:
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _write_manifest(path: Path, manifest: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+def render_figures(
+    jobs: Sequence[FigureJob],
+    processes: Optional[int] = None,
+    force: bool = False,
+) -> Dict[str, Any]:
+    """
+    Render jobs in a process pool (Agg backend), skipping figures whose data
+    and plotting code are unchanged since the last render.
+
+    Parameters:
+      jobs: FigureJob list (paths must be unique)
+      processes: worker processes (default: one per stale figure, capped at the CPU count,
+                 in-process on a single core); 0 renders in this process
+      force: re-render every figure
+
+    A figure is skipped when the manifest next to it records the same digest
+    and the file on disk still has the size/mtime written at that render.
+
+    returns:
+      dict with keys: paths (one per job, in order), rendered, skipped
+    """
+    start = time.perf_counter()
+    manifests: Dict[Path, Dict[str, Any]] = {}
+    stale: List[FigureJob] = []
+    digests: Dict[Path, str] = {}
+
+    for job in jobs:
+        job.path = Path(job.path)
+        manifest_path = job.path.parent / MANIFEST_NAME
+        if manifest_path not in manifests:
+            manifests[manifest_path] = _read_manifest(manifest_path)
+
+        digests[job.path] = job.digest()
+        entry = manifests[manifest_path].get(job.path.name, {})
+        unchanged = (
+            entry.get("digest") == digests[job.path]
+            and entry.get("file") == _file_state(job.path)
+        )
+        if force or not unchanged:
+            stale.append(job)
+
+    if stale:
+        workers = processes
+        if workers is None:
+            # A single worker process only adds startup cost, so render in-process then
+            workers = min(len(stale), os.cpu_count() or 1)
+            workers = workers if workers > 1 else 0
+        if workers > 0:
+            # forkserver/spawn: the pipeline calls this from worker threads, where fork() is unsafe
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            context = multiprocessing.get_context(method)
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker) as pool:
+                list(pool.map(_render, stale))
+        else:
+            _init_worker()
+            for job in stale:
+                _render(job)
+
+        for job in stale:
+            manifest_path = job.path.parent / MANIFEST_NAME
+            manifests[manifest_path][job.path.name] = {
+                "digest": digests[job.path],
+                "file": _file_state(job.path),
+            }
+        for manifest_path, manifest in manifests.items():
+            _write_manifest(manifest_path, manifest)
+
+    rendered = {job.path for job in stale}
+    log.info(
+        "Figures rendered",
+        extra=fields(rendered=len(stale), unchanged=len(jobs) - len(stale), elapsed=time.perf_counter() - start),
+    )
+    return {
+        "paths": [job.path for job in jobs],
+        "rendered": [job.path for job in jobs if job.path in rendered],
+        "skipped": [job.path for job in jobs if job.path not in rendered],
+    }
@@ -0,0 +1,290 @@
+# src/spy_volatility/pipeline/report.py
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from spy_volatility.data.features import compute_returns, compute_realized_volatility_panel
+from spy_volatility.data.loaders import load_or_update_prices, load_or_update_spy_prices
+from spy_volatility.models.dcc import fit_dcc_garch
+from spy_volatility.models.garch_models import fit_garch_11, garch_walk_forward
+from spy_volatility.models.var import backtest_var, fit_var, gaussian_var, student_t_var
+from spy_volatility.pipeline import figures
+from spy_volatility.pipeline.dag import Pipeline
+from spy_volatility.pipeline.render import FigureJob, render_figures
+from spy_volatility.risk.cov_metrics import (
+    covariance_diagnostics,
+    covariance_diagnostics_stack,
+    rolling_sample_covariance,
+)
+from spy_volatility.risk.spd import regularize_stack
+from spy_volatility.utils.cache import ResultCache
+from spy_volatility.utils.config import get_project_root, load_config
+
+# Stage functions: arguments are the artifacts of the stages they depend on.
+
+def spy_returns(spy_prices: pd.DataFrame) -> pd.DataFrame:
+    # Copy: compute_returns adds columns to its input, artifacts stay untouched
+    return compute_returns(spy_prices.copy(), price_col=["SPY_Adj_Close"]).dropna()
+
+def multi_returns(multi_prices: pd.DataFrame) -> pd.DataFrame:
+    return compute_returns(multi_prices.copy(), price_col=list(multi_prices.columns)).dropna()
+
+def spy_rv(spy_returns: pd.DataFrame) -> pd.DataFrame:
+    """
+    Daily (not annualized) SPY realized volatility for every window the report uses.
+    """
+    return compute_realized_volatility_panel(spy_returns, windows=[21, 252], annualization=1)["SPY"]
+
+def garch_full(spy_returns: pd.DataFrame, cache: ResultCache) -> pd.Series:
+    return cache.call(fit_garch_11, spy_returns["SPY_Log_Return"])
+
+def garch_forecast(spy_returns: pd.DataFrame, cache: ResultCache) -> pd.Series:
+    # Out-of-sample forecast volatility, refit monthly
+    return cache.call(
+        garch_walk_forward, spy_returns["SPY_Log_Return"], refit_every="M", annualization=1, engine="native"
+    )["forecast"]
+
+def var_backtest(spy_returns: pd.DataFrame, spy_rv: pd.DataFrame, garch_forecast: pd.Series) -> Dict[str, Any]:
+    # VaR 0.01 and 0.05 for both normal and student-t distribution
+    return backtest_var(
+        spy_returns["SPY_Log_Return"],
+        sigma_panel=pd.DataFrame({"rv": spy_rv[252].dropna(), "garch": garch_forecast}).dropna(),  # Common sample
+        alphas=(0.01, 0.05),
+        dists={"gauss": None, "t": 8},
+    )
+
+def var_fit(multi_returns: pd.DataFrame, cache: ResultCache) -> Dict[str, Any]:
+    return cache.call(fit_var, multi_returns, p=1)
+
+def dcc_cov(multi_returns: pd.DataFrame, cache: ResultCache) -> Dict[str, Any]:
+    # Not drawn in the report; build it with `spy-vol report dcc_cov`
+    return cache.call(fit_dcc_garch, multi_returns)
+
+def var_innovation_diagnostics(var_fit: Dict[str, Any]) -> Dict[str, float]:
+    assets = var_fit["assets"]
+    return covariance_diagnostics(pd.DataFrame(var_fit["innovation_cov"], index=assets, columns=assets))
+
+def rolling_cov_63(multi_returns: pd.DataFrame, cache: ResultCache):
+    return cache.call(rolling_sample_covariance, multi_returns, window=63)  # Roughly 3 months
+
+def rolling_cov_21(multi_returns: pd.DataFrame):
+    return rolling_sample_covariance(multi_returns, window=21)
+
+def cov_diagnostics_63(rolling_cov_63) -> pd.DataFrame:
+    return pd.DataFrame(covariance_diagnostics_stack(rolling_cov_63), index=rolling_cov_63.dates)
+
+def cov_diagnostics_21(rolling_cov_21) -> pd.DataFrame:
+    return pd.DataFrame(covariance_diagnostics_stack(rolling_cov_21), index=rolling_cov_21.dates)
+
+def regularized_63(rolling_cov_63) -> pd.DataFrame:
+    """
+    Jitter / eigenvalue clipping diagnostics (one shared eigendecomposition per date).
+    """
+    regularized = regularize_stack(rolling_cov_63, lam=1e-6, eps=1e-6)
+    log = pd.DataFrame(regularized["diagnostics"], index=rolling_cov_63.dates)
+    log.index.name = "date"
+    return log
+
+def vol_regimes(spy_rv: pd.DataFrame, cov_diagnostics_21: pd.DataFrame) -> Dict[str, Any]:
+    """
+    High-vol regime labels (RV21 above its 70th percentile) next to RC21 conditioning.
+    """
+    rv21 = spy_rv[21].dropna()
+    rv_threshold = rv21.quantile(0.70)
+
+    dates = rv21.index.intersection(cov_diagnostics_21.index)
+    frame = cov_diagnostics_21.loc[dates].copy()
+    frame["high_vol"] = (rv21.loc[dates] > rv_threshold).astype(int)
+    frame["rv21"] = rv21.loc[dates]
+    frame.index.name = "date"
+    return {"frame": frame, "threshold": rv_threshold}
+
+# Figure stages only prepare FigureJobs (plot function + the arrays it draws);
+# the report stage renders all of them together in a process pool.
+
+def fig_returns_and_rv(spy_returns: pd.DataFrame, spy_rv: pd.DataFrame, figures_dir: Path) -> List[FigureJob]:
+    return [
+        FigureJob(
+            figures.plot_realized_volatility,
+            figures_dir / "SPY_realized_volatility.png",
+            {"rv": np.sqrt(252) * spy_rv[21]},
+        ),
+        FigureJob(
+            figures.plot_log_returns,
+            figures_dir / "SPY_log_returns.png",
+            {"log_returns": spy_returns["SPY_Log_Return"]},
+        ),
+    ]
+
+def fig_garch_vs_rv(spy_rv: pd.DataFrame, garch_full: pd.Series, figures_dir: Path) -> List[FigureJob]:
+    return [FigureJob(
+        figures.plot_garch_vs_rv,
+        figures_dir / "SPY_GARCH11_VS_RV21.png",
+        {"rv21": np.sqrt(252) * spy_rv[21], "garch_vol": garch_full},
+    )]
+
+def fig_covariance_fragility(cov_diagnostics_63: pd.DataFrame, figures_dir: Path) -> List[FigureJob]:
+    return [FigureJob(
+        figures.plot_covariance_fragility,
+        figures_dir / "prices_covariance_fragility.png",
+        {"rolling_diagnostic": cov_diagnostics_63},
+    )]
+
+def fig_rolling_vs_var(
+    cov_diagnostics_63: pd.DataFrame,
+    var_innovation_diagnostics: Dict[str, float],
+    figures_dir: Path,
+) -> List[FigureJob]:
+    return [FigureJob(
+        figures.plot_rolling_vs_var_diagnostics,
+        figures_dir / "rolling_vs_var_cov_diagnostics.png",
+        {"rolling_diagnostic": cov_diagnostics_63, "innov_diagnostic": var_innovation_diagnostics},
+    )]
+
+def fig_regularized(regularized_63: pd.DataFrame, figures_dir: Path) -> List[FigureJob]:
+    return [FigureJob(
+        figures.plot_regularized_condition_number,
+        figures_dir / "regularized_covariance_condition_number.png",
+        {"log": regularized_63.reset_index()},
+    )]
+
+def fig_vol_regimes(vol_regimes: Dict[str, Any], figures_dir: Path) -> List[FigureJob]:
+    return [FigureJob(
+        figures.plot_vol_regimes,
+        figures_dir / "vol_regimes_diagnostic.png",
+        {"df": vol_regimes["frame"], "rv_threshold": vol_regimes["threshold"]},
+    )]
+
+def fig_var_backtest(
+    spy_returns: pd.DataFrame,
+    garch_forecast: pd.Series,
+    var_backtest: Dict[str, Any],
+    figures_dir: Path,
+) -> List[FigureJob]:
+    var_results = var_backtest["exceedances"]
+    results = var_backtest["kupiec"][["model", "distribution", "alpha", "exceedance_rate", "LRuc p-value"]]
+
+    # Plot for alpha 0.99 on GARCH
+    alpha = 0.99
+    plot_idx = garch_forecast.index.intersection(spy_returns.index)
+    ret = spy_returns.loc[plot_idx, "SPY_Log_Return"]
+    sigma = garch_forecast.shift(1).reindex(plot_idx)  # Forecast made at t-1 for the return at t, as in backtest_var
+    var_gauss = pd.Series(gaussian_var(mu=0, sigma=sigma, alpha=alpha), index=plot_idx)
+    var_t = pd.Series(student_t_var(mu=0, nu=8, sigma=sigma, alpha=alpha), index=plot_idx)
+
+    # Clustering check -> rolling mean on exceedance
+    rolling_mean_exceed = var_results[("garch", "gauss", 0.05)].rolling(63).mean()
+
+    return [
+        FigureJob(
+            figures.plot_var_backtest,
+            figures_dir / "var_garch_99.png",
+            {
+                "ret": ret,
+                "var_gauss": var_gauss,
+                "var_t": var_t,
+                "exceed_gauss": var_results.loc[plot_idx, ("garch", "gauss", 0.01)],
+                "exceed_t": var_results.loc[plot_idx, ("garch", "t", 0.01)],
+            },
+        ),
+        FigureJob(figures.plot_lruc_table, figures_dir / "var_lruc_table.png", {"results": results}),
+        FigureJob(
+            figures.plot_exceedance_clustering,
+            figures_dir / "exceedance_clustering.png",
+            {"rolling_mean_exceed": rolling_mean_exceed},
+        ),
+    ]
+
+FIGURE_STAGES = [
+    "fig_returns_and_rv",
+    "fig_garch_vs_rv",
+    "fig_covariance_fragility",
+    "fig_rolling_vs_var",
+    "fig_regularized",
+    "fig_vol_regimes",
+    "fig_var_backtest",
+]
+
+def build_report_pipeline(
+    spy_config: str = "default.yaml",
+    multi_config: str = "default_multivar.yaml",
+    allow_data_update: bool = False,
+    figures_dir: Optional[Path] = None,
+    figure_stages: Optional[List[str]] = None,
+    render_processes: Optional[int] = None,
+    force_render: bool = False,
+) -> Pipeline:
+    """
+    The nightly report as one DAG:
+
+        cfg -> spy_prices -> spy_returns -> spy_rv / garch_full / garch_forecast -> var_backtest
+        multi_cfg -> multi_prices -> multi_returns -> var_fit / rolling_cov_63 / rolling_cov_21 / dcc_cov
+                                                   -> diagnostics / regularized_63 / vol_regimes
+        ... -> fig_* stages (FigureJobs) -> report (renders them)
+
+    Shared inputs (prices, returns, the 63-day rolling covariance) are computed
+    once per run; fits go through the ResultCache built from cfg.
+
+    Parameters:
+      figure_stages: fig_* stages the report stage renders (default: FIGURE_STAGES)
+      render_processes / force_render: passed to render_figures; figures whose
+        data is unchanged since the last run are not redrawn unless force_render
+    """
+    pipe = Pipeline("report")
+
+    pipe.add("cfg", lambda: load_config(spy_config))
+    pipe.add("multi_cfg", lambda: load_config(multi_config))
+    pipe.add("cache", lambda cfg: ResultCache.from_config(cfg), deps=["cfg"])
+    pipe.add(
+        "figures_dir",
+        lambda: Path(figures_dir) if figures_dir is not None else get_project_root() / "data" / "outputs" / "figures",
+    )
+    pipe.add("spy_prices", lambda cfg: load_or_update_spy_prices(cfg, allow_data_update), deps=["cfg"])
+    pipe.add(
+        "multi_prices",
+        lambda multi_cfg: load_or_update_prices(multi_cfg, allow_data_update, show_only_adj_close=True),
+        deps=["multi_cfg"],
+    )
+
+    pipe.add("spy_returns", spy_returns, deps=["spy_prices"])
+    pipe.add("multi_returns", multi_returns, deps=["multi_prices"])
+    pipe.add("spy_rv", spy_rv, deps=["spy_returns"])
+    pipe.add("garch_full", garch_full, deps=["spy_returns", "cache"])
+    pipe.add("garch_forecast", garch_forecast, deps=["spy_returns", "cache"])
+    pipe.add("var_backtest", var_backtest, deps=["spy_returns", "spy_rv", "garch_forecast"])
+    pipe.add("var_fit", var_fit, deps=["multi_returns", "cache"])
+    pipe.add("var_innovation_diagnostics", var_innovation_diagnostics, deps=["var_fit"])
+    pipe.add("dcc_cov", dcc_cov, deps=["multi_returns", "cache"])
+    pipe.add("rolling_cov_63", rolling_cov_63, deps=["multi_returns", "cache"])
+    pipe.add("rolling_cov_21", rolling_cov_21, deps=["multi_returns"])
+    pipe.add("cov_diagnostics_63", cov_diagnostics_63, deps=["rolling_cov_63"])
+    pipe.add("cov_diagnostics_21", cov_diagnostics_21, deps=["rolling_cov_21"])
+    pipe.add("regularized_63", regularized_63, deps=["rolling_cov_63"])
+    pipe.add("vol_regimes", vol_regimes, deps=["spy_rv", "cov_diagnostics_21"])
+
+    pipe.add("fig_returns_and_rv", fig_returns_and_rv, deps=["spy_returns", "spy_rv", "figures_dir"])
+    pipe.add("fig_garch_vs_rv", fig_garch_vs_rv, deps=["spy_rv", "garch_full", "figures_dir"])
+    pipe.add("fig_covariance_fragility", fig_covariance_fragility, deps=["cov_diagnostics_63", "figures_dir"])
+    pipe.add(
+        "fig_rolling_vs_var",
+        fig_rolling_vs_var,
+        deps=["cov_diagnostics_63", "var_innovation_diagnostics", "figures_dir"],
+    )
+    pipe.add("fig_regularized", fig_regularized, deps=["regularized_63", "figures_dir"])
+    pipe.add("fig_vol_regimes", fig_vol_regimes, deps=["vol_regimes", "figures_dir"])
+    pipe.add("fig_var_backtest", fig_var_backtest, deps=["spy_returns", "garch_forecast", "var_backtest", "figures_dir"])
+
+    figure_stages = list(FIGURE_STAGES if figure_stages is None else figure_stages)
+    pipe.add(
+        "report",
+        lambda **jobs: render_figures(
+            [job for name in figure_stages for job in jobs[name]],
+            processes=render_processes,
+            force=force_render,
+        )["paths"],
+        deps=figure_stages,
+    )
+    return pipe
@@ -0,0 +1,216 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+class _ILocIndexer:
+    """
+    Positional access for CovarianceCube, cube.iloc[i] / cube.iloc[i:j].
+    """
+    def __init__(self, cube: "CovarianceCube"):
+        self._cube = cube
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return self._cube._frame(int(key))
+        return self._cube._take(key)
+
+class CovarianceCube:
+    """
+    Time series of (N, N) covariance matrices stored as one contiguous array.
+
+    - values: (T, N, N) float array, or (T, N(N+1)/2) upper triangles when packed
+    - dates: DatetimeIndex of length T
+    - assets: asset names of length N
+
+    Behaves like the old dict[pd.Timestamp, pd.DataFrame]: keys(), items(),
+    cube[date] and `date in cube` all work, with O(1) date lookup through the
+    index. Label slices (cube["2020":"2021"]) and cube.iloc[...] return
+    sub-cubes that share memory with the parent.
+    """
+    def __init__(
+        self,
+        values: np.ndarray,
+        dates: pd.Index,
+        assets: pd.Index,
+        packed: bool = False,
+    ):
+        self.values = values
+        self.dates = pd.DatetimeIndex(dates)
+        self.assets = pd.Index(assets)
+        self.packed = packed
+
+        n_assets = len(self.assets)
+        expected = (n_assets * (n_assets + 1) // 2,) if packed else (n_assets, n_assets)
+        if values.shape != (len(self.dates),) + expected:
+            raise ValueError(
+                f"values shape {values.shape} does not match "
+                f"{len(self.dates)} dates and {n_assets} assets (packed={packed})"
+            )
+
+    @classmethod
+    def from_dense(
+        cls,
+        values: np.ndarray,
+        dates: pd.Index,
+        assets: pd.Index,
+        packed: bool = False,
+    ) -> "CovarianceCube":
+        """
+        Build a cube from a dense (T, N, N) stack, optionally keeping only upper triangles.
+        """
+        if packed:
+            rows, cols = np.triu_indices(values.shape[-1])
+            values = values[:, rows, cols]
+        return cls(values, dates, assets, packed=packed)
+
+    @property
+    def n_assets(self) -> int:
+        return len(self.assets)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __iter__(self):
+        return iter(self.dates)
+
+    def __contains__(self, date) -> bool:
+        return date in self.dates
+
+    def __repr__(self) -> str:
+        span = f"{self.dates[0].date()} .. {self.dates[-1].date()}" if len(self) else "empty"
+        return f"CovarianceCube(T={len(self)}, N={self.n_assets}, packed={self.packed}, {span})"
+
+    def keys(self) -> pd.DatetimeIndex:
+        return self.dates
+
+    def items(self):
+        for i, date in enumerate(self.dates):
+            yield date, self._frame(i)
+
+    def get_loc(self, date) -> int:
+        """
+        Position of a date in the cube.
+        """
+        return self.dates.get_loc(pd.Timestamp(date))
+
+    def matrix(self, i: int) -> np.ndarray:
+        """
+        Dense (N, N) matrix at position i.
+        """
+        if not self.packed:
+            return self.values[i]
+        return self._unpack(self.values[i:i + 1])[0]
+
+    def to_array(self) -> np.ndarray:
+        """
+        Dense (T, N, N) stack. No copy when the cube is not packed.
+        """
+        if not self.packed:
+            return self.values
+        return self._unpack(self.values)
+
+    def copy(self) -> "CovarianceCube":
+        """
+        Cube with its own in-memory copy of values (also for memory-mapped cubes).
+        """
+        return CovarianceCube(np.array(self.values), self.dates, self.assets, packed=self.packed)
+
+    def to_packed(self) -> "CovarianceCube":
+        if self.packed:
+            return self
+        return CovarianceCube.from_dense(self.values, self.dates, self.assets, packed=True)
+
+    def to_dense(self) -> "CovarianceCube":
+        if not self.packed:
+            return self
+        return CovarianceCube(self.to_array(), self.dates, self.assets)
+
+    @property
+    def iloc(self) -> _ILocIndexer:
+        return _ILocIndexer(self)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self._take(self.dates.slice_indexer(key.start, key.stop, key.step))
+        return self._frame(self.get_loc(key))
+
+    def save(self, path) -> Path:
+        """
+        Persist to a directory of .npy files (values, dates, assets) plus meta.json.
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        np.save(path / "values.npy", np.ascontiguousarray(self.values))
+        self._save_index(path)
+        return path
+
+    @classmethod
+    def open_memmap(
+        cls,
+        path,
+        dates: pd.Index,
+        assets: pd.Index,
+        packed: bool = False,
+    ) -> "CovarianceCube":
+        """
+        Create an on-disk cube (same layout as save()) whose values are a writable
+        memory map, so a long stack can be filled row by row without holding it
+        in RAM. Call flush() when done; load() opens it again.
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        n_assets = len(assets)
+        shape = (len(dates),) + ((n_assets * (n_assets + 1) // 2,) if packed else (n_assets, n_assets))
+        values = np.lib.format.open_memmap(path / "values.npy", mode="w+", dtype=np.float64, shape=shape)
+        cube = cls(values, dates, assets, packed=packed)
+        cube._save_index(path)
+        return cube
+
+    def flush(self) -> None:
+        """
+        Write pending changes of a memory-mapped cube to disk (no-op in memory).
+        """
+        if isinstance(self.values, np.memmap):
+            self.values.flush()
+
+    def _save_index(self, path: Path) -> None:
+        np.save(path / "dates.npy", self.dates.to_numpy())
+        np.save(path / "assets.npy", self.assets.to_numpy(dtype=str))
+        with open(path / "meta.json", "w") as f:
+            json.dump({"packed": self.packed, "n_assets": self.n_assets}, f)
+
+    @classmethod
+    def load(
+        cls,
+        path,
+        mmap_mode: str | None = "r",
+    ) -> "CovarianceCube":
+        """
+        Load a cube written by save(). By default values are memory-mapped, not read.
+        """
+        path = Path(path)
+        if not (path / "meta.json").exists():
+            raise FileNotFoundError(f"No covariance cube found at {path}")
+
+        with open(path / "meta.json", "r") as f:
+            meta = json.load(f)
+
+        values = np.load(path / "values.npy", mmap_mode=mmap_mode)
+        dates = pd.DatetimeIndex(np.load(path / "dates.npy"))
+        assets = pd.Index(np.load(path / "assets.npy"))
+        return cls(values, dates, assets, packed=meta["packed"])
+
+    def _frame(self, i: int) -> pd.DataFrame:
+        return pd.DataFrame(self.matrix(i), index=self.assets, columns=self.assets)
+
+    def _take(self, key) -> "CovarianceCube":
+        return CovarianceCube(self.values[key], self.dates[key], self.assets, packed=self.packed)
+
+    def _unpack(self, packed: np.ndarray) -> np.ndarray:
+        rows, cols = np.triu_indices(self.n_assets)
+        dense = np.empty((packed.shape[0], self.n_assets, self.n_assets), dtype=packed.dtype)
+        dense[:, rows, cols] = packed
+        dense[:, cols, rows] = packed
+        return dense
@@ -1,31 +1,392 @@
+from pathlib import Path
+
 import pandas as pd
 import numpy as np
 from spy_volatility.data.loaders import _filter_columns_by_suffix
+from spy_volatility.risk.cov_cube import CovarianceCube
+from spy_volatility.utils.profiling import profiled
 
-def rolling_sample_covariance(
+def _log_return_matrix(
     returns: pd.DataFrame,
-    window: int,
-) -> dict[pd.Timestamp, pd.DataFrame]:
+) -> tuple[np.ndarray, pd.Index, pd.Index]:
     """
-    Computes rolling sample covariance
-    """
-    date_cov_dict = {}
+    Extracts the log return block as a float matrix.
 
+    returns:
+        - (T, N) float array of log returns
+        - date index
+        - asset names (Log_Return suffix removed)
+    """
     # Filter just log returns
     returns = _filter_columns_by_suffix(returns, suffix="_Log_Return")
 
     # Remove Log_Return name from columns
     assets = returns.columns.str.replace("_Log_Return", "", regex=False)
 
-    # Split into windows and compute covariance
-    for idx in range(window, len(returns)):
-        window_returns = returns.iloc[idx - window: idx]
-        x = window_returns.to_numpy()
-        x_centered = x - x.mean(axis=0)  # Center data
-        cov = x_centered.T @ x_centered / (window - 1)  # Windowing reduced by 1 due to getting the mean from the data may need to remove later for MLE training
-        date_cov_dict[returns.index[idx]] = pd.DataFrame(cov, index=assets, columns=assets)  # Add into date dict
-    return date_cov_dict  
-        
+    x = returns.to_numpy(dtype=float)
+    if not np.isfinite(x).all():
+        raise ValueError("Log returns contain NaN/inf values; drop them before computing covariances.")
+    return x, returns.index, assets
+
+def _rolling_covariance_into(
+    x: np.ndarray,
+    window: int,
+    out: np.ndarray,
+    recompute_every: int | None = None,
+) -> np.ndarray:
+    """
+    Fills out[i] with the sample covariance of rows i .. i + window - 1 of x.
+
+    The centered cross-product matrix is updated with a symmetric rank-2 step
+    when one row enters and one row leaves the window, so only the first window
+    is computed from scratch. With recompute_every=k the window mean and
+    covariance are rebuilt exactly every k steps to stop rounding drift.
+    """
+    n_out, n_assets = out.shape[0], x.shape[1]
+    outer = np.empty((n_assets, n_assets))
+    update = np.empty((n_assets, n_assets))
+    mean = np.empty(n_assets)
+
+    for i in range(n_out):
+        if i == 0 or (recompute_every is not None and i % recompute_every == 0):
+            window_returns = x[i: i + window]
+            mean[:] = window_returns.mean(axis=0)
+            x_centered = window_returns - mean  # Center data
+            np.matmul(x_centered.T, x_centered, out=out[i])
+            out[i] /= window - 1  # Windowing reduced by 1 due to getting the mean from the data may need to remove later for MLE training
+            continue
+
+        x_new, x_old = x[i + window - 1], x[i - 1]
+        d = x_new - x_old
+        u = 0.5 * (x_new + x_old) - mean - d / (2 * window)
+        mean += d / window
+
+        # Centered cross-products change by d u' + u d'
+        np.multiply.outer(d, u / (window - 1), out=outer)
+        np.add(outer, outer.T, out=update)
+        np.add(out[i - 1], update, out=out[i])
+    return out
+
+@profiled()
+def rolling_covariance_stack(
+    returns: pd.DataFrame,
+    window: int,
+    recompute_every: int | None = None,
+) -> tuple[np.ndarray, pd.Index, pd.Index]:
+    """
+    Computes rolling sample covariance into one preallocated (T, N, N) array.
+
+    Covariance keyed at returns.index[idx] uses rows idx - window .. idx - 1,
+    same as rolling_sample_covariance.
+
+    returns:
+        - (T - window, N, N) covariance stack
+        - dates of each covariance
+        - asset names
+    """
+    if window < 2:
+        raise ValueError(f"window must be at least 2, got {window}")
+
+    x, index, assets = _log_return_matrix(returns)
+    n_obs, n_assets = x.shape
+    n_out = max(n_obs - window, 0)
+
+    cov = np.empty((n_out, n_assets, n_assets))
+    _rolling_covariance_into(x, window, cov, recompute_every=recompute_every)
+    return cov, index[window:], assets
+
+@profiled()
+def rolling_sample_covariance(
+    returns: pd.DataFrame,
+    window: int,
+    recompute_every: int | None = None,
+    packed: bool = False,
+) -> CovarianceCube:
+    """
+    Computes rolling sample covariance
+
+    Returns a CovarianceCube keyed by date (cube[date] -> DataFrame), optionally
+    storing only upper triangles when packed=True.
+    """
+    cov, dates, assets = rolling_covariance_stack(returns, window, recompute_every=recompute_every)
+    return CovarianceCube.from_dense(cov, dates, assets, packed=packed)
+
+def _window_sums(
+    values: np.ndarray,
+    window: int,
+) -> np.ndarray:
+    """
+    Sums over rows i .. i + window - 1 for every window, from one cumulative sum.
+    """
+    csum = np.cumsum(values, axis=0)
+    csum = np.concatenate([np.zeros((1,) + values.shape[1:]), csum])
+    return csum[window:-1] - csum[:-window - 1]
+
+def _shrinkage_intensity(
+    trace: np.ndarray,
+    frob2: np.ndarray,
+    n_assets: int,
+    window: int,
+    method: str,
+    centered_fourth: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Shrinkage intensity towards mu * I of every window (as in scikit-learn),
+    from the trace and sum of squared entries of the MLE covariance S and,
+    for Ledoit-Wolf, the window sum of |x_k - m|^4.
+    """
+    mu = trace / n_assets
+
+    if method == "oas":
+        alpha = frob2 / n_assets ** 2
+        num = alpha + mu ** 2
+        den = (window + 1) * (alpha - mu ** 2 / n_assets)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(den == 0, 1.0, np.minimum(num / den, 1.0))
+
+    beta = (centered_fourth / window - frob2) / (n_assets * window)
+    delta = (frob2 - 2 * mu * trace + n_assets * mu ** 2) / n_assets
+    beta = np.minimum(beta, delta)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(beta == 0, 0.0, beta / delta)
+
+@profiled()
+def rolling_shrinkage_covariance(
+    returns: pd.DataFrame,
+    window: int,
+    method: str = "ledoit_wolf",
+    recompute_every: int | None = None,
+    packed: bool = False,
+) -> dict[str, object]:
+    """
+    Rolling Ledoit-Wolf or OAS shrinkage covariance, keyed like rolling_sample_covariance.
+
+    Each window's estimate is (1 - s) S + s mu I, with S the MLE covariance
+    (divided by window, as in scikit-learn), mu = tr(S) / N and s the
+    estimated optimal intensity. S comes from the rank-2 rolling update of
+    rolling_covariance_stack; the fourth-moment terms Ledoit-Wolf also needs
+    are window sums of |x_k|^4 and |x_k|^2 x_k, so the whole series is one
+    pass. With s > 0 the smallest eigenvalue is at least s * mu: the result is
+    positive definite by construction, no eigendecomposition needed.
+
+    Parameters:
+        window (int): Rows per estimate.
+        method (str): "ledoit_wolf" or "oas".
+        recompute_every (int | None): passed to rolling_covariance_stack.
+        packed (bool): store only upper triangles in the returned cube.
+
+    returns:
+        - "cov" -> CovarianceCube of shrunk covariances
+        - "shrinkage" -> intensity s per date (Series)
+    """
+    if method not in ("ledoit_wolf", "oas"):
+        raise ValueError(f"Unknown method '{method}', expected 'ledoit_wolf' or 'oas'")
+
+    cov, dates, assets = rolling_covariance_stack(returns, window, recompute_every=recompute_every)
+    n_assets = len(assets)
+
+    # Moments of the MLE covariance S = mle * cov, without rescaling the stack
+    mle = (window - 1) / window
+    trace = mle * np.trace(cov, axis1=1, axis2=2)
+    frob2 = mle ** 2 * np.einsum("tij,tij->t", cov, cov)
+
+    centered_fourth = None
+    if method == "ledoit_wolf":
+        # sum_k |x_k - m|^4 over each window, expanded into window sums of
+        # |x_k|^4 and |x_k|^2 x_k: fourth - 4 m.v + 4 m'Cm + 2 |m|^2 tr(C) + 3 n |m|^4,
+        # with C = n S the centered cross-product
+        x, _, _ = _log_return_matrix(returns)
+        x = x - x.mean(axis=0)  # The intensity is shift invariant; centering limits cancellation
+        sq_norm = np.einsum("ti,ti->t", x, x)
+        mean = _window_sums(x, window) / window
+        m2 = np.einsum("ti,ti->t", mean, mean)
+        mcm = window * mle * np.einsum("ti,ti->t", (cov @ mean[:, :, None])[..., 0], mean)
+        centered_fourth = (
+            _window_sums(sq_norm ** 2, window)
+            - 4 * np.einsum("ti,ti->t", mean, _window_sums(sq_norm[:, None] * x, window))
+            + 4 * mcm
+            + 2 * m2 * window * trace
+            + 3 * window * m2 ** 2
+        )
+
+    shrinkage = _shrinkage_intensity(trace, frob2, n_assets, window, method, centered_fourth)
+
+    cov *= (mle * (1 - shrinkage))[:, None, None]
+    diagonal = np.einsum("tii->ti", cov)  # Writable view of the diagonals
+    diagonal += (shrinkage * trace / n_assets)[:, None]
+
+    return {
+        "cov": CovarianceCube.from_dense(cov, dates, assets, packed=packed),
+        "shrinkage": pd.Series(shrinkage, index=dates, name=method),
+    }
+
+def _ewma_covariance_into(
+    x: np.ndarray,
+    decays: list[float],
+    init: np.ndarray,
+    outs: list[np.ndarray],
+    packed: bool = False,
+) -> list[np.ndarray]:
+    """
+    Fills outs[h][i] with the EWMA covariance of decay decays[h] known before row
+    n_init + i of x, where n_init = len(x) - len(outs[h]) rows went into init:
+
+        C <- decay * C + (1 - decay) * x_t x_t'
+
+    The outer product of each row is formed once and shared by every decay;
+    the running matrices stay in memory and each step is copied into the
+    outputs (which may be memory maps). With packed=True everything works on
+    upper triangles, halving the work and the output.
+    """
+    n_assets = x.shape[1]
+    n_init = x.shape[0] - outs[0].shape[0]
+    rows, cols = np.triu_indices(n_assets) if packed else (None, None)
+    if packed:
+        init = init[rows, cols]
+
+    states = [init.copy() for _ in decays]
+    outer = np.empty_like(init)
+    scaled = np.empty_like(init)
+    left, right = (np.empty(len(rows)), np.empty(len(rows))) if packed else (None, None)
+
+    for i in range(outs[0].shape[0]):
+        if i > 0:
+            row = x[n_init + i - 1]
+            if packed:
+                np.take(row, rows, out=left)
+                np.take(row, cols, out=right)
+                np.multiply(left, right, out=outer)
+            else:
+                np.multiply.outer(row, row, out=outer)
+            for decay, state in zip(decays, states):
+                state *= decay
+                np.multiply(outer, 1 - decay, out=scaled)
+                state += scaled
+        for state, out in zip(states, outs):
+            out[i] = state
+    return outs
+
+@profiled()
+def ewma_covariance(
+    returns: pd.DataFrame,
+    halflives: int | float | list[float] = 21,
+    min_periods: int = 21,
+    packed: bool = False,
+    out_dir=None,
+) -> dict[float, CovarianceCube]:
+    """
+    RiskMetrics-style exponentially weighted covariance for one or several half-lives.
+
+    Returns are taken as zero-mean (as in RiskMetrics). The recursion starts
+    from the second moment of the first min_periods rows and is updated once
+    per day in O(N^2); all half-lives are computed in the same pass. The
+    covariance keyed at returns.index[idx] uses rows up to idx - 1, like
+    rolling_sample_covariance with window=min_periods.
+
+    Parameters:
+        halflives: half-life(s) in days; decay = 0.5 ** (1 / halflife)
+            (RiskMetrics' 0.94 is a half-life of about 11.2 days).
+        min_periods (int): rows used for the starting matrix.
+        packed (bool): store only upper triangles.
+        out_dir: if given, each half-life is streamed to a memory-mapped cube in
+            out_dir/ewma_hl<halflife> (see CovarianceCube.open_memmap) instead of RAM.
+
+    returns:
+        - halflife -> CovarianceCube
+    """
+    halflives = [halflives] if np.isscalar(halflives) else list(halflives)
+    if min(halflives) <= 0:
+        raise ValueError(f"halflives must be positive, got {halflives}")
+    if min_periods < 1:
+        raise ValueError(f"min_periods must be at least 1, got {min_periods}")
+
+    x, index, assets = _log_return_matrix(returns)
+    dates = index[min_periods:]
+    n_assets = len(assets)
+
+    if out_dir is None:
+        shape = (len(dates),) + ((n_assets * (n_assets + 1) // 2,) if packed else (n_assets, n_assets))
+        cubes = [CovarianceCube(np.empty(shape), dates, assets, packed=packed) for _ in halflives]
+    else:
+        out_dir = Path(out_dir)
+        cubes = [
+            CovarianceCube.open_memmap(out_dir / f"ewma_hl{h:g}", dates, assets, packed=packed)
+            for h in halflives
+        ]
+
+    if len(dates):
+        init = x[:min_periods].T @ x[:min_periods] / min_periods
+        decays = [0.5 ** (1 / h) for h in halflives]
+        _ewma_covariance_into(x, decays, init, [cube.values for cube in cubes], packed=packed)
+    for cube in cubes:
+        cube.flush()
+    return dict(zip(halflives, cubes))
+
+@profiled()
+def covariance_diagnostics_stack(
+    cov: np.ndarray | CovarianceCube,
+    extremes_only: bool = False,
+) -> dict[str, np.ndarray]:
+    """
+    Batched covariance diagnostics over a (T, N, N) stack or CovarianceCube.
+
+    All eigenvalues come from one symmetric eigvalsh call on the whole stack.
+    With extremes_only=True only the smallest and largest eigenvalue of each
+    matrix are found, by Lanczos in a per-matrix loop (see
+    _extreme_eigenvalues). That is only faster for very large N (thousands
+    of assets); keep the default for anything smaller.
+
+    returns arrays of length T:
+        - smallest eigenvalue
+        - largest eigenvalue
+        - condition number
+    """
+    if isinstance(cov, CovarianceCube):
+        cov = cov.to_array()
+    cov = np.asarray(cov, dtype=float)
+    if cov.ndim == 2:
+        cov = cov[None]
+
+    if extremes_only and cov.shape[-1] > 2:
+        eig_min, eig_max = _extreme_eigenvalues(cov)
+    else:
+        eig = np.linalg.eigvalsh(cov)  # Ascending order
+        eig_min, eig_max = eig[..., 0], eig[..., -1]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        condition_number = eig_max / eig_min
+
+    return {
+        "min_eigenvalue": eig_min,
+        "max_eigenvalue": eig_max,
+        "condition_number": condition_number,
+    }
+
+def _extreme_eigenvalues(
+    cov: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Smallest and largest eigenvalue of each matrix in the stack via Lanczos.
+
+    Both ends come from the algebraic order (which="LA" / "SA"), so negative
+    eigenvalues of non-PSD windows are reported as they are. Two ARPACK calls
+    per matrix in a Python loop: this only beats the batched dense eigvalsh
+    for N in the thousands. Falls back to a dense solve when ARPACK fails.
+    """
+    from scipy.sparse.linalg import eigsh, ArpackError
+
+    eig_min = np.empty(cov.shape[0])
+    eig_max = np.empty(cov.shape[0])
+    for i, a in enumerate(cov):
+        try:
+            eig_max[i] = eigsh(a, k=1, which="LA", return_eigenvectors=False)[0]
+            eig_min[i] = eigsh(a, k=1, which="SA", return_eigenvectors=False)[0]
+        except (ArpackError, RuntimeError, np.linalg.LinAlgError):
+            eig = np.linalg.eigvalsh(a)
+            eig_min[i], eig_max[i] = eig[0], eig[-1]
+    return eig_min, eig_max
+
+@profiled()
 def covariance_diagnostics(
     cov: pd.DataFrame,
 ) -> dict[str, float]:
@@ -35,11 +396,5 @@ def covariance_diagnostics(
         - largest eigenvalue
         - condition number
     """
-    x = cov.to_numpy()
-
-    eig = np.linalg.eigvals(x)
-    return {
-        "min_eigenvalue": eig.min(),
-        "max_eigenvalue": eig.max(),
-        "condition_number": eig.max() / eig.min(),
-    }
\ No newline at end of file
+    diag = covariance_diagnostics_stack(cov.to_numpy())
+    return {key: float(value[0]) for key, value in diag.items()}
@@ -0,0 +1,350 @@
+# src/spy_volatility/utils/cache.py
+
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from spy_volatility.risk.cov_cube import CovarianceCube
+from spy_volatility.utils.config import get_project_root
+
+def _hash_update(h, obj: Any) -> None:
+    """
+    Feed a canonical byte representation of obj into the hash h.
+    """
+    if isinstance(obj, pd.DataFrame):
+        h.update(b"DataFrame")
+        _hash_update(h, [str(c) for c in obj.columns])
+        _hash_update(h, [str(d) for d in obj.dtypes])
+        h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, pd.Series):
+        h.update(b"Series")
+        _hash_update(h, [str(obj.name), str(obj.dtype)])
+        h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, pd.Index):
+        h.update(b"Index")
+        h.update(pd.util.hash_pandas_object(obj).to_numpy().tobytes())
+    elif isinstance(obj, np.ndarray):
+        h.update(f"ndarray{obj.dtype.str}{obj.shape}".encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, dict):
+        h.update(b"dict")
+        for k in sorted(obj, key=str):
+            _hash_update(h, str(k))
+            _hash_update(h, obj[k])
+    elif isinstance(obj, (list, tuple)):
+        h.update(f"{type(obj).__name__}{len(obj)}".encode())
+        for item in obj:
+            _hash_update(h, item)
+    elif obj is None or isinstance(obj, (str, bool, int, float, np.generic, pd.Timestamp)):
+        h.update(f"{type(obj).__name__}:{obj!r}".encode())
+    elif callable(obj):
+        h.update(f"callable:{getattr(obj, '__module__', '')}.{getattr(obj, '__qualname__', repr(obj))}".encode())
+    else:
+        h.update(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+def fingerprint(*objs: Any) -> str:
+    """
+    Content hash (hex) of any mix of DataFrames, Series, arrays, dicts and scalars.
+
+    Two inputs with the same values, index, columns and dtypes give the same
+    fingerprint in every process.
+    """
+    h = hashlib.blake2b(digest_size=20)
+    for obj in objs:
+        _hash_update(h, obj)
+    return h.hexdigest()
+
+# Third-party packages whose upgrades can change cached results
+_DEPENDENCIES = ("numpy", "pandas", "scipy", "arch", "statsmodels", "numba")
+
+def _package_modules(module_name: str) -> list:
+    """
+    module_name plus every spy_volatility module it reaches through its
+    globals (imported modules, functions and classes), transitively.
+    """
+    seen, todo = set(), [module_name]
+    while todo:
+        name = todo.pop()
+        module = sys.modules.get(name)
+        if name in seen or module is None:
+            continue
+        seen.add(name)
+        for obj in vars(module).values():
+            other = obj.__name__ if inspect.ismodule(obj) else getattr(obj, "__module__", None)
+            if isinstance(other, str) and other.split(".")[0] == "spy_volatility" and other not in seen:
+                todo.append(other)
+    return sorted(seen)
+
+@lru_cache(maxsize=None)
+def _module_hash(module_name: str) -> str:
+    """
+    Hash of the source of module_name and of the spy_volatility modules it
+    depends on (read once per process).
+    """
+    h = hashlib.blake2b(digest_size=8)
+    for name in _package_modules(module_name):
+        try:
+            source = inspect.getsource(sys.modules[name])
+        except (OSError, TypeError):
+            source = ""
+        h.update(f"{name}\n{source}".encode())
+    return h.hexdigest()
+
+@lru_cache(maxsize=None)
+def _dependency_versions() -> str:
+    versions = [f"python={sys.version_info[0]}.{sys.version_info[1]}"]
+    for package in _DEPENDENCIES:
+        try:
+            versions.append(f"{package}={metadata.version(package)}")
+        except metadata.PackageNotFoundError:
+            versions.append(f"{package}=none")
+    return ";".join(versions)
+
+def _source_hash(fn: Callable) -> str:
+    """
+    Hash of the code behind fn: its own source, the source of its module and
+    of the spy_volatility modules that module uses (so editing a kernel or
+    helper fn calls invalidates its entries), and the installed versions of
+    the numeric dependencies.
+    """
+    try:
+        source = inspect.getsource(fn)
+    except (OSError, TypeError):
+        source = ""
+    module_name = getattr(inspect.unwrap(fn), "__module__", None)
+    module = _module_hash(module_name) if module_name in sys.modules else ""
+    return hashlib.blake2b(
+        f"{source}\n{module}\n{_dependency_versions()}".encode(), digest_size=8,
+    ).hexdigest()
+
+def _copy(value: Any) -> Any:
+    """
+    Copy pandas/numpy results and covariance cubes (also inside dicts, lists
+    and tuples) so callers cannot mutate what the memory tier holds. Other
+    objects are shared.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series, np.ndarray, CovarianceCube)):
+        return value.copy()
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_copy(v) for v in value)
+    return value
+
+class ResultCache:
+    """
+    Content-addressed cache for expensive results (model fits, derived series).
+
+    Two tiers:
+      - in memory: the last memory_items results of this process (LRU by use)
+      - on disk: one pickle per key under directory, evicted least recently
+        used first once the directory grows past max_bytes
+
+    Keys come from fingerprint() of the function, the code behind it (its
+    module and the package modules it uses, plus dependency versions), the
+    inputs and the spec, so new data or a changed spec/function means a new
+    entry; there is nothing to invalidate by hand.
+
+    Usage:
+        cache = ResultCache.from_config(cfg)
+        vol = cache.call(fit_garch_11, returns)
+    """
+    _SUFFIX = ".pkl"
+
+    def __init__(
+        self,
+        directory,
+        max_bytes: int = 512 * 2**20,
+        memory_items: int = 32,
+        enabled: bool = True,
+    ):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.memory_items = memory_items
+        self.enabled = enabled
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = {"memory": 0, "disk": 0}
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, cfg: Dict[str, Any]) -> "ResultCache":
+        """
+        Build the cache from cfg["cache"]:
+            cache:
+              enabled: true
+              dir: "data/cache"     # relative to repo root
+              max_mb: 512
+              memory_items: 32
+        """
+        cache_cfg = cfg.get("cache") or {}
+        directory = Path(cache_cfg.get("dir", "data/cache"))
+        if not directory.is_absolute():
+            directory = get_project_root() / directory
+        return cls(
+            directory,
+            max_bytes=int(cache_cfg.get("max_mb", 512) * 2**20),
+            memory_items=cache_cfg.get("memory_items", 32),
+            enabled=cache_cfg.get("enabled", True),
+        )
+
+    def key(self, namespace: str, *inputs: Any, **spec: Any) -> str:
+        """
+        Cache key for namespace plus the fingerprint of inputs and spec.
+        """
+        return f"{namespace}-{fingerprint(inputs, spec)}"
+
+    def _path(self, key: str) -> Path:
+        return self.directory / (key + self._SUFFIX)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits["memory"] += 1
+                return _copy(self._memory[key])
+
+            path = self._path(key)
+            try:
+                with open(path, "rb") as f:
+                    value = pickle.load(f)
+            except FileNotFoundError:
+                self.misses += 1
+                return default
+            except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+                # Corrupt or written by incompatible code: drop it
+                path.unlink(missing_ok=True)
+                self.misses += 1
+                return default
+
+            os.utime(path)  # mark as recently used for eviction
+            self.hits["disk"] += 1
+            self._remember(key, value)
+            return _copy(value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._memory or self._path(key).exists()
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._remember(key, _copy(value))
+
+            # Atomic write: readers never see a partial pickle
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, self._path(key))
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+            self.evict()
+
+    def call(
+        self,
+        fn: Callable,
+        *args: Any,
+        namespace: Optional[str] = None,
+        version: Any = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        fn(*args, **kwargs), computed once per distinct content of args/kwargs.
+
+        The key also covers the code behind fn (see _source_hash). Bump
+        version to invalidate entries for a change it cannot see, e.g. data
+        files read by fn.
+        """
+        if not self.enabled:
+            return fn(*args, **kwargs)
+
+        namespace = namespace or getattr(fn, "__name__", "call")
+        key = self.key(namespace, fn, _source_hash(fn), version, args, **kwargs)
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = fn(*args, **kwargs)
+            self.put(key, value)
+        return value
+
+    def memoize(self, namespace: Optional[str] = None, version: Any = None) -> Callable:
+        """
+        Decorator form of call().
+        """
+        def decorator(fn: Callable) -> Callable:
+            def wrapper(*args, **kwargs):
+                return self.call(fn, *args, namespace=namespace, version=version, **kwargs)
+            wrapper.__name__ = fn.__name__
+            wrapper.__doc__ = fn.__doc__
+            wrapper.__wrapped__ = fn
+            return wrapper
+        return decorator
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def _entries(self) -> list:
+        """
+        (mtime, size, path) of every entry on disk, oldest use first.
+        """
+        if not self.directory.exists():
+            return []
+        entries = []
+        for path in self.directory.glob("*" + self._SUFFIX):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return sorted(entries)
+
+    def size_bytes(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> None:
+        """
+        Remove least recently used entries until the directory fits in max_bytes.
+        """
+        with self._lock:
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            for _, _, path in self._entries():
+                path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "memory_hits": self.hits["memory"],
+            "disk_hits": self.hits["disk"],
+            "misses": self.misses,
+            "memory_items": len(self._memory),
+            "disk_entries": len(self._entries()),
+            "disk_bytes": self.size_bytes(),
+        }
+
+    def __repr__(self) -> str:
+        return f"ResultCache({self.directory}, max_bytes={self.max_bytes}, memory_items={self.memory_items})"
@@ -1,25 +1,28 @@
 # src/spy_volatility/utils/config.py
 
+import copy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
 import yaml
 
+from spy_volatility.utils.log import get_logger
+
+log = get_logger(__name__)
+
+@lru_cache(maxsize=None)
 def get_project_root() -> Path:
     """
-    Get the root directory of the project.
+    Get the root directory of the project (resolved once per process).
     """
     # From src/spy_volatility/utils/config.py, go up 3 levels to project root
     project_root = Path(__file__).parents[3]
-    print(f"[config] Project root: {project_root}")
+    log.debug("Project root: %s", project_root)
     return project_root
 
-def load_config(config_name: str = "default.yaml") -> Dict[str, Any]:
-    """
-    Load a YAML config from the configs/ directory at the project root.
-
-    Returns a nested dict, e.g. cfg["data"]["spy_ticker"].
-    """
+@lru_cache(maxsize=None)
+def _parse_config(config_name: str) -> Dict[str, Any]:
     project_root = get_project_root()
     config_path = project_root / "configs" / config_name
 
@@ -28,8 +31,22 @@ def load_config(config_name: str = "default.yaml") -> Dict[str, Any]:
 
     with open(config_path, "r") as f:
         cfg = yaml.safe_load(f)
-    
+
     if cfg is None:
         raise ValueError(f"Config file {config_path} is empty or invalid")
-    
-    return cfg
\ No newline at end of file
+
+    log.debug("Loaded config %s", config_path)
+    return cfg
+
+def load_config(config_name: str = "default.yaml") -> Dict[str, Any]:
+    """
+    Load a YAML config from the configs/ directory at the project root.
+
+    Returns a nested dict, e.g. cfg["data"]["spy_ticker"]. Each file is parsed
+    once per process; callers get their own copy, so mutating it is safe.
+    Call clear_config_cache() to pick up edits to a file already loaded.
+    """
+    return copy.deepcopy(_parse_config(config_name))
+
+def clear_config_cache() -> None:
+    _parse_config.cache_clear()
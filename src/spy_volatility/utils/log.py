@@ -0,0 +1,132 @@
+# src/spy_volatility/utils/log.py
+
+import json
+import logging
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+# Every module logs through get_logger(__name__), under the "spy_volatility"
+# logger. The library itself never adds output handlers; the CLI (or any
+# caller) picks level and format once with configure_logging().
+#
+# Structured fields go in extra={"fields": {...}} and are rendered as
+# key=value pairs (text) or as top-level keys (json), e.g.
+#     log.info("Saved prices", extra=fields(path=store.path, rows=len(df)))
+
+ROOT = "spy_volatility"
+
+logging.getLogger(ROOT).addHandler(logging.NullHandler())
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Logger for a module: "spy_volatility.data.loaders" -> shown as [loaders].
+    """
+    return logging.getLogger(name if name.startswith(ROOT) else f"{ROOT}.{name}")
+
+def fields(**values: Any) -> Dict[str, Dict[str, Any]]:
+    """
+    extra= payload carrying structured fields for one log call.
+    """
+    return {"fields": values}
+
+class TextFormatter(logging.Formatter):
+    """
+    "[loaders] Saved prices path=... rows=..." (level shown from WARNING up).
+    """
+    def format(self, record: logging.LogRecord) -> str:
+        message = f"[{record.name.rsplit('.', 1)[-1]}] {record.getMessage()}"
+        if record.levelno >= logging.WARNING:
+            message = f"{record.levelname}: {message}"
+        extra = getattr(record, "fields", None)
+        if extra:
+            message += " " + " ".join(f"{k}={_short(v)}" for k, v in extra.items())
+        if record.exc_info:
+            message += "\n" + self.formatException(record.exc_info)
+        return message
+
+class JSONFormatter(logging.Formatter):
+    """
+    One JSON object per line for log collectors: time, level, logger, message plus fields.
+    """
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        payload.update(getattr(record, "fields", None) or {})
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+def _short(value: Any) -> str:
+    if isinstance(value, float):
+        return f"{value:.4g}"
+    return str(value)
+
+_FORMATTERS = {"text": TextFormatter, "json": JSONFormatter}
+
+def configure_logging(
+    level: str | int = "INFO",
+    quiet: bool = False,
+    fmt: str = "text",
+    stream=None,
+) -> logging.Logger:
+    """
+    Route the package's log records to stream (default stderr).
+
+    Parameters:
+      level: minimum level (name or number)
+      quiet: only warnings and errors, whatever level says
+      fmt: "text" ([module] message key=value) or "json" (one object per line)
+
+    Calling it again replaces the handler installed by the previous call.
+    """
+    if fmt not in _FORMATTERS:
+        raise ValueError(f"Unknown log format '{fmt}'. Available: {list(_FORMATTERS)}")
+
+    root = logging.getLogger(ROOT)
+    for handler in list(root.handlers):
+        if getattr(handler, "_spy_volatility", False):
+            root.removeHandler(handler)
+
+    handler = logging.StreamHandler(stream if stream is not None else sys.stderr)
+    handler.setFormatter(_FORMATTERS[fmt]())
+    handler._spy_volatility = True
+    root.addHandler(handler)
+    root.setLevel(logging.WARNING if quiet else (level.upper() if isinstance(level, str) else level))
+    root.propagate = False
+    return root
+
+def configure_logging_from_config(
+    cfg: Dict[str, Any],
+    level: Optional[str] = None,
+    quiet: Optional[bool] = None,
+    fmt: Optional[str] = None,
+) -> logging.Logger:
+    """
+    configure_logging from the config's logging section (level, quiet, format).
+    Arguments that are not None (e.g. command-line flags) override the config.
+    """
+    section = cfg.get("logging") or {}
+    return configure_logging(
+        level=section.get("level", "INFO") if level is None else level,
+        quiet=section.get("quiet", False) if quiet is None else quiet,
+        fmt=section.get("format", "text") if fmt is None else fmt,
+    )
+
+@contextmanager
+def log_timing(logger: logging.Logger, message: str, level: int = logging.INFO, **values: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Log message with an elapsed (seconds) field when the block completes. The
+    yielded dict can be updated inside the block to add fields (e.g. rows).
+    Nothing is logged if the block raises; the exception is reported by
+    whoever handles it.
+    """
+    start = time.perf_counter()
+    yield values
+    if logger.isEnabledFor(level):
+        logger.log(level, message, extra=fields(**values, elapsed=time.perf_counter() - start))
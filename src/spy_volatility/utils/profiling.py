@@ -0,0 +1,276 @@
+# src/spy_volatility/utils/profiling.py
+
+import csv
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from spy_volatility.utils.config import get_project_root
+from spy_volatility.utils.log import get_logger
+
+log = get_logger(__name__)
+
+# Lightweight call instrumentation for the library's hot paths.
+#
+# Functions are wrapped with @profiled (or blocks with profile_block). While
+# profiling is disabled -- the default -- a wrapped call costs one flag check.
+# When enabled, each call records wall time, thread CPU time, row/asset counts
+# of its first argument and, optionally, peak traced memory (tracemalloc).
+
+class _ProfilerState:
+    def __init__(self):
+        self.enabled = False
+        self.memory = False
+        self.records: List[Dict[str, Any]] = []
+        self.lock = threading.Lock()
+        self.origin = time.perf_counter()
+        self.local = threading.local()  # per-thread stack of open frames (memory accounting)
+
+_STATE = _ProfilerState()
+
+def enable_profiling(memory: bool = False) -> None:
+    """
+    Start recording. memory=True also tracks peak memory per call with
+    tracemalloc, which slows allocation-heavy Python code noticeably. Traced
+    memory is process-wide, so calls overlapping on other threads add to a
+    call's peak (it is an upper bound in the threaded pipeline).
+    """
+    _STATE.memory = memory
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _STATE.enabled = True
+
+def disable_profiling() -> None:
+    _STATE.enabled = False
+    if _STATE.memory and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _STATE.memory = False
+
+def profiling_enabled() -> bool:
+    return _STATE.enabled
+
+def reset_profile() -> None:
+    """
+    Drop all records and restart the trace clock.
+    """
+    with _STATE.lock:
+        _STATE.records = []
+        _STATE.origin = time.perf_counter()
+
+def profile_records() -> List[Dict[str, Any]]:
+    with _STATE.lock:
+        return [dict(r) for r in _STATE.records]
+
+def _shape_of(args: tuple) -> Dict[str, int]:
+    """
+    rows / assets of the first DataFrame, Series, array or CovarianceCube
+    ((T, N, N) -> T, N) among args.
+    """
+    for obj in args:
+        shape = getattr(obj, "shape", None)
+        if isinstance(shape, tuple) and len(shape) > 0:
+            out = {"rows": int(shape[0])}
+            if len(shape) > 1:
+                out["assets"] = int(shape[1])
+            return out
+    return {}
+
+@contextmanager
+def profile_block(name: str, **meta: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Record the enclosed block under name. Extra keyword arguments (e.g. rows,
+    assets) are stored with the record; the yielded dict can be updated
+    inside the block to add more once they are known.
+    """
+    if not _STATE.enabled:
+        yield meta
+        return
+
+    stack = getattr(_STATE.local, "stack", None)
+    if stack is None:
+        stack = _STATE.local.stack = []
+
+    frame = {"mem_start": 0, "mem_peak": 0}
+    if _STATE.memory and tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        if stack:
+            # The open parent keeps the peak reached so far before we reset it
+            stack[-1]["mem_peak"] = max(stack[-1]["mem_peak"], peak)
+        tracemalloc.reset_peak()
+        frame["mem_start"] = frame["mem_peak"] = current
+    stack.append(frame)
+
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        yield meta
+    finally:
+        wall = time.perf_counter() - wall_start
+        cpu = time.thread_time() - cpu_start
+        stack.pop()
+
+        record = {
+            "name": name,
+            "start": wall_start - _STATE.origin,
+            "wall": wall,
+            "cpu": cpu,
+            "thread": threading.get_ident(),
+            "pid": os.getpid(),
+        }
+        if _STATE.memory and tracemalloc.is_tracing():
+            peak = max(frame["mem_peak"], tracemalloc.get_traced_memory()[1])
+            record["peak_memory"] = peak - frame["mem_start"]
+            if stack:
+                stack[-1]["mem_peak"] = max(stack[-1]["mem_peak"], peak)
+        record.update(meta)
+
+        with _STATE.lock:
+            _STATE.records.append(record)
+
+def profiled(name: Optional[str] = None) -> Callable:
+    """
+    Decorator recording every call of the function (see profile_block).
+    The record is named module.function unless name is given, and gets
+    rows/assets from the first positional argument that has a shape.
+    """
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        label = name or f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _STATE.enabled:
+                return fn(*args, **kwargs)
+            with profile_block(label, **_shape_of(args)):
+                return fn(*args, **kwargs)
+
+        return wrapper
+    return decorator
+
+# Reports and exports
+
+RECORD_FIELDS = ["name", "start", "wall", "cpu", "peak_memory", "rows", "assets", "thread", "pid"]
+
+def profile_summary() -> List[Dict[str, Any]]:
+    """
+    One row per name: calls, total/mean/max wall time, total CPU time and
+    max peak memory, sorted by total wall time (slowest first).
+    """
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for record in profile_records():
+        groups.setdefault(record["name"], []).append(record)
+
+    rows = []
+    for name, records in groups.items():
+        walls = [r["wall"] for r in records]
+        peaks = [r["peak_memory"] for r in records if "peak_memory" in r]
+        rows.append({
+            "name": name,
+            "calls": len(records),
+            "wall_total": sum(walls),
+            "wall_mean": sum(walls) / len(walls),
+            "wall_max": max(walls),
+            "cpu_total": sum(r["cpu"] for r in records),
+            "peak_memory_max": max(peaks) if peaks else None,
+        })
+    return sorted(rows, key=lambda r: r["wall_total"], reverse=True)
+
+def export_json(path) -> Path:
+    """
+    {"records": [...], "summary": [...]} with times in seconds and memory in bytes.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"records": profile_records(), "summary": profile_summary()}, f, indent=1)
+    return path
+
+def export_csv(path) -> Path:
+    """
+    One row per recorded call (RECORD_FIELDS first, then any extra metadata).
+    """
+    records = profile_records()
+    extra = sorted({k for r in records for k in r} - set(RECORD_FIELDS))
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=RECORD_FIELDS + extra)
+        writer.writeheader()
+        writer.writerows(records)
+    return path
+
+def export_chrome_trace(path) -> Path:
+    """
+    Chrome trace-event JSON (open in chrome://tracing or https://ui.perfetto.dev).
+    Every call is a complete ("X") event on its thread's track.
+    """
+    events = []
+    for record in profile_records():
+        args = {k: v for k, v in record.items() if k not in ("name", "start", "wall", "thread", "pid")}
+        events.append({
+            "name": record["name"],
+            "cat": record["name"].split(".", 1)[0],
+            "ph": "X",
+            "ts": 1e6 * record["start"],
+            "dur": 1e6 * record["wall"],
+            "pid": record["pid"],
+            "tid": record["thread"],
+            "args": args,
+        })
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    return path
+
+_EXPORTERS = {
+    "json": (".json", export_json),
+    "csv": (".csv", export_csv),
+    "chrome": (".trace.json", export_chrome_trace),
+}
+
+# YAML toggle
+
+def configure_profiling(cfg: Dict[str, Any]) -> bool:
+    """
+    Enable or disable profiling from the config's profiling section
+    (enabled, memory). Returns whether profiling is now enabled.
+    """
+    section = cfg.get("profiling") or {}
+    if section.get("enabled", False):
+        reset_profile()
+        enable_profiling(memory=section.get("memory", False))
+    else:
+        disable_profiling()
+    return profiling_enabled()
+
+def write_profile(cfg: Dict[str, Any]) -> List[Path]:
+    """
+    Export the records to profiling.output (path prefix relative to the repo
+    root) in every format listed in profiling.formats (json, csv, chrome).
+    Does nothing when profiling is disabled.
+    """
+    section = cfg.get("profiling") or {}
+    if not profiling_enabled() or not section.get("enabled", False):
+        return []
+
+    prefix = Path(section.get("output", "data/profiles/profile"))
+    if not prefix.is_absolute():
+        prefix = get_project_root() / prefix
+
+    paths = []
+    for fmt in section.get("formats", ["json", "csv", "chrome"]):
+        if fmt not in _EXPORTERS:
+            raise ValueError(f"Unknown profile format '{fmt}'. Available: {list(_EXPORTERS)}")
+        suffix, exporter = _EXPORTERS[fmt]
+        paths.append(exporter(prefix.with_name(prefix.name + suffix)))
+        log.info("Wrote %s", paths[-1])
+
+    top = profile_summary()[:5]
+    log.info("Slowest: %s", ", ".join(f"{r['name']} {r['wall_total']:.2f}s ({r['calls']}x)" for r in top))
+    return paths
@@ -0,0 +1,72 @@
+import pandas as pd
+
+import spy_volatility.benchmarks.suite  # noqa: F401  (registers the cases)
+from spy_volatility.benchmarks.harness import (
+    CASES,
+    BenchmarkCase,
+    append_history,
+    find_regressions,
+    load_history,
+    run_suite,
+    synthetic_returns,
+    time_case,
+)
+
+
+def test_suite_covers_hot_paths():
+    for name in [
+        "compute_returns",
+        "compute_realized_volatility",
+        "rolling_sample_covariance",
+        "covariance_diagnostics",
+        "add_jitter",
+        "clip_eigenvalues",
+        "fit_garch_11",
+        "fit_var_1",
+        "fit_var",
+        "walkforward_var_backtest",
+    ]:
+        assert name in CASES
+
+
+def test_synthetic_data_is_sized_and_reproducible():
+    returns = synthetic_returns(1, 3)
+    assert sum(c.endswith("_Log_Return") for c in returns.columns) == 3
+    assert 250 <= len(returns) <= 262
+    assert not returns.isna().any().any()
+    # lru_cache bypassed: regenerated data is identical
+    pd.testing.assert_frame_equal(synthetic_returns.__wrapped__(1, 3), returns)
+
+
+def test_time_case_gives_fresh_inputs_to_mutating_cases():
+    seen = []
+
+    def mutate(x):
+        seen.append(len(x))
+        x.append(0)
+
+    case = BenchmarkCase("mutate", mutate, setup=lambda t, n: ([1] * n,), fresh_inputs=True)
+    record = time_case(case, years=1, n_assets=3, repeat=3)
+    assert seen == [3, 3, 3, 3]  # warm-up + 3 repeats, each on a fresh list
+    assert record["number"] == 1 and record["min"] <= record["median"]
+
+
+def test_history_round_trip_and_regressions(tmp_path):
+    records = run_suite(years=[1], n_assets=[3], cases=["covariance_diagnostics", "fit_var_1"], repeat=1, min_time=0.0)
+    assert [r["case"] for r in records] == ["covariance_diagnostics", "fit_var_1"]
+
+    path = tmp_path / "history.jsonl"
+    assert find_regressions(records, load_history(path)) == []  # No history yet
+    append_history(records, path)
+    history = load_history(path)
+    assert len(history) == 2
+
+    slower = [dict(r, min=r["min"] * 2) for r in records]
+    slower[1]["min"] = records[1]["min"]
+    regressions = find_regressions(slower, history, tolerance=0.25)
+    assert [r["case"] for r in regressions] == ["covariance_diagnostics"]
+    assert abs(regressions[0]["ratio"] - 2.0) < 1e-9
+
+    # Results from another machine are not compared
+    elsewhere = [dict(r, machine="other") for r in slower]
+    assert find_regressions(elsewhere, history) == []
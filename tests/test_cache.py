@@ -0,0 +1,142 @@
+import importlib
+import sys
+
+import numpy as np
+import pandas as pd
+
+from spy_volatility.risk.cov_cube import CovarianceCube
+from spy_volatility.utils import cache as cache_module
+from spy_volatility.utils.cache import ResultCache, fingerprint
+
+
+def make_returns(seed=0, n_obs=200):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2020-01-01", periods=n_obs, name="Date")
+    return pd.Series(rng.normal(0, 0.01, n_obs), index=dates, name="SPY_Log_Return")
+
+
+def test_fingerprint_tracks_content():
+    r = make_returns()
+    assert fingerprint(r) == fingerprint(r.copy())
+    assert fingerprint(r, {"p": 1, "q": 1}) == fingerprint(r.copy(), {"q": 1, "p": 1})
+
+    changed = r.copy()
+    changed.iloc[-1] += 1e-12
+    assert fingerprint(changed) != fingerprint(r)
+    assert fingerprint(r.iloc[:-1]) != fingerprint(r)
+    assert fingerprint(r.rename("XLF_Log_Return")) != fingerprint(r)
+    assert fingerprint(r, {"p": 1}) != fingerprint(r, {"p": 2})
+    assert fingerprint(r.to_frame()) != fingerprint(r)
+
+
+def test_call_computes_once_across_tiers(tmp_path):
+    calls = []
+
+    def rolling_vol(returns, window=21):
+        calls.append(window)
+        return returns.rolling(window).std()
+
+    r = make_returns()
+    cache = ResultCache(tmp_path)
+    first = cache.call(rolling_vol, r, window=21)
+    again = cache.call(rolling_vol, r.copy(), window=21)
+    pd.testing.assert_series_equal(first, again)
+    assert calls == [21]
+    assert cache.hits["memory"] == 1
+
+    # Mutating a returned value does not touch the cached one
+    again.iloc[:] = 0.0
+    pd.testing.assert_series_equal(cache.call(rolling_vol, r, window=21), first)
+
+    # New process: memory tier is empty, disk tier answers
+    fresh = ResultCache(tmp_path)
+    pd.testing.assert_series_equal(fresh.call(rolling_vol, r, window=21), first)
+    assert calls == [21] and fresh.hits["disk"] == 1
+
+    # Different spec or data recomputes
+    cache.call(rolling_vol, r, window=63)
+    cache.call(rolling_vol, make_returns(seed=1), window=21)
+    assert calls == [21, 63, 21]
+
+
+def test_lru_eviction_by_size(tmp_path):
+    payload = np.zeros(10_000)  # ~80 KB pickled
+    cache = ResultCache(tmp_path, max_bytes=250_000, memory_items=1)
+    for i in range(3):
+        cache.put(f"entry-{i}", payload + i)
+
+    # Touch entry-0 so entry-1 becomes least recently used
+    cache._memory.clear()
+    np.testing.assert_array_equal(cache.get("entry-0"), payload)
+    cache.put("entry-3", payload + 3)
+
+    assert "entry-1" not in cache
+    assert all(f"entry-{i}" in cache for i in (0, 2, 3))
+    assert cache.size_bytes() <= 250_000
+
+
+def test_disabled_cache_and_corrupt_entry(tmp_path):
+    calls = []
+
+    def fit(x):
+        calls.append(1)
+        return x * 2
+
+    off = ResultCache(tmp_path, enabled=False)
+    off.call(fit, 1)
+    off.call(fit, 1)
+    assert len(calls) == 2
+
+    cache = ResultCache(tmp_path)
+    cache.put("bad", 1)
+    cache._memory.clear()
+    (tmp_path / "bad.pkl").write_bytes(b"not a pickle")
+    assert cache.get("bad", "missing") == "missing"
+    assert not (tmp_path / "bad.pkl").exists()
+
+
+def test_key_tracks_callees_dependencies_and_version(tmp_path, monkeypatch):
+    module_dir = tmp_path / "src"
+    module_dir.mkdir()
+    source = "def _kernel(x):\n    return x + {}\n\ndef fit(x):\n    return _kernel(x)\n"
+    (module_dir / "cached_fit_module.py").write_text(source.format(1))
+    monkeypatch.syspath_prepend(str(module_dir))
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)  # reload must see the edit
+    monkeypatch.setitem(sys.modules, "cached_fit_module", None)  # removed again afterwards
+    del sys.modules["cached_fit_module"]
+    module = importlib.import_module("cached_fit_module")
+
+    cache = ResultCache(tmp_path / "cache")
+    assert cache.call(module.fit, 1) == 2
+
+    # Editing a helper the cached function calls invalidates its entries
+    (module_dir / "cached_fit_module.py").write_text(source.format(10))
+    module = importlib.reload(module)
+    cache_module._module_hash.cache_clear()
+    assert cache.call(module.fit, 1) == 11
+
+    # So do dependency upgrades and an explicit version salt
+    calls = []
+
+    def fit(x):
+        calls.append(x)
+        return x
+
+    cache.call(fit, 1)
+    cache.call(fit, 1, version=2)
+    monkeypatch.setattr(cache_module, "_dependency_versions", lambda: "numpy=0.0")
+    cache.call(fit, 1)
+    assert calls == [1, 1, 1]
+
+
+def test_cached_covariance_cube_is_copied(tmp_path):
+    def rolling_cov(returns):
+        values = np.ones((len(returns), 2, 2))
+        return {"cov": CovarianceCube(values, returns.index, ["A", "B"])}
+
+    cache = ResultCache(tmp_path)
+    r = make_returns()
+    first = cache.call(rolling_cov, r)["cov"]
+    first.values[:] = 0.0
+    second = cache.call(rolling_cov, r)["cov"]
+    assert second is not first and (second.values == 1.0).all()
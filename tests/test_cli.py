@@ -0,0 +1,51 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from spy_volatility.cli import FIGURE_COMMANDS, build_parser
+
+HEAVY_MODULES = ["pandas", "matplotlib", "scipy", "statsmodels", "arch", "numba", "yfinance"]
+
+# Quick commands must start well under a second
+IMPORT_BUDGET_SECONDS = 0.5
+
+
+def run_isolated(code):
+    # Fresh interpreter: this test process has already imported everything
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def test_config_command_stays_light():
+    result = run_isolated(
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "from spy_volatility.cli import main\n"
+        "main(['config'])\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"print(json.dumps({{'elapsed': elapsed, 'loaded': [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))\n"
+    )
+    assert result["loaded"] == []
+    assert result["elapsed"] < IMPORT_BUDGET_SECONDS
+
+
+@pytest.mark.parametrize("module", ["spy_volatility.models.garch_models", "spy_volatility.models.var"])
+def test_model_modules_defer_heavy_imports(module):
+    loaded = run_isolated(
+        f"import json, sys; import {module}\n"
+        "print(json.dumps([m for m in ['scipy', 'statsmodels', 'arch', 'numba'] if m in sys.modules]))\n"
+    )
+    assert loaded == []
+
+
+def test_parser_covers_every_figure_stage():
+    from spy_volatility.pipeline.report import FIGURE_STAGES
+
+    assert sorted(stage for stage, _ in FIGURE_COMMANDS.values()) == sorted(FIGURE_STAGES)
+
+    args = build_parser().parse_args(["backtest", "--workers", "2", "--force-render"])
+    assert args.command == "backtest" and args.workers == 2 and args.force_render
+    args = build_parser().parse_args(["report", "fig_garch_vs_rv", "--list"])
+    assert args.targets == ["fig_garch_vs_rv"] and args.list
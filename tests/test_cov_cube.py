@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+from spy_volatility.risk.cov_cube import CovarianceCube
+
+
+def make_cube(n_dates=10, n_assets=3, packed=False):
+    rng = np.random.default_rng(1)
+    x = rng.standard_normal((n_dates, 5, n_assets))
+    values = np.einsum("tki,tkj->tij", x, x)
+    dates = pd.bdate_range("2020-01-01", periods=n_dates)
+    return CovarianceCube.from_dense(values, dates, ["A", "B", "C"], packed=packed), values
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_date_and_positional_access(packed):
+    cube, values = make_cube(packed=packed)
+
+    date = cube.dates[3]
+    assert date in cube
+    assert cube.get_loc(date) == 3
+    np.testing.assert_array_equal(cube[date].to_numpy(), values[3])
+    np.testing.assert_array_equal(cube.iloc[3].to_numpy(), values[3])
+    assert list(cube[date].columns) == ["A", "B", "C"]
+
+    sub = cube[cube.dates[2]:cube.dates[5]]
+    assert len(sub) == 4
+    np.testing.assert_array_equal(sub.to_array(), values[2:6])
+    np.testing.assert_array_equal(cube.iloc[-2:].to_array(), values[-2:])
+
+
+def test_packed_storage_halves_values():
+    cube, values = make_cube(packed=True)
+    assert cube.values.shape == (10, 6)
+    np.testing.assert_array_equal(cube.to_dense().values, values)
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_save_and_memmap_load(tmp_path, packed):
+    cube, values = make_cube(packed=packed)
+    cube.save(tmp_path / "cube")
+
+    loaded = CovarianceCube.load(tmp_path / "cube")
+    assert isinstance(loaded.values, np.memmap)
+    assert loaded.packed == packed
+    assert loaded.dates.equals(cube.dates)
+    assert list(loaded.assets) == ["A", "B", "C"]
+    np.testing.assert_array_equal(loaded.to_array(), values)
+
+
+def test_open_memmap_fills_on_disk(tmp_path):
+    _, values = make_cube()
+    dates = pd.bdate_range("2020-01-01", periods=10)
+    cube = CovarianceCube.open_memmap(tmp_path / "cube", dates, ["A", "B", "C"], packed=True)
+    assert isinstance(cube.values, np.memmap) and cube.values.shape == (10, 6)
+
+    rows, cols = np.triu_indices(3)
+    for i in range(10):
+        cube.values[i] = values[i][rows, cols]
+    cube.flush()
+    np.testing.assert_array_equal(CovarianceCube.load(tmp_path / "cube").to_array(), values)
+
+    copied = cube.copy()
+    assert not isinstance(copied.values, np.memmap) and copied.packed
+    np.testing.assert_array_equal(copied.to_array(), values)
@@ -0,0 +1,150 @@
+import numpy as np
+import pandas as pd
+import pytest
+from spy_volatility.risk.cov_cube import CovarianceCube
+from spy_volatility.risk.cov_metrics import (
+    covariance_diagnostics,
+    covariance_diagnostics_stack,
+    ewma_covariance,
+    rolling_covariance_stack,
+    rolling_sample_covariance,
+    rolling_shrinkage_covariance,
+)
+
+
+def make_returns(n_obs=300, n_assets=4, seed=0):
+    rng = np.random.default_rng(seed)
+    x = 0.01 * rng.standard_normal((n_obs, n_assets)) + 5e-4
+    index = pd.bdate_range("2015-01-01", periods=n_obs)
+    columns = [f"A{i}_Log_Return" for i in range(n_assets)]
+    return pd.DataFrame(x, index=index, columns=columns)
+
+
+def reference_rolling_cov(returns, window):
+    x = returns.to_numpy()
+    out = []
+    for idx in range(window, len(returns)):
+        xc = x[idx - window: idx] - x[idx - window: idx].mean(axis=0)
+        out.append(xc.T @ xc / (window - 1))
+    return np.array(out)
+
+
+@pytest.mark.parametrize("recompute_every", [None, 1, 7, 100])
+def test_rolling_covariance_stack_matches_per_window_loop(recompute_every):
+    returns = make_returns()
+    cov, dates, assets = rolling_covariance_stack(
+        returns, window=21, recompute_every=recompute_every
+    )
+
+    expected = reference_rolling_cov(returns, 21)
+    assert cov.shape == expected.shape
+    np.testing.assert_allclose(cov, expected, rtol=1e-9, atol=1e-15)
+    assert dates.equals(returns.index[21:])
+    assert list(assets) == ["A0", "A1", "A2", "A3"]
+
+
+def test_rolling_sample_covariance_keys_and_labels():
+    returns = make_returns(n_obs=40)
+    cov = rolling_sample_covariance(returns, window=10)
+
+    first = returns.index[10]
+    assert list(cov.keys())[0] == first
+    assert list(cov[first].columns) == ["A0", "A1", "A2", "A3"]
+    np.testing.assert_allclose(cov[first].to_numpy(), np.cov(returns.iloc[:10].to_numpy().T))
+
+
+def test_rolling_covariance_stack_rejects_nan():
+    returns = make_returns(n_obs=40)
+    returns.iloc[5, 0] = np.nan
+    with pytest.raises(ValueError):
+        rolling_covariance_stack(returns, window=10)
+
+
+@pytest.mark.parametrize("extremes_only", [False, True])
+def test_covariance_diagnostics_stack_matches_single(extremes_only):
+    cov, dates, assets = rolling_covariance_stack(make_returns(n_obs=80), window=21)
+    diag = covariance_diagnostics_stack(cov, extremes_only=extremes_only)
+
+    for i in [0, 30, len(dates) - 1]:
+        eig = np.linalg.eigvalsh(cov[i])
+        assert diag["min_eigenvalue"][i] == pytest.approx(eig[0], rel=1e-8)
+        assert diag["max_eigenvalue"][i] == pytest.approx(eig[-1], rel=1e-8)
+
+    single = covariance_diagnostics(pd.DataFrame(cov[0], index=assets, columns=assets))
+    assert single["condition_number"] == pytest.approx(diag["condition_number"][0])
+
+    # Indefinite matrices: the smallest eigenvalue is negative, not the one closest to zero
+    indefinite = np.stack([np.diag([-5.0, 0.1, 10.0, 3.0]), np.diag([1e-12, 2.0, -1e-3, 4.0])])
+    rotation = np.linalg.qr(np.random.default_rng(0).normal(size=(4, 4)))[0]
+    indefinite = rotation @ indefinite @ rotation.T
+    diag = covariance_diagnostics_stack(indefinite, extremes_only=extremes_only)
+    np.testing.assert_allclose(diag["min_eigenvalue"], [-5.0, -1e-3], rtol=1e-8)
+    np.testing.assert_allclose(diag["condition_number"], [-2.0, -4e3], rtol=1e-8)
+
+
+def reference_shrinkage(x, method):
+    # scikit-learn's ledoit_wolf / oas on one window
+    n, p = x.shape
+    x = x - x.mean(axis=0)
+    S = x.T @ x / n
+    mu = np.trace(S) / p
+    if method == "oas":
+        alpha = np.mean(S ** 2)
+        den = (n + 1) * (alpha - mu ** 2 / p)
+        s = 1.0 if den == 0 else min((alpha + mu ** 2) / den, 1.0)
+    else:
+        x2 = x ** 2
+        beta_, delta_ = np.sum(x2.T @ x2), np.sum((x.T @ x) ** 2) / n ** 2
+        beta = (beta_ / n - delta_) / (p * n)
+        delta = (delta_ - 2 * mu * np.trace(S) + p * mu ** 2) / p
+        beta = min(beta, delta)
+        s = 0.0 if beta == 0 else beta / delta
+    return (1 - s) * S + s * mu * np.eye(p), s
+
+
+@pytest.mark.parametrize("method", ["ledoit_wolf", "oas"])
+def test_rolling_shrinkage_matches_per_window_estimators(method):
+    returns = make_returns(n_obs=200, n_assets=6, seed=3)
+    returns += 0.02  # Large mean: the running fourth moments must stay accurate
+    out = rolling_shrinkage_covariance(returns, window=20, method=method)
+    cube, shrinkage = out["cov"], out["shrinkage"]
+    assert len(cube) == 180 and (shrinkage.index == cube.dates).all()
+
+    x = returns.to_numpy()
+    for k, idx in enumerate(range(20, 200)):
+        expected, s = reference_shrinkage(x[idx - 20: idx], method)
+        np.testing.assert_allclose(cube.matrix(k), expected, rtol=1e-9, atol=1e-15)
+        assert shrinkage.iloc[k] == pytest.approx(s, rel=1e-9)
+
+    # Window shorter than the universe: the sample covariance is singular, the shrunk one is not
+    wide = rolling_shrinkage_covariance(make_returns(n_obs=60, n_assets=12), window=8, method=method)
+    assert covariance_diagnostics_stack(wide["cov"])["min_eigenvalue"].min() > 0
+
+    with pytest.raises(ValueError):
+        rolling_shrinkage_covariance(returns, window=20, method="median")
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_ewma_covariance_several_halflives_in_one_pass(tmp_path, packed):
+    returns = make_returns(n_obs=150, n_assets=3)
+    x = returns.to_numpy()
+    out = ewma_covariance(returns, halflives=[5, 30], min_periods=10, packed=packed)
+    assert list(out) == [5, 30]
+
+    for halflife, cube in out.items():
+        assert cube.packed == packed and (cube.dates == returns.index[10:]).all()
+        decay = 0.5 ** (1 / halflife)
+        expected = x[:10].T @ x[:10] / 10
+        for i, idx in enumerate(range(10, 150)):
+            if i > 0:  # Only rows before idx
+                expected = decay * expected + (1 - decay) * np.outer(x[idx - 1], x[idx - 1])
+            np.testing.assert_allclose(cube.matrix(i), expected, rtol=1e-12)
+
+    # Streamed to memory-mapped cubes on disk, same values
+    streamed = ewma_covariance(returns, halflives=[5, 30], min_periods=10, packed=packed, out_dir=tmp_path)
+    assert isinstance(streamed[30].values, np.memmap)
+    loaded = CovarianceCube.load(tmp_path / "ewma_hl30")
+    np.testing.assert_array_equal(loaded.to_array(), out[30].to_array())
+
+    with pytest.raises(ValueError):
+        ewma_covariance(returns, halflives=[0])
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+from spy_volatility.models.dcc import _dcc_composite_loglik, _dcc_pairs, fit_dcc_garch
+from spy_volatility.risk.cov_cube import CovarianceCube
+
+
+def simulate_dcc(n_obs=2500, n_assets=4, a=0.05, b=0.9, seed=0):
+    rng = np.random.default_rng(seed)
+    target = 0.5 * np.ones((n_assets, n_assets)) + 0.5 * np.eye(n_assets)
+    Q, z_prev = target.copy(), np.zeros(n_assets)
+    sigma2, e_prev = np.full(n_assets, 1e-4), np.zeros(n_assets)
+    returns = np.empty((n_obs, n_assets))
+    for t in range(n_obs):
+        if t > 0:
+            Q = (1 - a - b) * target + a * np.outer(z_prev, z_prev) + b * Q
+            sigma2 = 2e-6 + 0.08 * e_prev ** 2 + 0.9 * sigma2
+        d = 1 / np.sqrt(np.diag(Q))
+        z_prev = np.linalg.cholesky(Q * np.outer(d, d)) @ rng.standard_normal(n_assets)
+        e_prev = returns[t] = np.sqrt(sigma2) * z_prev
+    index = pd.bdate_range("2005-01-03", periods=n_obs)
+    return pd.DataFrame(returns, index=index, columns=[f"A{i}_Log_Return" for i in range(n_assets)])
+
+
+@pytest.mark.parametrize("pairs", ["contiguous", "all"])
+def test_fit_dcc_garch_recovers_parameters(pairs):
+    returns = simulate_dcc()
+    out = fit_dcc_garch(returns, pairs=pairs, n_jobs=1)
+    assert out["converged"]
+    assert out["params"]["a"] == pytest.approx(0.05, abs=0.02)
+    assert out["params"]["b"] == pytest.approx(0.9, abs=0.04)
+
+    cov = out["cov"]
+    assert cov.to_array().shape == (2500, 4, 4) and (cov.dates == returns.index).all()
+    assert list(cov.assets) == ["A0", "A1", "A2", "A3"]
+    assert np.linalg.eigvalsh(cov.to_array()).min() > 0
+    # Diagonal: the univariate GARCH variances
+    garch_vol = out["std_resid"].rdiv(returns.to_numpy() - out["garch_params"]["mu"].to_numpy() / 100)
+    np.testing.assert_allclose(np.sqrt(np.diagonal(cov.to_array(), axis1=1, axis2=2)), garch_vol, rtol=1e-10)
+    assert out["forecast"].shape == (4, 4)
+
+
+def test_packed_and_memmap_output_match_dense(tmp_path):
+    returns = simulate_dcc(n_obs=600, n_assets=3)
+    dense = fit_dcc_garch(returns, n_jobs=1)
+    packed = fit_dcc_garch(returns, n_jobs=1, packed=True, out_dir=tmp_path)
+
+    cube = packed["cov"]
+    assert cube.packed and isinstance(cube.values, np.memmap) and cube.values.shape == (600, 6)
+    np.testing.assert_array_equal(cube.to_array(), dense["cov"].to_array())
+    np.testing.assert_array_equal(packed["forecast"], dense["forecast"])
+    np.testing.assert_array_equal(CovarianceCube.load(tmp_path / "dcc_cov").to_array(), dense["cov"].to_array())
+
+
+def test_composite_likelihood_of_one_pair_is_the_full_likelihood():
+    rng = np.random.default_rng(1)
+    z = rng.standard_normal((300, 2)) @ np.array([[1.0, 0.4], [0.0, 0.9]])
+    S = z.T @ z / len(z)
+    a, b = 0.04, 0.93
+
+    full, Q = 0.0, S.copy()
+    for t in range(len(z)):
+        if t > 0:
+            Q = (1 - a - b) * S + a * np.outer(z[t - 1], z[t - 1]) + b * Q
+        d = 1 / np.sqrt(np.diag(Q))
+        R = Q * np.outer(d, d)
+        full -= 0.5 * (np.log(np.linalg.det(R)) + z[t] @ np.linalg.solve(R, z[t]) - z[t] @ z[t])
+
+    i, j = _dcc_pairs(2)
+    kernel = _dcc_composite_loglik.py_func  # Pure Python fallback too
+    for fn in (_dcc_composite_loglik, kernel):
+        assert fn(z, S[i, i], S[j, j], S[i, j], i, j, a, b) == pytest.approx(full, rel=1e-10)
+
+
+def test_pairs_and_input_checks():
+    assert [list(p) for p in _dcc_pairs(4)] == [[0, 1, 2], [1, 2, 3]]
+    assert len(_dcc_pairs(4, "all")[0]) == 6
+    with pytest.raises(ValueError):
+        _dcc_pairs(4, "random")
+
+    returns = simulate_dcc(n_obs=50)
+    with pytest.raises(ValueError):
+        fit_dcc_garch(returns[["A0_Log_Return"]], n_jobs=1)
+    returns.iloc[3, 1] = np.nan
+    with pytest.raises(ValueError):
+        fit_dcc_garch(returns, n_jobs=1)
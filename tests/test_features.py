@@ -0,0 +1,154 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from spy_volatility.data.features import (
+    OnlineEstimator,
+    OnlineEWMAVariance,
+    OnlineGARCHFilter,
+    OnlineLogReturn,
+    OnlineRealizedVolatility,
+    compute_ewma_volatility,
+    compute_realized_volatility,
+    compute_realized_volatility_panel,
+    compute_returns,
+)
+from spy_volatility.models.garch_models import _garch11_recursion
+
+
+def make_prices(n_obs=600, tickers=("SPY", "XLF", "XLK"), seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2015-01-01", periods=n_obs, name="Date")
+    paths = 100 * np.exp(np.cumsum(rng.normal(0, 0.012, size=(n_obs, len(tickers))), axis=0))
+    return pd.DataFrame(paths, index=dates, columns=[f"{t}_Adj_Close" for t in tickers])
+
+
+def test_compute_returns_and_rv_match_pandas():
+    prices = make_prices()
+    returns = compute_returns(prices.copy(), price_col=list(prices.columns))
+    expected = np.log(prices["XLF_Adj_Close"]).diff()
+    np.testing.assert_array_equal(returns["XLF_Log_Return"], expected)
+    np.testing.assert_array_equal(returns["XLF_Squared_Return"], expected ** 2)
+    assert list(returns.columns) == sorted(returns.columns)
+
+    spy = compute_returns(prices.copy(), price_col=["SPY_Adj_Close"])[["SPY_Log_Return", "SPY_Squared_Return"]]
+    spy.iloc[100, :] = np.nan
+    rv = compute_realized_volatility(spy, window=21)
+    reference = np.sqrt(252 * spy["SPY_Squared_Return"].rolling(21).mean())
+    pd.testing.assert_series_equal(rv, reference, check_exact=False, rtol=1e-12)
+
+
+def test_online_estimators_match_batch_bit_for_bit():
+    prices = make_prices()
+    tickers = ["SPY", "XLF", "XLK"]
+    batch = compute_returns(prices.copy(), price_col=list(prices.columns))
+
+    log_return = OnlineLogReturn(n_assets=3)
+    rv = OnlineRealizedVolatility(window=21, n_assets=3)
+    ewma = OnlineEWMAVariance(lam=0.94, n_assets=3)
+    rows_r, rows_rv, rows_ewma = [], [], []
+    for row in prices.to_numpy():
+        r = log_return.update(row)
+        rows_r.append(r)
+        rows_rv.append(rv.update(r ** 2))
+        rows_ewma.append(ewma.update(r ** 2))
+
+    for j, t in enumerate(tickers):
+        single = batch[[f"{t}_Log_Return", f"{t}_Squared_Return"]]
+        np.testing.assert_array_equal(np.array(rows_r)[:, j], single[f"{t}_Log_Return"])
+        np.testing.assert_array_equal(np.array(rows_rv)[:, j], compute_realized_volatility(single, window=21))
+        np.testing.assert_array_equal(np.array(rows_ewma)[:, j], compute_ewma_volatility(single, lam=0.94))
+
+
+def test_online_garch_matches_recursion():
+    rng = np.random.default_rng(1)
+    resid = rng.standard_t(6, size=500)
+    omega, alpha, beta = 0.02, 0.08, 0.9
+    expected = _garch11_recursion(resid, omega, alpha, beta, 1.0)
+
+    garch = OnlineGARCHFilter(omega, alpha, beta, sigma2=1.0)
+    out = garch.update_many(resid[:, None])[:, 0]
+    np.testing.assert_array_equal(out, expected[1:])
+
+
+def test_checkpoint_restore_continues_identically(tmp_path):
+    rng = np.random.default_rng(2)
+    squared = rng.normal(size=(300, 2)) ** 2
+    squared[37, 1] = np.nan
+
+    for make in (
+        lambda: OnlineRealizedVolatility(window=21, n_assets=2),
+        lambda: OnlineEWMAVariance(lam=0.97, n_assets=2),
+        lambda: OnlineGARCHFilter([0.02, 0.05], [0.05, 0.1], [0.9, 0.85], sigma2=[1.0, 1.0]),
+    ):
+        uninterrupted = make()
+        expected = uninterrupted.update_many(squared)
+
+        first = make()
+        head = first.update_many(squared[:150])
+        np.savez(tmp_path / "state.npz", **first.state_dict())
+        restored = type(first).from_state(np.load(tmp_path / "state.npz"))
+        tail = restored.update_many(squared[150:])
+
+        np.testing.assert_array_equal(np.vstack([head, tail]), expected)
+
+    class NoUpdate(OnlineEstimator):
+        _state_fields = ("count",)
+
+    with pytest.raises(TypeError, match="update"):
+        NoUpdate()
+
+
+def make_ohlc(n_obs=400, tickers=("SPY", "XLF"), seed=3):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2018-01-01", periods=n_obs, name="Date")
+    frame = {}
+    for t in tickers:
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n_obs)))
+        open_ = close * np.exp(rng.normal(0, 0.004, n_obs))
+        frame[f"{t}_Open"] = open_
+        frame[f"{t}_High"] = np.maximum(open_, close) * np.exp(np.abs(rng.normal(0, 0.005, n_obs)))
+        frame[f"{t}_Low"] = np.minimum(open_, close) * np.exp(-np.abs(rng.normal(0, 0.005, n_obs)))
+        frame[f"{t}_Close"] = close
+        frame[f"{t}_Adj_Close"] = close
+    return pd.DataFrame(frame, index=dates)
+
+
+def test_rv_panel_matches_single_series():
+    prices = make_ohlc()
+    data = compute_returns(prices.copy(), price_col=["SPY_Adj_Close", "XLF_Adj_Close"])
+    windows = [5, 21, 63]
+    panel = compute_realized_volatility_panel(data, windows=windows)
+
+    assert panel.shape == (len(data), 2 * len(windows))
+    assert list(panel.columns) == [(t, w) for t in ["SPY", "XLF"] for w in windows]
+    cube = panel.to_numpy().reshape(len(data), 2, len(windows))
+
+    for j, t in enumerate(["SPY", "XLF"]):
+        single = data[[f"{t}_Log_Return", f"{t}_Squared_Return"]]
+        for k, w in enumerate(windows):
+            np.testing.assert_array_equal(cube[:, j, k], compute_realized_volatility(single, window=w))
+
+
+def test_rv_panel_range_and_ewma_estimators():
+    prices = make_ohlc()
+    data = compute_returns(prices.copy(), price_col=["SPY_Adj_Close", "XLF_Adj_Close"])
+
+    park = compute_realized_volatility_panel(data, windows=[21], estimator="parkinson", annualization=1)
+    hl = np.log(prices["XLF_High"] / prices["XLF_Low"]) ** 2 / (4 * np.log(2))
+    np.testing.assert_allclose(park[("XLF", 21)], np.sqrt(hl.rolling(21).mean()), rtol=1e-10)
+
+    gk = compute_realized_volatility_panel(data, windows=[21], estimator="garman_klass", annualization=1)
+    co = np.log(prices["SPY_Close"] / prices["SPY_Open"]) ** 2
+    hl = np.log(prices["SPY_High"] / prices["SPY_Low"]) ** 2
+    expected = np.sqrt((0.5 * hl - (2 * np.log(2) - 1) * co).rolling(21).mean())
+    np.testing.assert_allclose(gk[("SPY", 21)], expected, rtol=1e-10)
+
+    ewma = compute_realized_volatility_panel(data, windows=[21, 63], estimator="ewma")
+    single = data[["SPY_Log_Return", "SPY_Squared_Return"]]
+    np.testing.assert_allclose(ewma[("SPY", 63)], compute_ewma_volatility(single, lam=1 - 2 / 64), rtol=1e-14)
+
+    with pytest.raises(KeyError):
+        compute_realized_volatility_panel(data[["SPY_Log_Return"]], estimator="parkinson")
+    with pytest.raises(ValueError):
+        compute_realized_volatility_panel(data, estimator="yang_zhang")
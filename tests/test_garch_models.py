@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+import pytest
+from arch import arch_model
+from spy_volatility.models.garch_models import (
+    GARCHModel,
+    _garch11_t_kernel,
+    fit_garch_universe,
+    garch_walk_forward,
+)
+
+
+def simulate_garch(n_obs=900, omega=0.02, alpha=0.08, beta=0.9, seed=7):
+    rng = np.random.default_rng(seed)
+    z = rng.standard_t(6, size=n_obs) / np.sqrt(6 / 4)
+    sigma2 = omega / (1 - alpha - beta)
+    y = np.empty(n_obs)
+    for i in range(n_obs):
+        y[i] = np.sqrt(sigma2) * z[i]
+        sigma2 = omega + alpha * y[i] ** 2 + beta * sigma2
+    index = pd.bdate_range("2012-01-02", periods=n_obs)
+    return pd.Series(y / 100, index=index)
+
+
+def test_walk_forward_uses_only_past_information():
+    returns = simulate_garch()
+    out = garch_walk_forward(returns, refit_every=150, min_obs=500, annualization=1)
+    forecast = out["forecast"]
+
+    assert forecast.index[0] == returns.index[499]
+    assert len(out["params"]) == 3
+    assert forecast.notna().all()
+
+    # Same forecasts keyed by the date they apply to
+    target = out["forecast_by_target"]
+    assert target.index[0] == returns.index[500] and target.index[-1] == returns.index[-1]
+    np.testing.assert_array_equal(target.to_numpy(), forecast.to_numpy()[:-1])
+    pd.testing.assert_series_equal(target, forecast.shift(1).reindex(target.index))
+
+    # Shocking the future must not change forecasts made before it
+    shocked = returns.copy()
+    shocked.iloc[700:] *= 5
+    shocked_forecast = garch_walk_forward(shocked, refit_every=150, min_obs=500, annualization=1)["forecast"]
+    pd.testing.assert_series_equal(forecast.loc[:returns.index[699]], shocked_forecast.loc[:returns.index[699]])
+    assert not np.allclose(forecast.iloc[-50:], shocked_forecast.iloc[-50:])
+
+
+def test_walk_forward_refits_on_calendar_periods():
+    returns = simulate_garch(n_obs=560)
+    out = garch_walk_forward(returns, refit_every="M", window=400, min_obs=500, annualization=1)
+
+    refit_dates = out["params"].index
+    assert refit_dates[0] == returns.index[499]
+    assert all(d.month != p.month for p, d in zip(refit_dates[:-1], refit_dates[1:]))
+    assert (out["params"][["alpha", "beta"]].sum(axis=1) < 1).all()
+
+
+def test_fit_garch_universe_parallel_matches_serial_and_captures_failures():
+    returns = pd.DataFrame({
+        "AAA_Log_Return": simulate_garch(seed=1),
+        "BBB_Log_Return": simulate_garch(seed=2),
+        "CCC_Log_Return": np.nan,
+    })
+    returns.iloc[:100, 1] = np.nan  # Later listing date
+
+    serial = fit_garch_universe(returns, n_jobs=1)
+    parallel = fit_garch_universe(returns, n_jobs=2, chunks_per_worker=2)
+
+    assert list(serial["params"].index) == ["AAA", "BBB", "CCC"]
+    assert list(serial["errors"]) == ["CCC"]
+    pd.testing.assert_frame_equal(serial["params"], parallel["params"])
+    pd.testing.assert_frame_equal(serial["cond_vol"], parallel["cond_vol"])
+    assert serial["cond_vol"]["BBB"].iloc[:100].isna().all()
+    assert serial["cond_vol"]["BBB"].iloc[100:].notna().all()
+
+
+def test_native_garch_matches_arch():
+    returns = simulate_garch(n_obs=1500)
+    native = GARCHModel(annualization=1).fit(returns)
+    reference = arch_model(100 * returns, mean="Constant", vol="GARCH", p=1, o=0, q=1, dist="t").fit(disp="off")
+
+    np.testing.assert_allclose(native.params_, reference.params.to_numpy(), rtol=1e-3, atol=1e-4)
+    assert native.loglik_ == pytest.approx(reference.loglikelihood, abs=1e-4)
+    np.testing.assert_allclose(
+        native.conditional_volatility.to_numpy(),
+        reference.conditional_volatility.to_numpy() / 100,
+        rtol=1e-3,
+    )
+
+
+def test_native_garch_gradient_matches_finite_differences():
+    model = GARCHModel()
+    y = 100 * simulate_garch(n_obs=600).to_numpy()
+    params = np.array([0.01, 0.03, 0.1, 0.85, 7.0])
+
+    _, grad, _ = model.loglikelihood(params, y)
+    step = 1e-6
+    numeric = [
+        (model.loglikelihood(params + h, y)[0] - model.loglikelihood(params - h, y)[0]) / (2 * step)
+        for h in np.eye(5) * step
+    ]
+    np.testing.assert_allclose(grad, numeric, rtol=1e-5)
+
+    # Pure Python fallback (no numba) gives the same likelihood
+    kernel = _garch11_t_kernel.py_func
+    assert kernel is not _garch11_t_kernel
+    sigma2, grad_py = np.empty_like(y), np.empty(5)
+    backcast = model.backcast(y - y.mean())
+    compiled = _garch11_t_kernel(params, y, backcast, np.empty_like(y), np.empty(5))
+    assert kernel(params, y, backcast, sigma2, grad_py) == pytest.approx(compiled, rel=1e-12)
+
+
+def test_walk_forward_engines_agree():
+    returns = simulate_garch(n_obs=700)
+    native = garch_walk_forward(returns, refit_every=100, min_obs=500, engine="native")
+    reference = garch_walk_forward(returns, refit_every=100, min_obs=500, engine="arch")
+    np.testing.assert_allclose(native["forecast"], reference["forecast"], rtol=1e-3)
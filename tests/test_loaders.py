@@ -0,0 +1,263 @@
+import logging
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from spy_volatility.data import loaders
+from spy_volatility.data.loaders import CSVStore, ParquetStore, PriceStore
+from spy_volatility.data.sources import PriceSource
+
+
+def make_prices(start="2020-01-01", periods=10, tickers=("SPY", "XLF")):
+    dates = pd.bdate_range(start, periods=periods, name="Date")
+    rng = np.random.default_rng(0)
+    data = {}
+    for t in tickers:
+        for field in ("Close", "Adj_Close", "Volume"):
+            data[f"{t}_{field}"] = rng.uniform(50, 150, size=periods)
+    return pd.DataFrame(data, index=dates)
+
+
+def test_parquet_roundtrip_and_projection(tmp_path):
+    prices = make_prices()
+    store = ParquetStore(tmp_path / "prices.parquet")
+    assert not store.exists()
+
+    store.write(prices)
+    assert store.exists()
+    assert store.columns() == list(prices.columns)
+    pd.testing.assert_frame_equal(store.read(), prices, check_freq=False)
+
+    adj = store.read_suffix("_Adj_Close")
+    assert list(adj.columns) == ["SPY_Adj_Close", "XLF_Adj_Close"]
+    pd.testing.assert_frame_equal(adj, prices[adj.columns], check_freq=False)
+
+
+def test_parquet_append_writes_partitions_and_overrides(tmp_path):
+    prices = make_prices(periods=10)
+    store = ParquetStore(tmp_path / "prices.parquet")
+    store.write(prices.iloc[:8])
+
+    # Overlapping last row is revised, two new rows added
+    update = prices.iloc[7:].copy()
+    update.iloc[0] = 1.0
+    store.append(update)
+    assert len(store._parts()) == 2
+
+    expected = prices.copy()
+    expected.iloc[7] = 1.0
+    pd.testing.assert_frame_equal(store.read(), expected, check_freq=False)
+
+    store.compact()
+    assert len(store._parts()) == 1
+    pd.testing.assert_frame_equal(store.read(), expected, check_freq=False)
+
+
+def test_parquet_append_compacts_past_max_parts(tmp_path):
+    prices = make_prices(periods=10)
+    store = ParquetStore(tmp_path / "prices.parquet", max_parts=3)
+    store.write(prices.iloc[:6])
+    for i in range(6, 10):
+        store.append(prices.iloc[i:i + 1])
+        assert len(store._parts()) <= 3
+    assert len(store._parts()) == 2  # Compacted on the third append, one more since
+    pd.testing.assert_frame_equal(store.read(), prices, check_freq=False)
+
+
+def test_parquet_new_ticker_in_later_partition(tmp_path):
+    store = ParquetStore(tmp_path / "prices.parquet")
+    store.write(make_prices(periods=5, tickers=("SPY",)))
+    store.append(make_prices(start="2020-01-08", periods=3, tickers=("SPY", "XLK")))
+
+    adj = store.read_suffix("_Adj_Close")
+    assert list(adj.columns) == ["SPY_Adj_Close", "XLK_Adj_Close"]
+    assert adj["XLK_Adj_Close"].isna().sum() == 5
+    assert adj["SPY_Adj_Close"].notna().all()
+
+
+def test_incomplete_store_fails_on_construction(tmp_path):
+    class ReadOnlyStore(PriceStore):
+        def columns(self):
+            return []
+
+        def read(self, columns=None):
+            return pd.DataFrame()
+
+    with pytest.raises(TypeError, match="append"):
+        ReadOnlyStore(tmp_path / "prices")
+
+
+def test_csv_store_matches_parquet(tmp_path):
+    prices = make_prices()
+    csv = CSVStore(tmp_path / "prices.csv")
+    csv.write(prices.iloc[:6])
+    csv.append(prices.iloc[4:])
+
+    out = csv.read_suffix("_Adj_Close")
+    pd.testing.assert_frame_equal(out, prices[out.columns], check_freq=False)
+
+
+def test_resolve_store_migrates_existing_csv(tmp_path, monkeypatch):
+    monkeypatch.setattr(loaders, "get_project_root", lambda: tmp_path)
+    prices = make_prices()
+    (tmp_path / "data").mkdir()
+    prices.to_csv(tmp_path / "data" / "prices.csv")
+
+    cfg = {"data": {"prices_file": "data/prices.csv"}}
+    store = loaders._resolve_store(cfg, "prices_file")
+    assert isinstance(store, ParquetStore)
+    assert store.path == tmp_path / "data" / "prices.parquet"
+    pd.testing.assert_frame_equal(store.read(), prices, check_freq=False)
+
+    cfg["data"]["storage"] = "csv"
+    assert isinstance(loaders._resolve_store(cfg, "prices_file"), CSVStore)
+
+    cfg["data"]["storage"] = "hdf5"
+    with pytest.raises(ValueError):
+        loaders._resolve_store(cfg, "prices_file")
+
+
+class RecordingSource(PriceSource):
+    """
+    Serves slices of a fixed frame and records every request.
+    """
+    def __init__(self, prices, fail_first=0):
+        self.prices = prices
+        self.calls = []
+        self.fail_first = fail_first
+        self.lock = threading.Lock()
+
+    def fetch(self, tickers, start, end):
+        tickers = [tickers] if isinstance(tickers, str) else list(tickers)
+        with self.lock:
+            self.calls.append((tuple(tickers), start, end))
+            if self.fail_first > 0:
+                self.fail_first -= 1
+                raise ConnectionError("simulated outage")
+        columns = [c for c in self.prices.columns if c.split("_", 1)[0] in tickers]
+        df = self.prices.loc[:, columns]
+        return df[(df.index >= pd.Timestamp(start)) & (df.index < pd.Timestamp(end))]
+
+
+def make_cfg(tickers, **extra):
+    data = {
+        "prices_file": "prices.csv",
+        "ticker": list(tickers),
+        "start_date": "2020-01-01",
+        "end_date": "2020-02-01",
+        "download_backoff": 0.0,
+    }
+    data.update(extra)
+    return {"data": data}
+
+
+def test_load_or_update_prices_appends_partition(tmp_path, monkeypatch, caplog):
+    caplog.set_level(logging.DEBUG, logger="spy_volatility")
+    monkeypatch.setattr(loaders, "get_project_root", lambda: tmp_path)
+    prices = make_prices(periods=10)
+    store = ParquetStore(tmp_path / "prices.parquet")
+    store.write(prices.iloc[:7])
+
+    source = RecordingSource(prices)
+    monkeypatch.setattr(loaders, "resolve_source", lambda cfg: source)
+    out = loaders.load_or_update_prices(make_cfg(["SPY", "XLF"]), allow_data_update=True, show_only_adj_close=True)
+
+    assert list(out.columns) == ["SPY_Adj_Close", "XLF_Adj_Close"]
+    pd.testing.assert_frame_equal(out, prices[out.columns], check_freq=False)
+    assert len(store._parts()) == 2
+    # Both tickers share a watermark, so one request from the day after it
+    assert source.calls == [(("SPY", "XLF"), "2020-01-10", "2020-02-01")]
+
+    # Slow steps are logged with their elapsed time
+    timed = {r.getMessage(): r.fields for r in caplog.records if "elapsed" in getattr(r, "fields", {})}
+    assert {"Fetched prices", "Downloaded prices", "Appended price updates", "Loaded stored prices"} <= set(timed)
+    assert timed["Loaded stored prices"]["rows"] == 10
+
+
+def test_new_tickers_are_backfilled_alone(tmp_path, monkeypatch):
+    monkeypatch.setattr(loaders, "get_project_root", lambda: tmp_path)
+    universe = make_prices(periods=15, tickers=("AAA", "BBB", "CCC", "DDD", "EEE"))
+    store = ParquetStore(tmp_path / "prices.parquet")
+    store.write(universe.iloc[:, :6])  # AAA and BBB only, fully up to date
+
+    source = RecordingSource(universe)
+    monkeypatch.setattr(loaders, "resolve_source", lambda cfg: source)
+    cfg = make_cfg(["AAA", "BBB", "CCC", "DDD", "EEE"], download_chunk_size=2, download_workers=3)
+    out = loaders.load_or_update_prices(cfg, allow_data_update=True)
+
+    # Full history only for the new names, stored names only past their last date
+    backfill = sorted(t for tickers, start, _ in source.calls if start == "2020-01-01" for t in tickers)
+    assert backfill == ["CCC", "DDD", "EEE"]
+    assert (("AAA", "BBB"), "2020-01-22", "2020-02-01") in source.calls
+    assert max(len(tickers) for tickers, _, _ in source.calls) == 2
+    pd.testing.assert_frame_equal(out, universe, check_freq=False)
+
+
+def test_serial_source_gets_one_call_per_start_date(tmp_path, monkeypatch):
+    universe = make_prices(periods=15, tickers=("AAA", "BBB", "CCC", "DDD", "EEE"))
+    source = RecordingSource(universe)
+    source.concurrent_fetch = False
+    monkeypatch.setattr(loaders, "resolve_source", lambda cfg: source)
+
+    cfg = make_cfg(["AAA", "BBB", "CCC", "DDD", "EEE"], download_chunk_size=2, download_workers=3)
+    marks = {"AAA": universe.index[-1], "BBB": universe.index[-1], "CCC": None, "DDD": None, "EEE": None}
+    out = loaders._download_missing_prices(cfg, marks)
+
+    assert source.calls == [
+        (("CCC", "DDD", "EEE"), "2020-01-01", "2020-02-01"),
+        (("AAA", "BBB"), "2020-01-22", "2020-02-01"),
+    ]
+    assert sorted(out.columns) == sorted(universe.columns[6:])  # AAA and BBB are up to date
+
+
+def test_lagging_ticker_gets_its_own_range(tmp_path, monkeypatch):
+    monkeypatch.setattr(loaders, "get_project_root", lambda: tmp_path)
+    prices = make_prices(periods=10)
+    stale = prices.copy()
+    stale.loc[stale.index[5]:, [c for c in stale.columns if c.startswith("XLF_")]] = np.nan
+    store = ParquetStore(tmp_path / "prices.parquet")
+    store.write(stale)
+
+    marks = loaders._ticker_watermarks(store, ["SPY", "XLF", "NEW"])
+    assert marks == {"SPY": prices.index[-1], "XLF": prices.index[4], "NEW": None}
+
+    source = RecordingSource(prices)
+    monkeypatch.setattr(loaders, "resolve_source", lambda cfg: source)
+    out = loaders.load_or_update_prices(make_cfg(["SPY", "XLF"]), allow_data_update=True)
+
+    assert source.calls == [(("XLF",), "2020-01-08", "2020-02-01"), (("SPY",), "2020-01-15", "2020-02-01")]
+    pd.testing.assert_frame_equal(out, prices, check_freq=False)
+
+
+def test_read_only_load_reads_the_store_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(loaders, "get_project_root", lambda: tmp_path)
+    prices = make_prices(periods=10)
+    store = ParquetStore(tmp_path / "prices.parquet")
+    store.write(prices)
+
+    reads = []
+    original = ParquetStore.read
+    monkeypatch.setattr(ParquetStore, "read", lambda self, columns=None: reads.append(columns) or original(self, columns))
+    monkeypatch.setattr(loaders, "resolve_source", lambda cfg: pytest.fail("no download expected"))
+    out = loaders.load_or_update_prices(make_cfg(["SPY", "XLF"]), allow_data_update=False)
+    assert reads == [None]
+    pd.testing.assert_frame_equal(out, prices, check_freq=False)
+
+
+def test_download_retries_then_fails(tmp_path, monkeypatch):
+    monkeypatch.setattr(loaders, "get_project_root", lambda: tmp_path)
+    prices = make_prices(periods=5)
+
+    source = RecordingSource(prices, fail_first=2)
+    monkeypatch.setattr(loaders, "resolve_source", lambda cfg: source)
+    out = loaders.load_or_update_prices(make_cfg(["SPY"], download_retries=2), allow_data_update=False)
+    assert len(source.calls) == 3
+    assert list(out.columns) == [c for c in prices.columns if c.startswith("SPY_")]
+
+    source = RecordingSource(prices, fail_first=5)
+    monkeypatch.setattr(loaders, "resolve_source", lambda cfg: source)
+    with pytest.raises(RuntimeError):
+        loaders._download_missing_prices(make_cfg(["XLF"], download_retries=1), {"XLF": None})
+    assert len(source.calls) == 2
@@ -0,0 +1,85 @@
+import io
+import json
+import logging
+
+import pytest
+
+from spy_volatility.cli import main
+from spy_volatility.pipeline.dag import Pipeline
+from spy_volatility.utils import config
+from spy_volatility.utils.log import ROOT, configure_logging, fields, get_logger, log_timing
+
+
+@pytest.fixture
+def stream():
+    buffer = io.StringIO()
+    yield buffer
+    # Back to the library default: no output handler of ours, records propagate
+    root = logging.getLogger(ROOT)
+    for handler in list(root.handlers):
+        if getattr(handler, "_spy_volatility", False):
+            root.removeHandler(handler)
+    root.setLevel(logging.NOTSET)
+    root.propagate = True
+
+
+def test_text_format_with_fields(stream):
+    configure_logging(stream=stream)
+    log = get_logger("spy_volatility.data.loaders")
+    log.info("Saved prices", extra=fields(path="x.parquet", rows=3))
+    log.warning("Download failed")
+    log.debug("hidden at INFO")
+    assert stream.getvalue().splitlines() == [
+        "[loaders] Saved prices path=x.parquet rows=3",
+        "WARNING: [loaders] Download failed",
+    ]
+
+
+def test_json_format_and_stage_timing(stream):
+    configure_logging(fmt="json", stream=stream)
+    pipe = Pipeline("nightly")
+    pipe.add("a", lambda: 1)
+    pipe.run(max_workers=1)
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    stage = lines[0]
+    assert stage["logger"] == "spy_volatility.pipeline.dag" and stage["level"] == "INFO"
+    assert stage["pipeline"] == "nightly" and stage["stage"] == "a" and stage["elapsed"] >= 0
+    assert lines[-1]["stages"] == 1
+
+
+def test_quiet_and_reconfigure(stream):
+    log = get_logger("tests")
+    configure_logging(stream=stream)
+    configure_logging(quiet=True, stream=stream)  # replaces the first handler
+    log.info("not shown")
+    with log_timing(log, "not shown either") as extra:
+        extra["rows"] = 1
+    log.error("shown")
+    assert stream.getvalue() == "ERROR: [tests] shown\n"
+
+    with pytest.raises(ValueError):
+        configure_logging(fmt="xml")
+
+
+def test_cli_quiet_flag(stream, capsys):  # stream: removes the handler afterwards
+    main(["--quiet", "config"])
+    assert logging.getLogger(ROOT).level == logging.WARNING
+    assert "Start date:" in capsys.readouterr().out
+    main(["--log-level", "debug", "config"])
+    assert logging.getLogger(ROOT).level == logging.DEBUG
+
+
+def test_config_is_parsed_once_and_copied():
+    config.clear_config_cache()
+    first = config.load_config()
+    first["data"]["start_date"] = "1900-01-01"
+    second = config.load_config()
+    assert second["data"]["start_date"] != "1900-01-01"
+    info = config._parse_config.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+    config.clear_config_cache()
+    config.load_config()
+    assert config._parse_config.cache_info().misses == 1
+    assert config.get_project_root() is config.get_project_root()
@@ -0,0 +1,112 @@
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from spy_volatility.pipeline.dag import Pipeline
+from spy_volatility.pipeline.report import fig_var_backtest, var_backtest
+
+
+def make_pipeline(calls):
+    pipe = Pipeline("test")
+
+    @pipe.stage()
+    def prices():
+        calls.append("prices")
+        return [1.0, 2.0, 4.0]
+
+    @pipe.stage(deps=["prices"])
+    def returns(prices):
+        calls.append("returns")
+        return [b / a - 1 for a, b in zip(prices, prices[1:])]
+
+    @pipe.stage(deps=["returns"])
+    def mean(returns):
+        calls.append("mean")
+        return sum(returns) / len(returns)
+
+    @pipe.stage(deps=["returns"])
+    def peak(returns):
+        calls.append("peak")
+        return max(returns)
+
+    @pipe.stage(deps=["mean", "peak"])
+    def report(mean, peak):
+        return {"mean": mean, "peak": peak}
+
+    return pipe
+
+
+def test_order_and_shared_dependencies_run_once():
+    calls = []
+    pipe = make_pipeline(calls)
+
+    order = pipe.order(["report"])
+    assert order.index("prices") < order.index("returns") < order.index("mean") < order.index("report")
+    assert pipe.order(["returns"]) == ["prices", "returns"]
+
+    artifacts = pipe.run(targets=["report"])
+    assert artifacts["report"] == {"mean": 1.0, "peak": 1.0}
+    assert sorted(calls) == ["mean", "peak", "prices", "returns"]
+    assert set(pipe.timings) == set(order)
+
+    # Precomputed artifacts are not recomputed
+    calls.clear()
+    pipe.run(targets=["mean"], artifacts={"returns": [0.5, 1.5]})
+    assert calls == ["mean"]
+
+
+def test_unknown_stage_and_cycle():
+    pipe = Pipeline()
+    pipe.add("a", lambda b: b, deps=["b"])
+    pipe.add("b", lambda a: a, deps=["a"])
+    pipe.add("c", lambda missing: missing, deps=["missing"])
+
+    with pytest.raises(ValueError, match="cycle"):
+        pipe.order(["a"])
+    with pytest.raises(KeyError, match="missing"):
+        pipe.order(["c"])
+    with pytest.raises(ValueError, match="already defined"):
+        pipe.add("a", lambda: None)
+
+
+def test_independent_stages_run_concurrently():
+    # Both branches must be in flight at once to pass the barrier
+    barrier = threading.Barrier(2, timeout=5)
+    pipe = Pipeline()
+    pipe.add("left", lambda: barrier.wait() is not None)
+    pipe.add("right", lambda: barrier.wait() is not None)
+    pipe.add("both", lambda left, right: left and right, deps=["left", "right"])
+
+    assert pipe.run(targets=["both"], max_workers=2)["both"] is True
+
+
+def test_failure_stops_downstream_stages():
+    calls = []
+    pipe = Pipeline()
+
+    def broken():
+        raise ValueError("bad data")
+
+    pipe.add("broken", broken)
+    pipe.add("after", lambda broken: calls.append("after"), deps=["broken"])
+
+    with pytest.raises(RuntimeError, match="Stage 'broken' failed") as excinfo:
+        pipe.run(targets=["after"])
+    assert isinstance(excinfo.value.__cause__, ValueError)
+    assert calls == []
+
+
+def test_var_figure_lines_up_with_exceedances(tmp_path):
+    rng = np.random.default_rng(0)
+    index = pd.bdate_range("2020-01-01", periods=400)
+    spy_returns = pd.DataFrame({"SPY_Log_Return": 0.01 * rng.standard_t(4, 400)}, index=index)
+    spy_rv = pd.DataFrame({252: np.full(400, 0.01)}, index=index)
+    forecast = pd.Series(np.exp(rng.normal(np.log(0.01), 0.5, 400)), index=index)  # Made at t, for t+1
+
+    backtest = var_backtest(spy_returns, spy_rv, forecast)
+    plot = fig_var_backtest(spy_returns, forecast, backtest, tmp_path)[0].data
+    below = (plot["ret"] < plot["var_gauss"])[plot["var_gauss"].notna()]
+    assert below.any()
+    assert (below == (plot["exceed_gauss"].loc[below.index] == 1)).all()
@@ -0,0 +1,116 @@
+import csv
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from spy_volatility.data.features import compute_returns
+from spy_volatility.pipeline.dag import Pipeline
+from spy_volatility.risk.cov_metrics import covariance_diagnostics
+from spy_volatility.utils.profiling import (
+    configure_profiling,
+    disable_profiling,
+    enable_profiling,
+    profile_block,
+    profile_records,
+    profile_summary,
+    profiled,
+    reset_profile,
+    write_profile,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_profiler():
+    disable_profiling()
+    reset_profile()
+    yield
+    disable_profiling()
+    reset_profile()
+
+
+def make_prices(n_obs=100, n_assets=3):
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range("2020-01-01", periods=n_obs, name="Date")
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (n_obs, n_assets)), axis=0))
+    return pd.DataFrame(prices, index=dates, columns=[f"A{i}_Adj_Close" for i in range(n_assets)])
+
+
+def test_disabled_records_nothing():
+    prices = make_prices()
+    compute_returns(prices, price_col=list(prices.columns))
+    assert profile_records() == []
+    assert compute_returns.__name__ == "compute_returns"  # functools.wraps keeps the identity
+
+
+def test_records_calls_with_shapes_and_nesting():
+    enable_profiling()
+    prices = make_prices(n_obs=120, n_assets=4)
+    returns = compute_returns(prices, price_col=list(prices.columns)).dropna()
+    cov = returns[[c for c in returns.columns if c.endswith("_Log_Return")]].cov()
+    covariance_diagnostics(cov)
+
+    records = {r["name"]: r for r in profile_records()}
+    assert records["features.compute_returns"]["rows"] == 120
+    assert records["features.compute_returns"]["assets"] == 4
+    # covariance_diagnostics calls covariance_diagnostics_stack: both recorded, inner first
+    names = [r["name"] for r in profile_records()]
+    assert names[-2:] == ["cov_metrics.covariance_diagnostics_stack", "cov_metrics.covariance_diagnostics"]
+    outer, inner = records["cov_metrics.covariance_diagnostics"], records["cov_metrics.covariance_diagnostics_stack"]
+    assert outer["start"] <= inner["start"] and inner["wall"] <= outer["wall"]
+    assert all(r["cpu"] >= 0 and "peak_memory" not in r for r in records.values())
+
+
+def test_peak_memory_of_nested_blocks():
+    enable_profiling(memory=True)
+
+    @profiled(name="alloc")
+    def alloc(n):
+        return np.ones(n).sum()
+
+    with profile_block("outer", assets=2) as meta:
+        alloc(1_000_000)  # ~8 MB temporary, freed before the block ends
+        meta["rows"] = 7
+
+    records = {r["name"]: r for r in profile_records()}
+    assert records["alloc"]["peak_memory"] >= 8_000_000
+    assert records["outer"]["peak_memory"] >= records["alloc"]["peak_memory"]
+    assert records["outer"]["rows"] == 7 and records["outer"]["assets"] == 2
+
+
+def test_pipeline_stages_are_recorded():
+    enable_profiling()
+    pipe = Pipeline("nightly")
+    pipe.add("a", lambda: 1)
+    pipe.add("b", lambda a: a + 1, deps=["a"])
+    pipe.run(max_workers=1)
+    assert {r["name"] for r in profile_summary()} == {"nightly.a", "nightly.b"}
+
+
+def test_config_toggle_and_exports(tmp_path):
+    prefix = tmp_path / "profiles" / "run"
+    cfg = {"profiling": {"enabled": True, "output": str(prefix), "formats": ["json", "csv", "chrome"]}}
+    assert configure_profiling(cfg)
+
+    prices = make_prices()
+    for _ in range(3):
+        compute_returns(prices.copy(), price_col=list(prices.columns))
+    paths = write_profile(cfg)
+    assert [p.name for p in paths] == ["run.json", "run.csv", "run.trace.json"]
+
+    report = json.loads(paths[0].read_text())
+    assert report["summary"][0]["name"] == "features.compute_returns"
+    assert report["summary"][0]["calls"] == 3
+
+    with open(paths[1], newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 3 and rows[0]["rows"] == "100"
+
+    trace = json.loads(paths[2].read_text())
+    assert len(trace["traceEvents"]) == 3
+    assert all(e["ph"] == "X" and e["dur"] >= 0 for e in trace["traceEvents"])
+
+    # Disabled in the config: profiling stops and nothing is written
+    assert not configure_profiling({"profiling": {"enabled": False}})
+    assert write_profile({"profiling": {"enabled": False}}) == []
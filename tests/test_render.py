@@ -0,0 +1,94 @@
+import os
+
+import numpy as np
+import pandas as pd
+from matplotlib.collections import PolyCollection
+
+from spy_volatility.pipeline import figures
+from spy_volatility.pipeline.render import MANIFEST_NAME, FigureJob, render_figures
+
+
+def loop_intervals(mask):
+    # Reference: the row-by-row axvspan loop the plot used before
+    out, start = [], None
+    for i, flag in enumerate(mask):
+        if flag and start is None:
+            start = i
+        elif not flag and start is not None:
+            out.append((start, i))
+            start = None
+    if start is not None:
+        out.append((start, len(mask) - 1))
+    return out
+
+
+def test_regime_intervals_match_loop():
+    rng = np.random.default_rng(0)
+    for mask in [rng.integers(0, 2, 300), [1, 1, 0, 1], [0, 0, 1], [0, 0], [1]]:
+        starts, ends = figures.regime_intervals(mask)
+        assert list(zip(starts, ends)) == loop_intervals(list(mask))
+
+
+def test_vol_regimes_draws_one_collection_per_panel(tmp_path, monkeypatch):
+    dates = pd.bdate_range("2020-01-01", periods=200)
+    rv21 = pd.Series(np.abs(np.sin(np.arange(200) / 7.0)), index=dates)
+    df = pd.DataFrame({
+        "rv21": rv21,
+        "high_vol": (rv21 > 0.7).astype(int),
+        "condition_number": 100 + rv21 * 50,
+    })
+
+    captured = []
+    original = figures.shade_intervals
+
+    def spy(ax, *args, **kwargs):
+        captured.append(original(ax, *args, **kwargs))
+        return captured[-1]
+
+    monkeypatch.setattr(figures, "shade_intervals", spy)
+    figures.plot_vol_regimes(df, 0.7, tmp_path / "regimes.png")
+
+    n_regimes = len(loop_intervals(list(df["high_vol"])))
+    assert len(captured) == 2
+    assert all(isinstance(c, PolyCollection) and len(c.get_paths()) == n_regimes for c in captured)
+    assert (tmp_path / "regimes.png").exists()
+
+
+def test_render_skips_unchanged_figures(tmp_path):
+    dates = pd.bdate_range("2020-01-01", periods=50)
+    returns = pd.Series(np.linspace(-0.01, 0.01, 50), index=dates)
+
+    def jobs(data):
+        return [
+            FigureJob(figures.plot_log_returns, tmp_path / "returns.png", {"log_returns": data}),
+            FigureJob(figures.plot_realized_volatility, tmp_path / "rv.png", {"rv": data.abs()}),
+        ]
+
+    first = render_figures(jobs(returns), processes=2)
+    assert first["rendered"] == first["paths"] and (tmp_path / MANIFEST_NAME).exists()
+
+    again = render_figures(jobs(returns.copy()), processes=0)
+    assert again["rendered"] == [] and again["skipped"] == again["paths"]
+
+    # New data for one figure redraws only that figure
+    changed = returns.copy()
+    changed.iloc[-1] = -0.02
+    partial = render_figures(jobs(changed)[:1] + jobs(returns)[1:], processes=0)
+    assert partial["rendered"] == [tmp_path / "returns.png"]
+
+    # A figure replaced on disk is redrawn even if the data is the same
+    os.utime(tmp_path / "rv.png", ns=(0, 0))
+    assert render_figures(jobs(changed), processes=0)["rendered"] == [tmp_path / "rv.png"]
+    assert render_figures(jobs(changed), processes=0, force=True)["rendered"] == first["paths"]
+
+
+def test_render_falls_back_to_spawn_without_forkserver(tmp_path, monkeypatch):
+    import multiprocessing
+
+    monkeypatch.setattr(multiprocessing, "get_all_start_methods", lambda: ["spawn"])
+    returns = pd.Series(np.linspace(-0.01, 0.01, 50), index=pd.bdate_range("2020-01-01", periods=50))
+    jobs = [
+        FigureJob(figures.plot_log_returns, tmp_path / "returns.png", {"log_returns": returns}),
+        FigureJob(figures.plot_realized_volatility, tmp_path / "rv.png", {"rv": returns.abs()}),
+    ]
+    assert render_figures(jobs, processes=2)["rendered"] == [tmp_path / "returns.png", tmp_path / "rv.png"]
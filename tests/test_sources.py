@@ -0,0 +1,136 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from spy_volatility.data import loaders
+from spy_volatility.data.sources import (
+    PRICE_FIELDS,
+    LocalCSVSource,
+    PriceSource,
+    SyntheticGARCHSource,
+    YFinanceSource,
+    resolve_source,
+    synthetic_tickers,
+)
+
+
+def test_synthetic_layout_and_determinism():
+    source = SyntheticGARCHSource(seed=3, origin="2015-01-01")
+    tickers = synthetic_tickers(3)
+    prices = source.fetch(tickers, "2016-01-01", "2017-01-01")
+
+    assert prices.index.name == "Date"
+    assert prices.index.min() >= pd.Timestamp("2016-01-01")
+    assert prices.index.max() < pd.Timestamp("2017-01-01")
+    assert list(prices.columns) == [f"{t}_{f}" for t in tickers for f in PRICE_FIELDS]
+    assert np.isfinite(prices.to_numpy()).all()
+
+    for t in tickers:
+        assert (prices[f"{t}_High"] >= prices[[f"{t}_Open", f"{t}_Close"]].max(axis=1)).all()
+        assert (prices[f"{t}_Low"] <= prices[[f"{t}_Open", f"{t}_Close"]].min(axis=1)).all()
+
+    again = SyntheticGARCHSource(seed=3, origin="2015-01-01").fetch(tickers, "2016-01-01", "2017-01-01")
+    pd.testing.assert_frame_equal(prices, again)
+
+
+def test_synthetic_incremental_fetch_resumes_from_state(monkeypatch):
+    full = SyntheticGARCHSource(seed=3, origin="2015-01-01").fetch(["AAA", "BBB"], "2015-01-01", "2021-01-01")
+
+    source = SyntheticGARCHSource(seed=3, origin="2015-01-01")
+    head = source.fetch(["AAA"], "2015-01-01", "2020-06-01")
+    simulated = []
+    innovations = source._innovations
+    monkeypatch.setattr(source, "_innovations", lambda t, d: simulated.append((list(t), len(d))) or innovations(t, d))
+    tail = source.fetch(["AAA", "BBB"], "2020-06-01", "2021-01-01")
+
+    # AAA only simulates the new days, BBB (never fetched) starts at origin
+    n_new = len(pd.bdate_range("2020-06-01", "2020-12-31"))
+    assert sorted(simulated) == [(["AAA"], n_new), (["BBB"], len(full))]
+    pd.testing.assert_frame_equal(pd.concat([head, tail.filter(like="AAA_")]), full.filter(like="AAA_"), check_exact=True)
+    pd.testing.assert_frame_equal(tail, full.loc["2020-06-01":], check_exact=True)
+
+
+def test_synthetic_range_and_universe_independent():
+    source = SyntheticGARCHSource(seed=1, origin="2010-01-01")
+    full = source.fetch(["AAA", "BBB"], "2010-01-01", "2013-01-01")
+
+    # Incremental update matches the full download
+    update = source.fetch(["AAA", "BBB"], "2012-06-01", "2013-01-01")
+    pd.testing.assert_frame_equal(update, full.loc["2012-06-01":], check_freq=False)
+
+    # A ticker's path does not depend on the other tickers requested
+    alone = source.fetch(["BBB"], "2010-01-01", "2013-01-01")
+    pd.testing.assert_frame_equal(alone, full[alone.columns])
+
+
+def test_synthetic_volatility_matches_parameters():
+    source = SyntheticGARCHSource(seed=0, origin="1990-01-01")
+    prices = source.fetch(["VOL"], None, "2020-01-01")
+    returns = np.log(prices["VOL_Adj_Close"]).diff().dropna()
+
+    params = source.ticker_params("VOL")
+    target = np.sqrt(params["unconditional_variance"])
+    assert abs(returns.std() / target - 1.0) < 0.15
+
+
+def test_local_source_directory_and_wide_file(tmp_path):
+    dates = pd.bdate_range("2021-01-01", periods=6, name="Date")
+    for t in ("AAA", "BBB"):
+        pd.DataFrame(
+            {"Open": 1.0, "Close": 2.0, "Adj Close": np.arange(6.0)}, index=dates
+        ).to_csv(tmp_path / f"{t}.csv")
+
+    source = LocalCSVSource(tmp_path)
+    prices = source.fetch(["AAA", "BBB", "MISSING"], "2021-01-04", "2021-01-08")
+    assert list(prices.columns) == [
+        "AAA_Open", "AAA_Close", "AAA_Adj_Close", "BBB_Open", "BBB_Close", "BBB_Adj_Close",
+    ]
+    assert list(prices.index) == list(pd.bdate_range("2021-01-04", "2021-01-07"))
+
+    wide = tmp_path / "wide.csv"
+    prices.to_csv(wide)
+    only_b = LocalCSVSource(wide).fetch("BBB", None, None)
+    pd.testing.assert_frame_equal(only_b, prices.filter(like="BBB_"), check_freq=False)
+
+    # Tickers containing "_" and columns that are not price fields
+    odd = prices.filter(like="AAA_").rename(columns=lambda c: c.replace("AAA", "BRK_B"))
+    odd["BRK_Notes"] = 0.0
+    odd["BRK_B_Comment"] = 0.0
+    odd.to_csv(wide)
+    assert list(LocalCSVSource(wide).fetch("BRK_B", None, None).columns) == [
+        "BRK_B_Open", "BRK_B_Close", "BRK_B_Adj_Close",
+    ]
+    assert LocalCSVSource(wide).fetch("BRK", None, None).empty
+
+    with pytest.raises(FileNotFoundError):
+        LocalCSVSource(tmp_path / "nope")
+
+
+def test_resolve_source_and_loader_offline(tmp_path, monkeypatch):
+    assert isinstance(resolve_source({"data": {}}), YFinanceSource)
+    source = resolve_source({"data": {"source": {"name": "synthetic", "seed": 5}}})
+    assert isinstance(source, SyntheticGARCHSource) and source.seed == 5
+    with pytest.raises(ValueError):
+        resolve_source({"data": {"source": "bloomberg"}})
+
+    monkeypatch.setattr(loaders, "get_project_root", lambda: tmp_path)
+    cfg = {
+        "data": {
+            "prices_file": "prices.csv",
+            "ticker": ["AAA", "BBB"],
+            "source": {"name": "synthetic", "seed": 2},
+            "start_date": "2020-01-01",
+            "end_date": "2020-07-01",
+        }
+    }
+    prices = loaders.load_or_update_prices(cfg, allow_data_update=True, show_only_adj_close=True)
+    assert list(prices.columns) == ["AAA_Adj_Close", "BBB_Adj_Close"]
+    assert prices.index.max() < pd.Timestamp("2020-07-01")
+
+
+def test_source_without_fetch_fails_on_construction():
+    class NoFetch(PriceSource):
+        pass
+
+    with pytest.raises(TypeError, match="fetch"):
+        NoFetch()
@@ -101,3 +101,102 @@ if not try_cholesky(near_singular):
 
 
 print("\n================ DONE ================\n")
+
+
+# ================ BATCHED STACK VERSIONS ================
+
+from spy_volatility.risk.spd import (
+    cholesky_mask,
+    add_jitter_stack,
+    clip_eigenvalues_stack,
+    regularize_stack,
+)
+
+
+def make_stack():
+    return np.stack([
+        spd_simple.to_numpy(),
+        singular.to_numpy(),
+        indefinite.to_numpy(),
+        needs_clip.to_numpy(),
+        np.full((2, 2), np.nan),
+    ])
+
+
+def test_cholesky_mask_matches_try_cholesky():
+    stack = make_stack()
+    expected = [try_cholesky(pd.DataFrame(A)) for A in stack]
+    assert cholesky_mask(stack).tolist() == expected
+
+
+def test_cholesky_mask_mostly_failing_stack(monkeypatch):
+    rng = np.random.default_rng(1)
+    x = rng.standard_normal((300, 5, 4))
+    stack = x.transpose(0, 2, 1) @ x
+    stack[rng.random(300) < 0.8] = np.ones((4, 4))  # Mostly singular, as raw windows with N near the window length
+    expected = [try_cholesky(pd.DataFrame(A)) for A in stack]
+
+    calls = []
+    cholesky = np.linalg.cholesky
+    monkeypatch.setattr(np.linalg, "cholesky", lambda a: calls.append(len(a) if a.ndim == 3 else 1) or cholesky(a))
+    assert cholesky_mask(stack).tolist() == expected
+    assert sum(calls) <= 3 * len(stack)  # Matrices factorized, not ~2T log T as with bisection
+
+
+def test_stack_regularizers_match_single_matrix_versions():
+    stack = make_stack()[:4]
+    jit = add_jitter_stack(stack, lam)
+    clip = clip_eigenvalues_stack(stack, eps=1e-6)
+
+    for i, A in enumerate(stack):
+        np.testing.assert_allclose(jit[i], add_jitter(pd.DataFrame(A), lam).to_numpy())
+        np.testing.assert_allclose(clip[i], clip_eigenvalues(pd.DataFrame(A), eps=1e-6).to_numpy(), atol=1e-12)
+
+    inplace = stack.copy()
+    assert add_jitter_stack(inplace, lam, inplace=True) is inplace
+
+
+def test_symmetry_tolerance_is_relative():
+    # Daily-return scale: asymmetry far below 1e-5 in absolute terms, but 1e-3 relative
+    cov = np.array([[2e-4, 1.0e-4], [1.001e-4, 3e-4]])
+    expected = (cov + cov.T) / 2
+    np.testing.assert_array_equal(add_jitter(pd.DataFrame(cov), 0.0).to_numpy(), expected)
+    np.testing.assert_array_equal(add_jitter_stack(cov[None], 0.0)[0], expected)
+
+    # Within the relative tolerance: left as is
+    close = np.array([[2.0, 1.0], [1.000001, 3.0]])
+    np.testing.assert_array_equal(add_jitter(pd.DataFrame(close), 0.0).to_numpy(), close)
+
+
+def test_regularize_stack_shares_diagnostics():
+    stack = make_stack()[:4]
+    out = regularize_stack(stack, lam=1e-6, eps=1e-6)
+    diag = out["diagnostics"]
+
+    np.testing.assert_allclose(out["jitter"], add_jitter_stack(stack, 1e-6))
+    np.testing.assert_allclose(out["clip"], clip_eigenvalues_stack(stack, 1e-6), atol=1e-12)
+    np.testing.assert_allclose(diag["jit_min_eig"], np.linalg.eigvalsh(out["jitter"])[:, 0], atol=1e-12)
+    assert diag["raw_chol_ok"].tolist() == [True, False, False, False]
+    assert diag["clip_chol_ok"].all()
+    assert (diag["clip_min_eig"] >= 1e-6).all()
+
+
+def test_regularize_stack_in_place_and_feasibility_from_eigenvalues():
+    rng = np.random.default_rng(2)
+    x = rng.standard_normal((60, 3, 4))
+    stack = x.transpose(0, 2, 1) @ x  # Rank 3 of 4: singular
+    stack[::3] += np.eye(4)  # Positive definite
+    stack[1::6, 0, 0] = -1.0  # Indefinite
+    expected = regularize_stack(stack, lam=1e-6, eps=1e-6)
+
+    work, clip = stack.copy(), np.empty_like(stack)
+    out = regularize_stack(work, lam=1e-6, eps=1e-6, inplace=True, clip_out=clip)
+    assert out["jitter"] is work and out["clip"] is clip
+    np.testing.assert_array_equal(work, expected["jitter"])
+    np.testing.assert_array_equal(clip, expected["clip"])
+
+    diag = out["diagnostics"]
+    assert diag["raw_chol_ok"].tolist() == cholesky_mask(stack).tolist()
+    assert diag["raw_chol_ok"].any() and not diag["raw_chol_ok"].all()
+    assert diag["jit_chol_ok"].tolist() == cholesky_mask(out["jitter"]).tolist()
+    assert diag["clip_chol_ok"].tolist() == cholesky_mask(out["clip"]).tolist()
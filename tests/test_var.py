@@ -0,0 +1,149 @@
+import numpy as np
+import pandas as pd
+import pytest
+from spy_volatility.models.var import (
+    LRuc,
+    backtest_var,
+    fit_var,
+    gaussian_var,
+    rolling_var_rls,
+    select_var_order,
+    student_t_var,
+)
+
+
+def test_backtest_var_matches_per_date_loop():
+    rng = np.random.default_rng(3)
+    index = pd.bdate_range("2018-01-01", periods=400)
+    returns = pd.Series(0.01 * rng.standard_t(5, size=400), index=index)
+    sigma = pd.DataFrame({
+        "flat": np.full(400, 0.01),
+        "noisy": 0.01 * np.exp(0.3 * rng.standard_normal(400)),
+    }, index=index)
+    sigma.iloc[:20] = np.nan  # Burn-in without forecasts
+
+    out = backtest_var(returns, sigma, alphas=(0.01, 0.05), dists={"gauss": None, "t": 8})
+    exceed, kupiec = out["exceedances"], out["kupiec"]
+
+    for model in sigma.columns:
+        for alpha in (0.01, 0.05):
+            gauss = [
+                int(returns.iloc[i + 1] < gaussian_var(0, sigma[model].iloc[i], 1 - alpha))
+                for i in range(20, 399)
+            ]
+            t = [
+                int(returns.iloc[i + 1] < student_t_var(0, sigma[model].iloc[i], 8, 1 - alpha))
+                for i in range(20, 399)
+            ]
+            assert exceed[(model, "gauss", alpha)].iloc[21:].tolist() == gauss
+            assert exceed[(model, "t", alpha)].iloc[21:].tolist() == t
+            assert exceed[(model, "gauss", alpha)].iloc[:21].isna().all()
+
+            row = kupiec[(kupiec["model"] == model) & (kupiec["distribution"] == "gauss") & (kupiec["alpha"] == alpha)]
+            assert row["observations"].item() == 379
+            assert row["exceedances"].item() == sum(gauss)
+            assert row["LRuc p-value"].item() == pytest.approx(LRuc(alpha, sum(gauss), 379)[1])
+
+
+def make_returns(n_obs=400, n_assets=3):
+    rng = np.random.default_rng(7)
+    index = pd.bdate_range("2018-01-01", periods=n_obs)
+    y = np.zeros((n_obs, n_assets))
+    for t in range(1, n_obs):
+        y[t] = 0.3 * y[t - 1] + 0.01 * rng.standard_normal(n_assets)
+    return pd.DataFrame(y, index=index, columns=[f"A{i}_Log_Return" for i in range(n_assets)])
+
+
+@pytest.mark.parametrize("p, window", [(1, None), (2, 60)])
+def test_rolling_var_rls_matches_statsmodels_refits(p, window):
+    from statsmodels.tsa.api import VAR
+
+    returns = make_returns()
+    out = rolling_var_rls(returns, p=p, window=window, refresh=50)
+    y = returns.rename(columns=lambda c: c.replace("_Log_Return", ""))
+    assert out["coefs"].shape == (len(out["dates"]), p, 3, 3)
+
+    for i in [0, 45, 51, len(out["dates"]) - 1]:  # 51: right after an exact refresh
+        end = y.index.get_loc(out["dates"][i])
+        start = 0 if window is None else end - window - p + 1
+        ref = VAR(y.iloc[start:end + 1]).fit(p)
+        np.testing.assert_allclose(out["coefs"][i], ref.coefs, atol=1e-10)
+        np.testing.assert_allclose(out["intercepts"][i], ref.intercept, atol=1e-12)
+        np.testing.assert_allclose(out["innovation_cov"].matrix(i), ref.sigma_u.values, atol=1e-14)
+
+    # A-priori errors: forecast with the estimate of the previous day
+    t = 100
+    i = out["dates"].get_loc(out["forecast_errors"].index[t]) - 1
+    lagged = y.iloc[t + p - 1::-1].iloc[:p].to_numpy()
+    forecast = out["intercepts"][i] + sum(out["coefs"][i, j] @ lagged[j] for j in range(p))
+    np.testing.assert_allclose(out["forecast_errors"].iloc[t], y.iloc[t + p] - forecast, atol=1e-12)
+
+
+def test_rolling_var_rls_forgetting_matches_weighted_least_squares():
+    returns = make_returns()
+    out = rolling_var_rls(returns, forgetting=0.97)
+    y = returns.to_numpy()
+    X = np.column_stack([np.ones(len(y) - 1), y[:-1]])
+    w = 0.97 ** np.arange(len(X) - 1, -1, -1)
+    B = np.linalg.solve((X * w[:, None]).T @ X, (X * w[:, None]).T @ y[1:])
+    np.testing.assert_allclose(out["coefs"][-1, 0], B[1:].T, atol=1e-10)
+
+    # Pure Python fallback (no numba) gives the same estimates
+    from spy_volatility.models import var
+
+    kernel = var._rls_var_kernel
+    var._rls_var_kernel = kernel.py_func
+    try:
+        slow = rolling_var_rls(returns, forgetting=0.97)
+    finally:
+        var._rls_var_kernel = kernel
+    np.testing.assert_allclose(slow["coefs"], out["coefs"], atol=1e-12)
+
+    with pytest.raises(ValueError):
+        rolling_var_rls(returns, forgetting=0.5)  # ~2 effective rows for 4 regressors
+
+
+@pytest.mark.parametrize("method", ["normal", "qr"])
+def test_fit_var_matches_statsmodels(method):
+    from statsmodels.tsa.api import VAR
+
+    returns = make_returns(n_assets=4)
+    returns.iloc[0] = np.nan  # First return row of compute_returns
+    ref = VAR(returns.dropna().rename(columns=lambda c: c.replace("_Log_Return", ""))).fit(2)
+
+    lean = fit_var(returns, p=2, method=method)
+    assert "aic" not in lean and lean["residuals"].shape == (397, 4)
+    np.testing.assert_allclose(lean["coefs"], ref.coefs, atol=1e-12)
+    np.testing.assert_allclose(lean["intercept"], ref.intercept, atol=1e-14)
+    np.testing.assert_allclose(lean["residuals"], ref.resid.to_numpy(), atol=1e-14)
+    np.testing.assert_allclose(lean["innovation_cov"], ref.sigma_u.to_numpy(), rtol=1e-10)
+    assert list(lean["assets"]) == list(ref.names)
+
+    full = fit_var(returns, p=2, full_stats=True, method=method)
+    np.testing.assert_allclose(full["stderr"], ref.stderr.to_numpy(), rtol=1e-8)
+    np.testing.assert_allclose(full["tvalues"], ref.tvalues.to_numpy(), rtol=1e-8)
+    for key in ["llf", "aic", "bic", "hqic", "fpe"]:
+        assert full[key] == pytest.approx(getattr(ref, key), rel=1e-10)
+
+
+def test_fit_var_rejects_interior_gaps():
+    returns = make_returns(n_assets=3)
+    returns.iloc[:2] = np.nan  # Leading rows are trimmed
+    assert fit_var(returns, p=1)["residuals"].shape == (397, 3)
+
+    returns.iloc[200, 1] = np.nan
+    with pytest.raises(ValueError, match="NaN"):
+        fit_var(returns, p=1)
+    with pytest.raises(ValueError, match="NaN"):
+        rolling_var_rls(returns, p=1, window=100)
+
+
+def test_select_var_order_matches_statsmodels():
+    from statsmodels.tsa.api import VAR
+
+    returns = make_returns(n_assets=3)
+    ref = VAR(returns).select_order(maxlags=4, trend="c")
+    out = select_var_order(returns, maxlags=4, ic="bic")
+    for ic in ["aic", "bic", "hqic", "fpe"]:
+        np.testing.assert_allclose(out["criteria"][ic].to_numpy(), ref.ics[ic][1:], rtol=1e-10)
+    assert out["selected"] == 1  # Simulated VAR(1)